@@ -19,7 +19,9 @@ if config.config_file_name is not None:
 
 
 
-config.set_main_option("sqlalchemy.url", settings.database_url + "?async_fallback=True")
+# `alembic -x db=test ...` migrates the test database instead.
+database_url = settings.test_database_url if context.get_x_argument(as_dictionary=True).get("db") == "test" else settings.database_url
+config.set_main_option("sqlalchemy.url", database_url + "?async_fallback=True")
 target_metadata = Base.metadata
 
 
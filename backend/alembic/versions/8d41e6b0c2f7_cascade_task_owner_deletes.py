@@ -0,0 +1,30 @@
+"""Cascade task deletes from their owner
+
+Revision ID: 8d41e6b0c2f7
+Revises: 3f9c2d7a1b84
+Create Date: 2026-10-17 12:03:18.274906
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d41e6b0c2f7'
+down_revision: Union[str, Sequence[str], None] = '3f9c2d7a1b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('tasks_owner_id_fkey', 'tasks', type_='foreignkey')
+    op.create_foreign_key('tasks_owner_id_fkey', 'tasks', 'users', ['owner_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('tasks_owner_id_fkey', 'tasks', type_='foreignkey')
+    op.create_foreign_key('tasks_owner_id_fkey', 'tasks', 'users', ['owner_id'], ['id'])
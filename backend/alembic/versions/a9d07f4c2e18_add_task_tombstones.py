@@ -0,0 +1,38 @@
+"""Add task tombstones and tasks owner/updated_at index
+
+Revision ID: a9d07f4c2e18
+Revises: f15c3b8e7a92
+Create Date: 2026-10-17 15:02:47.193826
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d07f4c2e18'
+down_revision: Union[str, Sequence[str], None] = 'f15c3b8e7a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_owner_id_updated_at_id', 'tasks', ['owner_id', 'updated_at', 'id'], unique=False)
+    op.create_table('task_tombstones',
+    sa.Column('task_id', sa.Integer(), autoincrement=False, nullable=False),
+    sa.Column('owner_id', sa.Integer(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('task_id')
+    )
+    op.create_index('ix_task_tombstones_owner_id_deleted_at_task_id', 'task_tombstones', ['owner_id', 'deleted_at', 'task_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_tombstones_owner_id_deleted_at_task_id', table_name='task_tombstones')
+    op.drop_table('task_tombstones')
+    op.drop_index('ix_tasks_owner_id_updated_at_id', table_name='tasks')
@@ -0,0 +1,28 @@
+"""Add task tombstones deleted_at index
+
+Revision ID: b3e81f5d9c46
+Revises: a9d07f4c2e18
+Create Date: 2026-10-17 18:26:09.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3e81f5d9c46'
+down_revision: Union[str, Sequence[str], None] = 'a9d07f4c2e18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_task_tombstones_deleted_at', 'task_tombstones', ['deleted_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_task_tombstones_deleted_at', table_name='task_tombstones')
@@ -0,0 +1,28 @@
+"""Add tasks owner/id index
+
+Revision ID: c7a2e59f13d0
+Revises: 8d41e6b0c2f7
+Create Date: 2026-10-17 12:48:06.915342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7a2e59f13d0'
+down_revision: Union[str, Sequence[str], None] = '8d41e6b0c2f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_tasks_owner_id_id', 'tasks', ['owner_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_owner_id_id', table_name='tasks')
@@ -0,0 +1,42 @@
+"""Add tasks full-text search vector
+
+Revision ID: e4b9a1c6d253
+Revises: c7a2e59f13d0
+Create Date: 2026-10-17 13:37:52.608417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9a1c6d253'
+down_revision: Union[str, Sequence[str], None] = 'c7a2e59f13d0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # btree_gin lets the GIN index lead with the scalar owner_id column.
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.add_column('tasks', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        nullable=False,
+    ))
+    op.create_index('ix_tasks_owner_id_search_vector', 'tasks', ['owner_id', 'search_vector'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_owner_id_search_vector', table_name='tasks', postgresql_using='gin')
+    op.drop_column('tasks', 'search_vector')
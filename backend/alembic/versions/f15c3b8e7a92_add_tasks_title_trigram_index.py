@@ -0,0 +1,32 @@
+"""Add tasks owner/title trigram index
+
+Revision ID: f15c3b8e7a92
+Revises: e4b9a1c6d253
+Create Date: 2026-10-17 14:21:33.740159
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f15c3b8e7a92'
+down_revision: Union[str, Sequence[str], None] = 'e4b9a1c6d253'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_tasks_owner_id_title_trgm', 'tasks', ['owner_id', 'title'], unique=False,
+        postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tasks_owner_id_title_trgm', table_name='tasks', postgresql_using='gin')
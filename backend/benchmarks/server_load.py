@@ -0,0 +1,88 @@
+"""
+Closed-loop HTTP load generator for comparing server configurations.
+
+Keeps `--concurrency` requests in flight against a running server for
+`--duration` seconds, spread over `--processes` client processes so that the
+generator itself is not the bottleneck, and reports throughput, latency
+percentiles and failed requests (503s from `--limit-concurrency` included).
+Run the server and the generator on separate machines, or pin them to
+separate CPUs, and compare one worker with N workers on the same hardware:
+
+    python -m src.server --workers 1
+    python -m benchmarks.server_load --url http://server:8000/api/tasks --token "$TOKEN" --concurrency 256
+    python -m src.server --workers 8
+    python -m benchmarks.server_load --url http://server:8000/api/tasks --token "$TOKEN" --concurrency 256
+"""
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import time
+from typing import Optional
+
+import httpx
+
+
+async def load(url: str, token: Optional[str], concurrency: int, duration: float) -> tuple[list[float], int]:
+    cookies = {"users_access_token": token} if token else {}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    latencies: list[float] = []
+    failed = 0
+
+    async with httpx.AsyncClient(cookies=cookies, limits=limits, timeout=30) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker() -> None:
+            nonlocal failed
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(url)
+                    await response.aread()
+                except httpx.HTTPError:
+                    failed += 1
+                    continue
+                if response.is_success:
+                    latencies.append(time.perf_counter() - started)
+                else:
+                    failed += 1
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, failed
+
+
+def run_process(args: tuple[str, Optional[str], int, float]) -> tuple[list[float], int]:
+    return asyncio.run(load(*args))
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", required=True)
+    parser.add_argument("--token", help="access token, sent as the users_access_token cookie")
+    parser.add_argument("--concurrency", type=int, default=64, help="requests in flight across all processes")
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--processes", type=int, default=multiprocessing.cpu_count())
+    args = parser.parse_args()
+
+    processes = max(1, min(args.processes, args.concurrency))
+    shares = [args.concurrency // processes + (index < args.concurrency % processes) for index in range(processes)]
+    with multiprocessing.Pool(processes) as pool:
+        results = pool.map(run_process, [(args.url, args.token, share, args.duration) for share in shares])
+
+    latencies = sorted(latency for process_latencies, _ in results for latency in process_latencies)
+    failed = sum(process_failed for _, process_failed in results)
+    print(f"concurrency:           {args.concurrency} ({processes} client processes)")
+    print(f"throughput:            {len(latencies) / args.duration:.1f} requests/s")
+    print(f"failed requests:       {failed}")
+    if latencies:
+        print(f"latency p50:           {statistics.median(latencies) * 1000:.2f} ms")
+        print(f"latency p95:           {percentile(latencies, 0.95) * 1000:.2f} ms")
+        print(f"latency p99:           {percentile(latencies, 0.99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark of task creation against the configured PostgreSQL database.
+
+Reports the latency of `create_task` together with the number of pooled
+connection checkouts per call and the peak number of connections held at
+once. Run it from the `backend` directory, on this revision and on the
+previous one, to compare the two:
+
+    python -m benchmarks.task_create --owner-id 1 --requests 2000 --concurrency 50
+
+With `--as-request` each call also loads the owner first, as `get_current_user`
+does, and on revisions supporting it both units of work share one session,
+as they do within an HTTP request.
+"""
+import argparse
+import asyncio
+import inspect
+import statistics
+import time
+
+from sqlalchemy import event
+
+from src.db.engine import async_engine, async_session_maker
+from src.tasks.domain.dtos import TaskCreateDTO
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.use_cases.task_create import create_task
+from src.users.infrastructure.db.unit_of_work import PGUserUnitOfWork
+
+
+# Older revisions take a separate user unit of work for the owner lookup.
+NEEDS_USER_UOW = "user_uow" in inspect.signature(create_task).parameters
+# Newer revisions let units of work share a request-scoped session.
+SHARES_SESSION = "session" in inspect.signature(PGTaskUnitOfWork).parameters
+
+
+class PoolCounter:
+    """Track pooled connection checkouts through SQLAlchemy pool events."""
+
+    def __init__(self, pool) -> None:
+        self.checkouts = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+        event.listen(pool, "checkout", self._on_checkout)
+        event.listen(pool, "checkin", self._on_checkin)
+
+    def _on_checkout(self, *args) -> None:
+        self.checkouts += 1
+        self.in_use += 1
+        self.peak_in_use = max(self.peak_in_use, self.in_use)
+
+    def _on_checkin(self, *args) -> None:
+        self.in_use -= 1
+
+
+async def run(owner_id: int, requests: int, concurrency: int, as_request: bool) -> None:
+    counter = PoolCounter(async_engine.sync_engine.pool)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            if as_request and SHARES_SESSION:
+                async with async_session_maker() as session:
+                    await one_request(index, PGUserUnitOfWork(read_only=True, session=session), PGTaskUnitOfWork(session=session))
+            elif as_request:
+                await one_request(index, PGUserUnitOfWork(), PGTaskUnitOfWork())
+            else:
+                await create(index, PGTaskUnitOfWork())
+            latencies.append(time.perf_counter() - started)
+
+    async def one_request(index: int, user_uow, task_uow) -> None:
+        async with user_uow:
+            await user_uow.users.get_by_pk(owner_id)
+        await create(index, task_uow)
+
+    async def create(index: int, task_uow) -> None:
+        extra = {"user_uow": PGUserUnitOfWork()} if NEEDS_USER_UOW else {}
+        await create_task(
+            owner_id=owner_id,
+            task_data=TaskCreateDTO(title=f"bench task {index}"),
+            uow=task_uow,
+            **extra,
+        )
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+
+    latencies.sort()
+    print(f"requests:              {requests} (concurrency {concurrency})")
+    print(f"throughput:            {requests / elapsed:.1f} creates/s")
+    print(f"latency p50:           {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"latency p95:           {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f} ms")
+    print(f"checkouts per create:  {counter.checkouts / requests:.2f}")
+    print(f"peak connections held: {counter.peak_in_use}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--owner-id", type=int, required=True, help="ID of an existing user owning the tasks")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--as-request", action="store_true", help="load the owner first, as an HTTP request does")
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.requests, args.concurrency, args.as_request))
+
+
+if __name__ == "__main__":
+    main()
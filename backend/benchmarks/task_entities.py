@@ -0,0 +1,73 @@
+"""
+Benchmark of building and reading task entities in bulk, without a database.
+
+Builds `--count` `Task` entities, as listing, export and cache reads do for
+every row, and reports the time taken, the memory they hold and the time to
+read their fields back through `Task.dict`. The same is measured for a copy of
+`Task` declared as a plain, unslotted dataclass, which is how entities were
+declared before they became slotted. Run it from the `backend` directory:
+
+    python -m benchmarks.task_entities --count 1000000
+"""
+import argparse
+import dataclasses
+import datetime
+import gc
+import time
+import tracemalloc
+
+from src.tasks.domain.entities import Task
+
+
+def unslotted(cls: type) -> type:
+    return dataclasses.make_dataclass(
+        f"Unslotted{cls.__name__}",
+        [(field.name, field.type, dataclasses.field(default=field.default, default_factory=field.default_factory)) for field in dataclasses.fields(cls)],
+        namespace={"dict": property(lambda self: self.__dict__)},
+    )
+
+
+def build(cls: type, count: int, now: datetime.datetime) -> list:
+    return [
+        cls(id=index, title=f"task {index}", owner_id=1, description=None, status="pending", created_at=now, updated_at=now)
+        for index in range(count)
+    ]
+
+
+def measure(cls: type, count: int) -> None:
+    now = datetime.datetime.now()
+    gc.collect()
+
+    started = time.perf_counter()
+    tasks = build(cls, count, now)
+    built = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for task in tasks:
+        task.dict
+    read = time.perf_counter() - started
+    del tasks
+    gc.collect()
+
+    tracemalloc.start()
+    tasks = build(cls, count, now)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tasks
+
+    print(f"{cls.__name__}:")
+    print(f"  build:               {count / built:,.0f} tasks/s")
+    print(f"  read .dict:          {count / read:,.0f} tasks/s")
+    print(f"  memory held:         {held / 2 ** 20:.1f} MiB ({held / count:.0f} bytes per task)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    args = parser.parse_args()
+    measure(unslotted(Task), args.count)
+    measure(Task, args.count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of bulk task import against the configured PostgreSQL database.
+
+Streams a generated NDJSON or CSV file through `import_tasks`, the way the
+`POST /api/tasks/import` endpoint does, and reports rows per second. Run it
+from the `backend` directory:
+
+    python -m benchmarks.task_import --owner-id 1 --rows 100000 --format csv
+
+With `--dry-run` the staged rows are discarded instead of copied, which
+measures parsing and validation alone, the ceiling of the end-to-end rate;
+no database is needed then.
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from src.db.engine import get_async_engine
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.use_cases.task_import import import_tasks
+
+
+class DiscardingTaskRepo:
+    """Stands in for the task repository in dry runs: counts staged rows and drops them."""
+
+    def __init__(self):
+        self.staged = 0
+
+    async def stage_many(self, tasks):
+        self.staged += len(tasks)
+
+    async def merge_staged(self):
+        merged, self.staged = self.staged, 0
+        return merged
+
+
+class DiscardingTaskUnitOfWork(ITaskUnitOfWork):
+    """Unit of work of dry runs, without a database."""
+
+    def __init__(self):
+        self.tasks = DiscardingTaskRepo()
+
+    async def _commit(self):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+async def generate(rows: int, format: str, chunk_rows: int = 1000):
+    """Yield the file in chunks of `chunk_rows` rows, as a streamed request body arrives."""
+    if format == "csv":
+        yield b"title,description\r\n"
+    for start in range(0, rows, chunk_rows):
+        indexes = range(start, min(start + chunk_rows, rows))
+        if format == "csv":
+            yield "".join(f"imported task {i},description of task {i}\r\n" for i in indexes).encode()
+        else:
+            yield "".join(
+                json.dumps({"title": f"imported task {i}", "description": f"description of task {i}"}) + "\n"
+                for i in indexes
+            ).encode()
+
+
+async def run(owner_id: int, rows: int, format: str, dry_run: bool) -> None:
+    uow = DiscardingTaskUnitOfWork() if dry_run else PGTaskUnitOfWork()
+    started = time.perf_counter()
+    report = await import_tasks(owner_id=owner_id, chunks=generate(rows, format), uow=uow, format=format)
+    elapsed = time.perf_counter() - started
+    if not dry_run:
+        await get_async_engine().dispose()
+
+    print(f"rows:       {rows} ({format})")
+    print(f"imported:   {report.imported} (failed {report.failed})")
+    print(f"elapsed:    {elapsed:.2f} s")
+    print(f"throughput: {rows / elapsed:.0f} rows/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--owner-id", type=int, required=True, help="ID of an existing user owning the tasks")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--format", choices=["ndjson", "csv"], default="ndjson")
+    parser.add_argument("--dry-run", action="store_true", help="discard staged rows instead of copying them")
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.rows, args.format, args.dry_run))
+
+
+if __name__ == "__main__":
+    main()
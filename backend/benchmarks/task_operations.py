@@ -0,0 +1,66 @@
+"""
+Benchmark of task updates applied one by one versus coalesced into batches.
+
+Toggles the status of existing tasks, first with one `update_task` call and
+transaction per operation, as separate PATCH requests do, then with
+`apply_task_operations`, as the operations WebSocket does with operations
+arriving together. Batches are cut at repeated task IDs, so pass at least
+`--batch` task IDs to measure full batches. Run it from the `backend` directory:
+
+    python -m benchmarks.task_operations --owner-id 1 --task-ids 1 2 3 --operations 5000 --batch 50
+"""
+import argparse
+import asyncio
+import itertools
+import time
+
+from src.db.engine import async_engine
+from src.tasks.domain.dtos import TaskBatchUpdateItemDTO, TaskUpdateDTO, TaskUpdateOperationDTO
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.use_cases.task_operations import apply_task_operations
+from src.tasks.use_cases.task_update import update_task
+
+
+def statuses():
+    return itertools.cycle(["completed", "pending"])
+
+
+async def run(owner_id: int, task_ids: list[int], operations: int, batch: int) -> None:
+    status = statuses()
+    targets = list(itertools.islice(itertools.cycle(task_ids), operations))
+
+    started = time.perf_counter()
+    for task_id in targets:
+        await update_task(task_id, TaskUpdateDTO(status=next(status)), owner_id=owner_id, uow=PGTaskUnitOfWork())
+    single = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for start in range(0, operations, batch):
+        await apply_task_operations(
+            owner_id=owner_id,
+            operations=[
+                TaskUpdateOperationDTO(op="update", data=TaskBatchUpdateItemDTO(id=task_id, status=next(status)))
+                for task_id in targets[start:start + batch]
+            ],
+            uow_factory=PGTaskUnitOfWork,
+        )
+    coalesced = time.perf_counter() - started
+    await async_engine.dispose()
+
+    print(f"operations:               {operations} on {len(task_ids)} tasks")
+    print(f"one by one:               {single / operations * 1000:.3f} ms/operation")
+    print(f"coalesced (up to {batch:>4}):  {coalesced / operations * 1000:.3f} ms/operation")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--owner-id", type=int, required=True, help="ID of an existing user owning the tasks")
+    parser.add_argument("--task-ids", type=int, nargs="+", required=True, help="IDs of existing tasks of the owner")
+    parser.add_argument("--operations", type=int, default=2000)
+    parser.add_argument("--batch", type=int, default=50, help="operations arriving together")
+    args = parser.parse_args()
+    asyncio.run(run(args.owner_id, args.task_ids, args.operations, args.batch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark of full-text task search against the configured PostgreSQL database.
+
+Reports the latency of `search_tasks`, as served by GET /api/tasks/search,
+for random one- and two-word queries of one owner. `--seed` first inserts
+that many generated tasks, spread evenly over the existing users, e.g. to
+build the 10M-task dataset (run `ANALYZE tasks` afterwards):
+
+    python -m benchmarks.task_search --seed 10000000
+    python -m benchmarks.task_search --owner-id 1 --requests 2000 --concurrency 1
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+from sqlalchemy import text
+
+from src.db.engine import async_engine
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.use_cases.task_search import search_tasks
+
+
+WORDS = ["buy", "call", "fix", "write", "read", "plan", "pay", "clean", "book", "send",
+         "milk", "report", "bug", "invoice", "flat", "trip", "email", "car", "doctor", "review"]
+
+SEED_SQL = text("""
+    INSERT INTO tasks (title, description, status, created_at, updated_at, owner_id)
+    SELECT
+        w[1 + i % 10] || ' ' || w[11 + (i / 10) % 10] || ' ' || i,
+        'generated ' || w[1 + (i / 100) % 20] || ' ' || w[1 + (i / 2000) % 20],
+        'pending', now(), now(),
+        u.ids[1 + i % cardinality(u.ids)]
+    FROM generate_series(:start, :stop) AS i,
+         (SELECT array_agg(id) AS ids FROM users) AS u,
+         (SELECT CAST(:words AS text[]) AS w) AS words
+""")
+
+
+async def seed(count: int, chunk: int = 100_000) -> None:
+    for start in range(0, count, chunk):
+        async with async_engine.begin() as connection:
+            await connection.execute(SEED_SQL, {"start": start, "stop": min(start + chunk, count) - 1, "words": WORDS})
+        print(f"seeded {min(start + chunk, count)}/{count}")
+
+
+async def run(owner_id: int, requests: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+    found = 0
+
+    async def one() -> None:
+        nonlocal found
+        query = " ".join(random.sample(WORDS, random.choice((1, 2))))
+        async with semaphore:
+            started = time.perf_counter()
+            page = await search_tasks(owner_id=owner_id, query=query, uow=PGTaskUnitOfWork(read_only=True))
+            latencies.append(time.perf_counter() - started)
+            found += len(page.items)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    print(f"requests:           {requests} (concurrency {concurrency})")
+    print(f"throughput:         {requests / elapsed:.1f} searches/s")
+    print(f"latency p50:        {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"latency p95:        {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f} ms")
+    print(f"results per search: {found / requests:.1f}")
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    if args.seed:
+        await seed(args.seed)
+    if args.owner_id is not None:
+        await run(args.owner_id, args.requests, args.concurrency)
+    await async_engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="number of generated tasks to insert first")
+    parser.add_argument("--owner-id", type=int, help="ID of the user whose tasks are searched")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark of response serialization through the ASGI stack, without a database.
+
+Serves a page of generated tasks from `GET /api/tasks`, which encodes the
+entities straight to JSON with `EntityResponse`, and from a comparison route
+returning the same page through `response_model=TaskPageDTO`, which validates
+it into DTOs before serializing them. Both are requested in process over
+httpx's ASGI transport, alternately for `--rounds` rounds, and the best round
+of each is reported in serialized tasks per second. Run it from the `backend`
+directory:
+
+    python -m benchmarks.task_serialization --page-size 200 --requests 1000
+"""
+import argparse
+import asyncio
+import datetime
+import time
+
+import httpx
+
+from src.auth.presentation.dependencies import get_current_user
+from src.main import app
+from src.tasks.domain.dtos import TaskPageDTO
+from src.tasks.domain.entities import Task, TaskPage
+from src.tasks.presentation.dependencies import get_task_read_uow
+from src.users.domain.entities import User
+
+
+VALIDATED_PATH = "/benchmark/tasks"
+
+
+class StubTaskRepository:
+    def __init__(self, page: TaskPage) -> None:
+        self.page = page
+
+    async def list_for_owner(self, owner_id: int, **kwargs) -> TaskPage:
+        return self.page
+
+
+class StubTaskUnitOfWork:
+    def __init__(self, page: TaskPage) -> None:
+        self.tasks = StubTaskRepository(page)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        pass
+
+
+def make_page(size: int) -> TaskPage:
+    now = datetime.datetime.now(datetime.timezone.utc)
+    items = [
+        Task(
+            id=index,
+            title=f"bench task {index}",
+            owner_id=1,
+            description="x" * 100,
+            status="pending",
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(1, size + 1)
+    ]
+    return TaskPage(items=items, next_cursor="bench-cursor")
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int, page_size: int) -> float:
+    await client.get(path, params={"limit": page_size})
+    started = time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(path, params={"limit": page_size})
+        response.raise_for_status()
+    return requests * page_size / (time.perf_counter() - started)
+
+
+async def run(page_size: int, requests: int, rounds: int) -> None:
+    page = make_page(page_size)
+    user = User(id=1, name="bench", email="bench@example.com", hashed_password="", is_active=True, is_superuser=False, is_verified=True)
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_task_read_uow] = lambda: StubTaskUnitOfWork(page)
+
+    @app.get(VALIDATED_PATH, response_model=TaskPageDTO)
+    async def validated() -> TaskPage:
+        return page
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        direct = await client.get("/api/tasks", params={"limit": page_size})
+        direct.raise_for_status()
+        if direct.json() != (await client.get(VALIDATED_PATH)).json():
+            raise SystemExit("the two routes disagree on the response body")
+        validated_rate = direct_rate = 0.0
+        for _ in range(rounds):
+            validated_rate = max(validated_rate, await measure(client, VALIDATED_PATH, requests, page_size))
+            direct_rate = max(direct_rate, await measure(client, "/api/tasks", requests, page_size))
+
+    print(f"page size:             {page_size} tasks, {len(direct.content)} bytes")
+    print(f"response_model:        {validated_rate:,.0f} tasks/s")
+    print(f"EntityResponse:        {direct_rate:,.0f} tasks/s")
+    print(f"speed-up:              {direct_rate / validated_rate:.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--page-size", type=int, default=200, help="tasks per page, at most MAX_PAGE_SIZE")
+    parser.add_argument("--requests", type=int, default=1000, help="requests per route and round")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+    asyncio.run(run(args.page_size, args.requests, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark of task updates against the configured PostgreSQL database.
+
+Reports the latency of `update_task`, as served by PATCH /api/tasks/{id},
+together with the number of SQL statements sent per call. Run it from the
+`backend` directory, on this revision and on the previous one, to compare
+the two:
+
+    python -m benchmarks.task_update --task-id 1 --owner-id 1 --requests 2000 --concurrency 1
+"""
+import argparse
+import asyncio
+import inspect
+import statistics
+import time
+
+from sqlalchemy import event
+
+from src.db.engine import async_engine
+from src.tasks.domain.dtos import TaskUpdateDTO
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.use_cases.task_update import update_task
+
+
+# Newer revisions scope updates to the owner of the task.
+NEEDS_OWNER_ID = "owner_id" in inspect.signature(update_task).parameters
+
+
+class StatementCounter:
+    """Count statements sent to the database through SQLAlchemy engine events."""
+
+    def __init__(self, engine) -> None:
+        self.statements = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args) -> None:
+        self.statements += 1
+
+
+async def run(task_id: int, owner_id: int, requests: int, concurrency: int) -> None:
+    counter = StatementCounter(async_engine.sync_engine)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            extra = {"owner_id": owner_id} if NEEDS_OWNER_ID else {}
+            await update_task(
+                task_pk=task_id,
+                task_data=TaskUpdateDTO(title=f"bench task {index}"),
+                uow=PGTaskUnitOfWork(),
+                **extra,
+            )
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+
+    latencies.sort()
+    print(f"requests:               {requests} (concurrency {concurrency})")
+    print(f"throughput:             {requests / elapsed:.1f} updates/s")
+    print(f"latency p50:            {statistics.median(latencies) * 1000:.2f} ms")
+    print(f"latency p95:            {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f} ms")
+    print(f"statements per update:  {counter.statements / requests:.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--task-id", type=int, required=True, help="ID of an existing task to update")
+    parser.add_argument("--owner-id", type=int, required=True, help="ID of the task owner")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    asyncio.run(run(args.task_id, args.owner_id, args.requests, args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,6 @@
 import datetime
+import hashlib
+import time
 
 from fastapi import status
 from fastapi.exceptions import HTTPException
@@ -6,6 +8,8 @@ from jose import JWTError, jwt
 
 from src.auth.domain.exceptions import TokenExpired
 from src.auth.domain.interfaces.token_service import ITokenService
+from src.core.infrastructure.cache import TTLCache
+from src.core.infrastructure.metrics import metrics
 from src.users.domain.entities import User
 
 
@@ -18,9 +22,10 @@ class JWTTokenService(ITokenService):
         algorithm (str): The algorithm used for encoding tokens.
         access_token_expires_sec (int): The expiration time for access tokens in seconds.
         refresh_token_expires_sec (int): The expiration time for refresh tokens in seconds.
+        decode_cache (TTLCache): Cache of verified token payloads keyed by token digest.
     """
 
-    def __init__(self, secret_key: str, algorithm: str, access_token_expires_sec: int, refresh_token_expires_sec: int):
+    def __init__(self, secret_key: str, algorithm: str, access_token_expires_sec: int, refresh_token_expires_sec: int, decode_cache_size: int = 0):
         """
         Initialize the JWTTokenService with the required parameters.
 
@@ -29,11 +34,13 @@ class JWTTokenService(ITokenService):
             algorithm (str): The algorithm used for encoding tokens.
             access_token_expires_sec (int): The expiration time for access tokens in seconds.
             refresh_token_expires_sec (int): The expiration time for refresh tokens in seconds.
+            decode_cache_size (int): How many verified tokens to remember, 0 disables the cache.
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
         self.access_token_expires_sec = access_token_expires_sec
         self.refresh_token_expires_sec = refresh_token_expires_sec
+        self.decode_cache = TTLCache(maxsize=decode_cache_size, ttl=access_token_expires_sec)
 
     def create_access_token(self, user: User) -> str:
         """
@@ -67,6 +74,10 @@ class JWTTokenService(ITokenService):
         """
         Decode a given JWT token and return its payload.
 
+        Verified payloads are cached by the SHA-256 digest of the token until
+        the token's `exp`, so presenting the same token again skips the
+        signature check and claims validation.
+
         Args:
             token (str): The token to decode.
 
@@ -76,8 +87,19 @@ class JWTTokenService(ITokenService):
         Raises:
             HTTPException: If the token is invalid or expired.
         """
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        payload = self.decode_cache.get(digest)
+        if payload is not None:
+            metrics.incr("jwt_decode_cache.hits")
+            return dict(payload)
+
         try:
             payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
         except JWTError as e:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=f"Error: {e}")
+
+        metrics.incr("jwt_decode_cache.misses")
+        expire = payload.get("exp")
+        if expire is not None:
+            self.decode_cache.set(digest, dict(payload), ttl=int(expire) - time.time())
+        return payload
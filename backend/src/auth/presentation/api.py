@@ -6,7 +6,7 @@ from src.auth.use_cases.log_out import log_out
 from src.auth.use_cases.refresh import refresh_token
 from src.auth.presentation.dependencies import AuthDep, JWTTokenServiceDep, RefreshTokenRepositoryDep, PasswordHasherDep
 from src.users.domain.dtos import UserReadDTO
-from src.users.presentation.dependencies import UserUoWDep
+from src.users.presentation.dependencies import UserCacheDep, UserReadUoWDep
 
 
 auth_api_router = APIRouter(
@@ -20,7 +20,7 @@ auth_api_router = APIRouter(
 @auth_api_router.post("/login")
 async def login(
     response: Response,
-    user_uow: UserUoWDep,
+    user_uow: UserReadUoWDep,
     pwd_hasher: PasswordHasherDep,
     token_service: JWTTokenServiceDep,
     token_repository: RefreshTokenRepositoryDep,
@@ -44,12 +44,13 @@ async def login(
 async def logout(
     response: Response,
     token_repository: RefreshTokenRepositoryDep,
+    user_cache: UserCacheDep,
     current_user: AuthDep,
 ):
     """
     Log out user by invalidating refresh token.
     """
-    return await log_out(response, token_repository, current_user.id)
+    return await log_out(response, token_repository, current_user.id, user_cache=user_cache)
 
 
 @auth_api_router.get("/me", response_model=UserReadDTO)
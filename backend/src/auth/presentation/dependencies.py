@@ -1,4 +1,6 @@
 import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Cookie, HTTPException, Depends, status
@@ -7,13 +9,16 @@ from fastapi.security import OAuth2PasswordBearer
 from src.users.domain.entities import User
 from src.core.config import settings
 from src.core.infrastructure.clients.redis import get_redis_client
+from src.core.infrastructure.metrics import metrics
 from src.auth.domain.interfaces.token_service import ITokenService
 from src.auth.domain.interfaces.token_repository import IRefreshTokenRepository
 from src.auth.infrastructure.jwt_service import JWTTokenService
 from src.auth.infrastructure.redis_refresh_repo import RedisRefreshTokenRepository
-from src.users.domain.interfaces.password_hasher import IPasswordHasher
-from src.users.infrastructure.services.password_hasher import BcryptPasswordHasher
-from src.users.presentation.dependencies import get_user_uow
+from src.users.domain.interfaces.password_hasher import IAsyncPasswordHasher
+from src.users.infrastructure.services.password_hasher import BcryptPasswordHasher, PooledPasswordHasher
+from src.users.domain.interfaces.user_cache import IUserCache
+from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+from src.users.presentation.dependencies import get_user_cache, get_user_read_uow
 
 
 oauth2_scheme = OAuth2PasswordBearer(
@@ -22,13 +27,15 @@ oauth2_scheme = OAuth2PasswordBearer(
 )
 
 
+@lru_cache
 def get_jwt_service() -> ITokenService:
     """
     Dependency provider for jwt token service.
 
     Returns an instance of `ITokenService` implemented using the jose library.
     This function is intended to be used as a dependency injection entry point
-    in application or presentation layers.
+    in application or presentation layers. `lru_cache` makes the service,
+    together with its cache of verified tokens, an application-wide singleton.
 
     :return: A token service instance conforming to the `ITokenService` interface.
     """
@@ -37,6 +44,7 @@ def get_jwt_service() -> ITokenService:
         algorithm=settings.JWT_ALGORITHM,
         access_token_expires_sec=settings.ACCESS_TOKEN_EXPIRE_SECONDS,
         refresh_token_expires_sec=settings.REFRESH_TOKEN_EXPIRE_SECONDS,
+        decode_cache_size=settings.JWT_DECODE_CACHE_SIZE,
     )
 
 
@@ -55,26 +63,41 @@ def get_token_repository() -> IRefreshTokenRepository:
     )
 
 
-def get_password_hasher() -> IPasswordHasher:
+@lru_cache
+def get_password_hasher() -> IAsyncPasswordHasher:
     """
     Dependency provider for password hashing service.
 
-    Returns an instance of `IPasswordHasher` implemented using the Bcrypt algorithm.
-    This function is intended to be used as a dependency injection entry point
-    in application or presentation layers.
+    Returns an instance of `IAsyncPasswordHasher` running the Bcrypt algorithm
+    in a thread or process pool, so hashing never blocks the event loop.
+    `lru_cache` makes the hasher and its pool application-wide singletons.
 
-    :return: A password hasher instance conforming to the `IPasswordHasher` interface.
+    :return: A password hasher instance conforming to the `IAsyncPasswordHasher` interface.
     """
-    return BcryptPasswordHasher()
+    if settings.PASSWORD_HASHER_EXECUTOR == "process":
+        executor = ProcessPoolExecutor(max_workers=settings.PASSWORD_HASHER_WORKERS)
+    else:
+        executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASHER_WORKERS, thread_name_prefix="pwd-hasher")
+
+    hasher = PooledPasswordHasher(
+        hasher=BcryptPasswordHasher(),
+        executor=executor,
+        max_concurrency=settings.PASSWORD_HASHER_WORKERS,
+        max_queue=settings.PASSWORD_HASHER_MAX_QUEUE,
+    )
+    metrics.register_collector("password_hasher", lambda: {"pending": hasher.pending})
+    return hasher
 
 
-async def get_current_user(access_token: str = Cookie(None, alias="users_access_token"), refresh_token: str = Cookie(None, alias="users_refresh_token"), jwt_token_service: ITokenService = Depends(get_jwt_service)):
+async def get_current_user(access_token: str = Cookie(None, alias="users_access_token"), refresh_token: str = Cookie(None, alias="users_refresh_token"), jwt_token_service: ITokenService = Depends(get_jwt_service), user_cache: IUserCache = Depends(get_user_cache), user_uow: IUserUnitOfWork = Depends(get_user_read_uow)):
     """
     Dependency function to get the current authenticated user from the access token.
     
     Args:
         token (str, optional): The JWT access token extracted from the 'users_access_token' cookie.
         jwt_token_service (ITokenService): The token service dependency for decoding tokens.
+        user_cache (IUserCache): Cache of authenticated users, consulted before the database.
+        user_uow (IUserUnitOfWork): Read-only user unit of work sharing the request session.
     
     Returns:
         User: The authenticated user object.
@@ -99,18 +122,40 @@ async def get_current_user(access_token: str = Cookie(None, alias="users_access_
         if not user_id:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='ID of user not found')
         
-        user_uow = get_user_uow()
-        async with user_uow:
-            user = await user_uow.users.get_by_pk(int(user_id))
+        user = await user_cache.get(int(user_id))
+        if user is None:
+            # Read before loading, so that a concurrent invalidation refuses the fill.
+            version = await user_cache.version(int(user_id))
+            async with user_uow:
+                user = await user_uow.users.get_by_pk(int(user_id))
         
-        if not user:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='User not found')
+            if not user:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail='User not found')
+            await user_cache.set(user, version)
 
         return user
 
 
+async def get_current_superuser(user: User = Depends(get_current_user)):
+    """
+    Dependency function to get the current authenticated user, requiring administrative privileges.
+
+    Args:
+        user (User): The authenticated user.
+
+    Returns:
+        User: The authenticated superuser.
+
+    Raises:
+        HTTPException: 403 Forbidden if the user is not a superuser.
+    """
+    if user is None or not user.is_superuser:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN)
+    return user
+
 
 JWTTokenServiceDep = Annotated[ITokenService, Depends(get_jwt_service)]
 RefreshTokenRepositoryDep = Annotated[IRefreshTokenRepository, Depends(get_token_repository)]
-PasswordHasherDep = Annotated[IPasswordHasher, Depends(get_password_hasher)]
+PasswordHasherDep = Annotated[IAsyncPasswordHasher, Depends(get_password_hasher)]
 AuthDep = Annotated[User, Depends(get_current_user)]
+SuperuserDep = Annotated[User, Depends(get_current_superuser)]
@@ -6,14 +6,14 @@ from src.auth.domain.interfaces.token_service import ITokenService
 from src.auth.domain.interfaces.token_repository import IRefreshTokenRepository
 from src.users.domain.exceptions import UserNotFound
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
-from src.users.domain.interfaces.password_hasher import IPasswordHasher
+from src.users.domain.interfaces.password_hasher import IAsyncPasswordHasher
 
 
 async def authenticate_user(
     response: Response,
     user_data: AuthRequest,
     user_uow: IUserUnitOfWork,
-    pwd_hasher: IPasswordHasher,
+    pwd_hasher: IAsyncPasswordHasher,
     token_service: ITokenService,
     token_repository: IRefreshTokenRepository,
     set_cookies: bool = True,
@@ -22,7 +22,7 @@ async def authenticate_user(
         user = await user_uow.users.get_by_email(user_data.username)
     if not user:
         raise UserNotFound(detail=f"User with email {user_data.username} not found")
-    if not pwd_hasher.verify(password=user_data.password, hashed_password=user.hashed_password):
+    if not await pwd_hasher.verify(password=user_data.password, hashed_password=user.hashed_password):
         raise IncorrectPassword(detail=f"Incorrect password for {user_data.username}")
 
     access_token = token_service.create_access_token(user)
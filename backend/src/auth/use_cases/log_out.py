@@ -2,14 +2,18 @@ from fastapi import Depends, Response
 from src.auth.presentation.dependencies import get_current_user
 from src.users.domain.entities import User
 from src.auth.domain.interfaces.token_repository import IRefreshTokenRepository
+from src.users.domain.interfaces.user_cache import IUserCache
 
 
 async def log_out(
     response: Response,
     token_repository: IRefreshTokenRepository,
-    current_user_id: int
+    current_user_id: int,
+    user_cache: IUserCache | None = None,
 ) -> dict[str, str]:
     response.delete_cookie(key="users_access_token")
     response.delete_cookie(key="users_refresh_token")
     await token_repository.delete_refresh_token(current_user_id)
+    if user_cache is not None:
+        await user_cache.invalidate(current_user_id)
     return {"detail": "Successfully logged out"}
@@ -1,3 +1,6 @@
+from functools import lru_cache
+from typing import Any, Literal
+
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings
 
@@ -21,6 +24,18 @@ class Settings(BaseSettings):
     JWT_SECRET: str
     ACCESS_TOKEN_EXPIRE_SECONDS: int
     REFRESH_TOKEN_EXPIRE_SECONDS: int
+    JWT_DECODE_CACHE_SIZE: int = 10_000
+
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT_SECONDS: float = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_PRE_PING: bool = False
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = 500
+    DB_WARMUP_CONNECTIONS: int = 5
+    WARMUP_TIMEOUT_SECONDS: float = 30
+    WARMUP_RETRY_SECONDS: float = 2
 
     TEST_DB_USER: SecretStr
     TEST_DB_PASS: SecretStr
@@ -28,6 +43,30 @@ class Settings(BaseSettings):
     TEST_DB_PORT: str
     TEST_DB_NAME: str
 
+    USER_CACHE_MAX_SIZE: int = 10_000
+    USER_CACHE_TTL_SECONDS: float = 30
+    USER_CACHE_REDIS_ENABLED: bool = False
+    USER_CACHE_REDIS_TTL_SECONDS: int = 300
+
+    TASK_CACHE_ENABLED: bool = True
+    TASK_CACHE_TTL_SECONDS: int = 60
+    TASK_CACHE_NEGATIVE_TTL_SECONDS: int = 5
+    TASK_SYNC_SETTLE_SECONDS: float = 2
+    TASK_TOMBSTONE_RETENTION_DAYS: int = 30
+    TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS: float = 3600
+    TASK_SUGGEST_LIMIT: int = 10
+    TASK_SUGGEST_TIMEOUT_MS: int = 50
+    TASK_SUGGEST_CACHE_TTL_SECONDS: int = 10
+    TASK_EVENTS_ENABLED: bool = True
+    TASK_EVENTS_STREAM_MAXLEN: int = 1000
+    TASK_EVENTS_QUEUE_SIZE: int = 256
+    TASK_EVENTS_HEARTBEAT_SECONDS: float = 15
+    TASK_OPERATIONS_BATCH_WINDOW_MS: float = 2
+
+    PASSWORD_HASHER_EXECUTOR: Literal["thread", "process"] = "thread"
+    PASSWORD_HASHER_WORKERS: int = 4
+    PASSWORD_HASHER_MAX_QUEUE: int = 64
+
     @property
     def database_url(self):
         return f"postgresql+asyncpg://{self.DB_USER.get_secret_value()}:{self.DB_PASS.get_secret_value()}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
@@ -45,4 +84,20 @@ class Settings(BaseSettings):
         return f"redis://{self.TEST_REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_NAME}"
 
 
-settings = Settings() # type: ignore
\ No newline at end of file
+@lru_cache
+def get_settings() -> Settings:
+    """
+    Load and cache the settings from the environment.
+
+    Settings are validated on first use rather than at import.
+
+    :return: The cached settings.
+    """
+    return Settings() # type: ignore
+
+
+def __getattr__(name: str) -> Any:
+    # `from src.core.config import settings` loads the settings on first use.
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,43 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Tuple
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityBase:
+    """
+    Base class of domain entities.
+
+    Entities are slotted dataclasses: they carry no per-instance `__dict__`,
+    so their fields are read through `field_names` instead.
+    """
+
+    @classmethod
+    def field_names(cls) -> Tuple[str, ...]:
+        """
+        Names of the entity's fields, in declaration order.
+
+        :return: Field names, computed once per class.
+        """
+        return _field_names(cls)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Iterate over the entity's fields without building a dict.
+
+        :return: Iterator of (field name, value) pairs.
+        """
+        for name in _field_names(type(self)):
+            yield name, getattr(self, name)
+
     @property
-    def dict(self):
-        return self.__dict__
+    def dict(self) -> Dict[str, Any]:
+        """
+        A new dict of the entity's fields; changing it does not change the entity.
+        """
+        return {name: getattr(self, name) for name in _field_names(type(self))}
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> Tuple[str, ...]:
+    return tuple(field.name for field in fields(cls))
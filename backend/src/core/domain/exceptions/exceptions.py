@@ -60,3 +60,8 @@ class BadRequest(AppException):
 class NotAuthenticated(AppException):
     status_code = status.HTTP_401_UNAUTHORIZED
     detail = "User not authenticated"
+
+
+class ServiceUnavailable(AppException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    detail = "Service temporarily unavailable"
@@ -0,0 +1,41 @@
+import base64
+import binascii
+import json
+from typing import Any
+
+from src.core.domain.exceptions.exceptions import BadRequest
+
+
+class InvalidCursor(BadRequest):
+    detail = "Invalid pagination cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode keyset position values into an opaque, URL-safe cursor.
+
+    :param values: JSON-serializable values describing the last seen row.
+    :return: Opaque cursor string.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode an opaque cursor produced by `encode_cursor`.
+
+    :param cursor: Cursor string received from a client.
+    :param size: Expected number of position values.
+    :return: Decoded position values.
+    :raises InvalidCursor: If the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError, binascii.Error):
+        raise InvalidCursor()
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor()
+    return values
@@ -0,0 +1,107 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+# Redis scripts of versioned caches, where each cached value has a version
+# key bumped by invalidations.
+
+# Stores a value only if its version is still the one the reader saw before
+# loading it; a missing version counts as 0.
+FILL_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') == ARGV[1] then
+    return redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+end
+return false
+"""
+
+# Drops values and bumps their versions in one step; KEYS alternate between
+# value keys and version keys.
+INVALIDATE_SCRIPT = """
+for i = 1, #KEYS, 2 do
+    redis.call('DEL', KEYS[i])
+    redis.call('INCR', KEYS[i + 1])
+    redis.call('EXPIRE', KEYS[i + 1], ARGV[1])
+end
+return #KEYS / 2
+"""
+
+
+class TTLCache:
+    """
+    Bounded in-process cache with per-entry expiration and LRU eviction.
+
+    Intended for small, hot values shared by the requests of one worker process.
+    It is not thread-safe and should only be used from the event loop thread.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept.
+        ttl (float): Default time to live of an entry in seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize an empty cache.
+
+        :param maxsize: Maximum number of entries kept.
+        :param ttl: Default time to live of an entry in seconds.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return a cached value, or None if it is missing or expired.
+
+        :param key: Cache key.
+        :return: Cached value or None.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return None
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value, evicting the least recently used entry when full.
+
+        :param key: Cache key.
+        :param value: Value to store.
+        :param ttl: Time to live in seconds, defaults to the cache TTL.
+        """
+        if self.maxsize <= 0:
+            return
+
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0:
+            return
+
+        self._data[key] = (time.monotonic() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """
+        Remove an entry if present.
+
+        :param key: Cache key.
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries.
+        """
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,64 @@
+from collections import defaultdict
+from typing import Any, Callable
+
+
+class MetricsRegistry:
+    """
+    In-process registry of application metrics.
+
+    Keeps monotonically increasing counters, timing summaries and collectors
+    that produce point-in-time values (gauges) when a snapshot is taken.
+    Values are per worker process.
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, int] = defaultdict(int)
+        self._timings: dict[str, dict[str, float]] = {}
+        self._collectors: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def incr(self, name: str, value: int = 1) -> None:
+        """
+        Increase a counter.
+
+        :param name: Counter name.
+        :param value: Increment.
+        """
+        self._counters[name] += value
+
+    def observe(self, name: str, seconds: float) -> None:
+        """
+        Record a duration in a timing summary.
+
+        :param name: Timing name.
+        :param seconds: Observed duration in seconds.
+        """
+        timing = self._timings.get(name)
+        if timing is None:
+            timing = self._timings[name] = {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        timing["count"] += 1
+        timing["total_seconds"] += seconds
+        timing["max_seconds"] = max(timing["max_seconds"], seconds)
+
+    def register_collector(self, name: str, collector: Callable[[], dict[str, Any]]) -> None:
+        """
+        Register a callable producing gauge values on every snapshot.
+
+        :param name: Collector name, used as a key in the snapshot.
+        :param collector: Callable returning a dictionary of values.
+        """
+        self._collectors[name] = collector
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return the current values of all metrics.
+
+        :return: Dictionary with counters, timings and gauges.
+        """
+        return {
+            "counters": dict(self._counters),
+            "timings": {name: dict(timing) for name, timing in self._timings.items()},
+            "gauges": {name: collector() for name, collector in self._collectors.items()},
+        }
+
+
+metrics = MetricsRegistry()
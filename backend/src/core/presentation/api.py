@@ -0,0 +1,37 @@
+from fastapi import APIRouter, Request
+from fastapi.responses import JSONResponse
+
+from src.auth.presentation.dependencies import SuperuserDep
+from src.core.infrastructure.metrics import metrics
+
+
+metrics_api_router = APIRouter(prefix="/api/metrics", tags=["metrics"])
+
+
+@metrics_api_router.get("")
+async def get_metrics(user: SuperuserDep):
+    """
+    Get in-process metrics of the worker serving the request; superusers only.
+    """
+    return metrics.snapshot()
+
+
+health_api_router = APIRouter(prefix="/api/health", tags=["health"])
+
+
+@health_api_router.get("/live")
+async def live():
+    """
+    Report that the worker is running.
+    """
+    return {"status": "ok"}
+
+
+@health_api_router.get("/ready")
+async def ready(request: Request):
+    """
+    Report whether the worker has completed warm-up and should receive traffic.
+    """
+    if not getattr(request.app.state, "ready", False):
+        return JSONResponse({"status": "warming up"}, status_code=503)
+    return {"status": "ready"}
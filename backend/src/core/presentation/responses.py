@@ -0,0 +1,123 @@
+import dataclasses
+import types
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Optional
+
+import orjson
+from fastapi.responses import Response
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+
+Projector = Callable[[Any], Any]
+
+
+class EntityResponse(Response):
+    """
+    JSON response encoding trusted domain entities straight to bytes.
+
+    Routes returning a `Response` skip `response_model` validation and
+    serialization entirely, so entities coming from use cases are serialized
+    once, by orjson, without being revalidated into DTOs first. Only the fields of the
+    DTO are emitted, which keeps the output, and fields such as
+    `hashed_password` hidden, exactly as with `response_model`.
+
+    Keep `response_model` on the route: it still documents the response in
+    the OpenAPI schema.
+
+    Attributes:
+        media_type (str): Always "application/json".
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        model: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        """
+        Initialize the response.
+
+        :param content: Entity, list of entities or None, as returned by a use case.
+        :param model: DTO type describing the response, e.g. `TaskDTO` or `List[TaskDTO]`.
+        :param status_code: HTTP status code.
+        :param headers: Additional response headers.
+        :param background: Task to run after the response is sent.
+        """
+        self.model = model
+        super().__init__(content, status_code=status_code, headers=headers, background=background)
+
+    def render(self, content: Any) -> bytes:
+        return encode_entity(content, self.model)
+
+
+def encode_entity(content: Any, model: Any) -> bytes:
+    """
+    Encode trusted entities to JSON as the DTO type describing them would be encoded.
+
+    :param content: Entity, list of entities or None.
+    :param model: DTO type, e.g. `TaskDTO` or `List[TaskDTO]`.
+    :return: UTF-8 encoded JSON.
+    """
+    return orjson.dumps(projector(model)(content), option=orjson.OPT_UTC_Z)
+
+
+@lru_cache(maxsize=None)
+def projector(model: Any) -> Projector:
+    """
+    Build a function turning entities into values orjson encodes like the DTO would be.
+
+    Dataclasses whose fields match the DTO's plain fields exactly are passed
+    through, since orjson encodes them natively; otherwise only the DTO's
+    fields are copied, recursively.
+
+    :param model: DTO type, or a typing construct over DTO types.
+    :return: Projection function, cached per model.
+    """
+    origin = typing.get_origin(model)
+    if origin in (typing.Union, types.UnionType):
+        members = [projector(arg) for arg in typing.get_args(model) if arg is not type(None)]
+        return members[0] if len(members) == 1 else _identity
+    if origin in (list, tuple, set, frozenset):
+        (item_model, *_) = typing.get_args(model) or (Any,)
+        item = projector(item_model)
+        if item is _identity:
+            return list
+        return lambda values: [item(value) for value in values]
+    if isinstance(model, type) and issubclass(model, BaseModel):
+        return _model_projector(model)
+    return _identity
+
+
+def _model_projector(model: type[BaseModel]) -> Projector:
+    fields = {name: projector(field.annotation) for name, field in model.model_fields.items()}
+    plain = all(field is _identity for field in fields.values())
+    passthrough: dict[type, bool] = {}
+
+    def project(value: Any) -> Any:
+        if value is None:
+            return None
+        cls = type(value)
+        native = passthrough.get(cls)
+        if native is None:
+            native = passthrough[cls] = (
+                plain
+                and dataclasses.is_dataclass(cls)
+                and {field.name for field in dataclasses.fields(cls)} == fields.keys()
+            )
+        if native:
+            return value
+        if isinstance(value, Mapping):
+            return {name: field(value.get(name)) for name, field in fields.items()}
+        return {name: field(getattr(value, name, None)) for name, field in fields.items()}
+
+    return project
+
+
+def _identity(value: Any) -> Any:
+    return value
@@ -0,0 +1,47 @@
+import zlib
+from typing import AsyncIterable, AsyncIterator, Optional
+
+
+async def gzip_chunks(chunks: AsyncIterable[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """
+    Compress a stream of chunks into a single gzip stream on the fly.
+
+    Only the compressor state is kept between chunks, so memory does not
+    grow with the length of the stream.
+
+    :param chunks: Uncompressed chunks.
+    :param level: Compression level, 1 (fastest) to 9 (smallest).
+    :return: Async iterator of gzip-compressed chunks.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+# Comment line sent to idle Server-Sent Events streams to keep connections
+# and intermediaries from timing out.
+SSE_HEARTBEAT = b": heartbeat\n\n"
+
+
+def sse_message(data: str, event: Optional[str] = None, id: Optional[str] = None, retry_ms: Optional[int] = None) -> bytes:
+    """
+    Encode one Server-Sent Event.
+
+    :param data: Event payload; multi-line payloads are split over several data fields.
+    :param event: Event type, dispatched by clients to listeners of that name.
+    :param id: Event ID, sent back by reconnecting clients as `Last-Event-ID`.
+    :param retry_ms: Reconnection delay for the client, in milliseconds.
+    :return: The encoded event.
+    """
+    lines = []
+    if id is not None:
+        lines.append(f"id: {id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    if retry_ms is not None:
+        lines.append(f"retry: {retry_ms}")
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return ("\n".join(lines) + "\n\n").encode("utf-8")
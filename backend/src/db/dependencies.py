@@ -3,7 +3,7 @@ from typing import AsyncGenerator, Annotated
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from src.db.engine import async_session_maker
+from src.db.engine import get_session_maker
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -14,10 +14,15 @@ async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
     or other components.
     It ensures proper session lifecycle managment with context control.
 
+    FastAPI caches dependencies per request, so every unit of work of a request
+    built on this dependency shares the session. The session checks out a
+    connection only on first use and returns it whenever a unit of work ends
+    its transaction, so long-lived responses do not hold one.
+
     Yields:
         AsyncSession: SQLAlchemy async session.
     """
-    async with async_session_maker() as session:
+    async with get_session_maker()() as session:
         yield session
 
 
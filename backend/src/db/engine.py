@@ -1,6 +1,110 @@
-from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import Pool
 from src.core.config import settings
+from src.core.infrastructure.metrics import metrics
+
+
+def _connect_args() -> dict[str, Any]:
+    """
+    Build asyncpg connection arguments from the settings.
+
+    `prepared_statement_cache_size` is consumed by the SQLAlchemy asyncpg
+    adapter; set it to 0 behind a transaction-pooling PgBouncer.
+    `statement_timeout` is applied server-side to every new connection.
+    """
+    connect_args: dict[str, Any] = {"prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE}
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        connect_args["server_settings"] = {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}
+    return connect_args
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """
+    Create and cache the database engine of this worker.
+
+    The engine, and with it the connection pool, is created on first use
+    rather than at import, so importing modules that depend on it stays cheap
+    and every worker process builds its own pool.
+
+    :return: The cached engine.
+    """
+    engine = create_async_engine(
+        settings.database_url,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=_connect_args(),
+    )
+    metrics.register_collector("db_pool", lambda: pool_statistics(engine.pool, settings.DB_MAX_OVERFLOW))
+    return engine
+
+
+@lru_cache
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Create and cache the session maker bound to the engine.
+
+    :return: The cached session maker.
+    """
+    return async_sessionmaker(get_async_engine(), expire_on_commit=False)
+
+
+@lru_cache
+def get_readonly_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Create and cache the session maker of read-only units of work.
+
+    In AUTOCOMMIT mode no BEGIN/ROLLBACK round trips are issued around the queries.
+
+    :return: The cached session maker.
+    """
+    return async_sessionmaker(get_async_engine().execution_options(isolation_level="AUTOCOMMIT"), expire_on_commit=False)
+
+
+def pool_statistics(pool: Pool, max_overflow: int) -> dict[str, int]:
+    """
+    Return the state of a connection pool of this worker.
+
+    Computed from the pool's public counters only. While `available` stays at
+    0, every connection is checked out and new checkouts wait for one.
+
+    :param pool: Pool of an engine, e.g. `get_async_engine().pool`.
+    :param max_overflow: `max_overflow` the pool was created with, -1 for no limit.
+    :return: Configured size, checked-in and checked-out connections, current
+        overflow (negative while the pool is not yet filled up to its size)
+        and, for a bounded pool, the number of connections that can still be
+        checked out without waiting.
+    """
+    if not hasattr(pool, "checkedout"):
+        return {}
+    statistics = {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+    if max_overflow >= 0:
+        statistics["available"] = max(0, pool.size() + max_overflow - pool.checkedout())
+    return statistics
+
+
+_LAZY_ATTRIBUTES = {
+    "async_engine": get_async_engine,
+    "async_session_maker": get_session_maker,
+    "async_readonly_session_maker": get_readonly_session_maker,
+}
 
-async_engine = create_async_engine(settings.database_url)
 
-async_session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    # Keeps `from src.db.engine import async_engine` working; the engine is
+    # then created by that import.
+    factory = _LAZY_ATTRIBUTES.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return factory()
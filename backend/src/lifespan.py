@@ -0,0 +1,156 @@
+import asyncio
+import contextlib
+import datetime
+import logging
+import time
+from typing import AsyncIterator
+
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import configure_mappers
+
+from src.core.config import settings
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.core.infrastructure.metrics import metrics
+from src.db.engine import get_async_engine, get_readonly_session_maker
+from src.tasks.domain.exceptions import TaskNotFound
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.core.infrastructure.cache import FILL_SCRIPT, INVALIDATE_SCRIPT
+from src.tasks.infrastructure.services.task_events import PUBLISH_SCRIPT
+from src.tasks.presentation.dependencies import get_task_event_broker
+from src.tasks.use_cases.task_changes import DEFAULT_CHANGES_PAGE_SIZE
+from src.tasks.use_cases.task_list import DEFAULT_PAGE_SIZE
+from src.tasks.use_cases.task_tombstones import prune_task_tombstones
+from src.users.domain.exceptions import UserNotFound
+from src.users.infrastructure.db.unit_of_work import PGUserUnitOfWork
+
+
+logger = logging.getLogger(__name__)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Warm the worker up in the background and release its connections on shutdown.
+
+    The worker serves requests right away, but `app.state.ready`, reported by
+    the readiness endpoint, only turns true once warm-up has completed, so a
+    load balancer routes traffic to it only then. Warm-up is retried until it
+    succeeds, e.g. while the database is still starting. Every
+    `TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS`, if set, expired task tombstones
+    are pruned.
+
+    :param app: The application.
+    """
+    app.state.ready = False
+    background_tasks = [asyncio.create_task(_warm_up_until_done(app))]
+    if settings.TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS > 0:
+        background_tasks.append(asyncio.create_task(_prune_tombstones_periodically()))
+    try:
+        yield
+    finally:
+        for task in background_tasks:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await shutdown()
+
+
+async def warm_up(connections: int) -> None:
+    """
+    Pay the costs of first requests up front.
+
+    Configures the ORM mappers, opens `connections` pooled database
+    connections at once and runs the hot queries on each, so SQLAlchemy's
+    compiled cache and every connection's prepared statement cache are
+    filled, and connects to Redis.
+
+    :param connections: Number of database connections to open, capped at `DB_POOL_SIZE`.
+    """
+    configure_mappers()
+    await asyncio.gather(_warm_up_database(min(connections, settings.DB_POOL_SIZE)), _warm_up_redis())
+
+
+async def shutdown() -> None:
+    """
+    Close the task event broker, the Redis client and the database pool of this worker.
+    """
+    # Only what was created: the cached factories would otherwise create it now.
+    if get_task_event_broker.cache_info().currsize:
+        await get_task_event_broker().close()
+    if get_redis_client.cache_info().currsize:
+        await get_redis_client().aclose()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+
+
+async def _warm_up_until_done(app: FastAPI) -> None:
+    while True:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(warm_up(settings.DB_WARMUP_CONNECTIONS), settings.WARMUP_TIMEOUT_SECONDS)
+        except Exception:
+            logger.warning("Warm-up failed, retrying in %s s", settings.WARMUP_RETRY_SECONDS, exc_info=True)
+            await asyncio.sleep(settings.WARMUP_RETRY_SECONDS)
+            continue
+        elapsed = time.perf_counter() - started
+        metrics.observe("warm_up", elapsed)
+        logger.info("Warm-up completed in %.3f s", elapsed)
+        app.state.ready = True
+        return
+
+
+async def _prune_tombstones_periodically() -> None:
+    retention = datetime.timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS)
+    while True:
+        await asyncio.sleep(settings.TASK_TOMBSTONE_PRUNE_INTERVAL_SECONDS)
+        try:
+            pruned = await prune_task_tombstones(PGTaskUnitOfWork, retention)
+        except Exception:
+            logger.warning("Pruning task tombstones failed", exc_info=True)
+            continue
+        metrics.incr("task_tombstones.pruned", pruned)
+
+
+async def _warm_up_database(connections: int) -> None:
+    if connections <= 0:
+        return
+    # Each session holds its connection until every one has been opened, so
+    # the pool ends up with `connections` distinct warm connections.
+    barrier = asyncio.Barrier(connections)
+    async with asyncio.TaskGroup() as group:
+        for _ in range(connections):
+            group.create_task(_warm_up_connection(barrier))
+
+
+async def _warm_up_connection(barrier: asyncio.Barrier) -> None:
+    # The transaction is begun here, so the read-only units of work leave it,
+    # and the connection, alone.
+    async with get_readonly_session_maker()() as session, session.begin():
+        await _run_hot_queries(session)
+        await barrier.wait()
+
+
+async def _run_hot_queries(session: AsyncSession) -> None:
+    # Lookups of IDs that never exist: only the statements matter.
+    async with PGUserUnitOfWork(read_only=True, session=session) as user_uow:
+        with contextlib.suppress(UserNotFound):
+            await user_uow.users.get_by_pk(0)
+        with contextlib.suppress(UserNotFound):
+            await user_uow.users.get_by_email("")
+    async with PGTaskUnitOfWork(read_only=True, session=session) as task_uow:
+        with contextlib.suppress(TaskNotFound):
+            await task_uow.tasks.get_for_owner(0, owner_id=0)
+        await task_uow.tasks.list_for_owner(0, limit=DEFAULT_PAGE_SIZE)
+        await task_uow.tasks.changes_since(0, cursor=None, limit=DEFAULT_CHANGES_PAGE_SIZE)
+
+
+async def _warm_up_redis() -> None:
+    redis_client = get_redis_client()
+    await redis_client.ping()
+    # Spares the first use of each script the NOSCRIPT round trip.
+    if settings.TASK_CACHE_ENABLED or settings.USER_CACHE_REDIS_ENABLED:
+        await redis_client.script_load(FILL_SCRIPT)
+        await redis_client.script_load(INVALIDATE_SCRIPT)
+    if settings.TASK_EVENTS_ENABLED:
+        await redis_client.script_load(PUBLISH_SCRIPT)
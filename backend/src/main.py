@@ -1,27 +1,53 @@
 import logging
+from typing import TYPE_CHECKING, Any
 
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
-
-from src.users.presentation.api import user_api_router
-from src.tasks.presentation.api import task_api_router
-from src.auth.presentation.api import auth_api_router
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 
 logger = logging.getLogger(__name__)
 
 
-app = FastAPI(
-    title="ToDoMonolith",
-)
-
-
-app.add_middleware(
-    CORSMiddleware,
-    allow_credentials=True,
-)
-
-
-app.include_router(user_api_router)
-app.include_router(task_api_router)
-app.include_router(auth_api_router)
+def create_app() -> "FastAPI":
+    """
+    Build the application.
+
+    FastAPI, the routers and everything behind them are imported here rather
+    than at module import, which keeps importing `src.main` cheap; settings,
+    the database engine and the Redis client are created on first use.
+
+    :return: A new application instance.
+    """
+    from fastapi import FastAPI
+    from fastapi.middleware.cors import CORSMiddleware
+
+    from src.users.presentation.api import user_api_router
+    from src.tasks.presentation.api import task_api_router
+    from src.auth.presentation.api import auth_api_router
+    from src.core.presentation.api import health_api_router, metrics_api_router
+    from src.lifespan import lifespan
+
+    app = FastAPI(
+        title="ToDoMonolith",
+        lifespan=lifespan,
+    )
+
+    app.add_middleware(
+        CORSMiddleware,
+        allow_credentials=True,
+    )
+
+    app.include_router(user_api_router)
+    app.include_router(task_api_router)
+    app.include_router(auth_api_router)
+    app.include_router(metrics_api_router)
+    app.include_router(health_api_router)
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    # `src.main:app` builds the application on first access and keeps it.
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
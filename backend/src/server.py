@@ -0,0 +1,140 @@
+"""
+Production launcher of the API server.
+
+Runs the application under uvicorn with one worker process per available CPU,
+the uvloop event loop and the httptools HTTP parser:
+
+    python -m src.server --port 8000
+
+Every option can also be set through the environment variable named in its
+help. Each worker has its own database and Redis connection pools, so the
+number of database connections the server may open is
+`workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW)`.
+
+For development use `uvicorn src.main:app --reload` instead.
+"""
+import argparse
+import math
+import os
+from typing import Optional
+
+import uvicorn
+
+
+APP = "src.main:create_app"
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may run on.
+
+    Takes the CPU affinity mask and, inside a container, the cgroup v2 CPU
+    quota into account, either of which may be smaller than `os.cpu_count()`.
+
+    :return: Number of usable CPUs, at least 1.
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as cpu_max:
+            quota, period = cpu_max.read().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(1, cpus)
+
+
+def _env(name: str, default: Optional[str]) -> Optional[str]:
+    return os.environ.get(f"SERVER_{name}", default)
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """
+    Parse the command line, falling back to `SERVER_*` environment variables.
+
+    :param argv: Arguments to parse, the process arguments by default.
+    :return: Parsed options.
+    """
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=_env("HOST", "0.0.0.0"), help="SERVER_HOST")
+    parser.add_argument("--port", type=int, default=_env("PORT", "8000"), help="SERVER_PORT")
+    parser.add_argument(
+        "--workers", type=int, default=_env("WORKERS", "0"),
+        help="SERVER_WORKERS; worker processes, 0 for one per available CPU",
+    )
+    parser.add_argument("--loop", choices=["uvloop", "asyncio", "auto"], default=_env("LOOP", "uvloop"), help="SERVER_LOOP")
+    parser.add_argument("--http", choices=["httptools", "h11", "auto"], default=_env("HTTP", "httptools"), help="SERVER_HTTP")
+    parser.add_argument(
+        "--keep-alive", type=int, default=_env("KEEP_ALIVE", "65"),
+        help="SERVER_KEEP_ALIVE; seconds an idle connection is kept open, "
+             "keep it above the idle timeout of the load balancer in front",
+    )
+    parser.add_argument(
+        "--backlog", type=int, default=_env("BACKLOG", "2048"),
+        help="SERVER_BACKLOG; pending connections queued by the kernel, capped by net.core.somaxconn",
+    )
+    parser.add_argument(
+        "--limit-concurrency", type=int, default=_env("LIMIT_CONCURRENCY", "1000"),
+        help="SERVER_LIMIT_CONCURRENCY; connections and tasks per worker before answering 503, "
+             "0 for no limit; open WebSocket and event stream connections count too",
+    )
+    parser.add_argument(
+        "--graceful-shutdown", type=int, default=_env("GRACEFUL_SHUTDOWN", "25"),
+        help="SERVER_GRACEFUL_SHUTDOWN; seconds in-flight requests get to finish on SIGTERM, "
+             "keep it below the container's stop timeout",
+    )
+    parser.add_argument(
+        "--max-requests", type=int, default=_env("MAX_REQUESTS", "0"),
+        help="SERVER_MAX_REQUESTS; restart a worker after this many requests, 0 to never restart",
+    )
+    parser.add_argument(
+        "--forwarded-allow-ips", default=_env("FORWARDED_ALLOW_IPS", "127.0.0.1"),
+        help="SERVER_FORWARDED_ALLOW_IPS; proxies trusted to set X-Forwarded-* headers",
+    )
+    parser.add_argument("--log-level", default=_env("LOG_LEVEL", "info"), help="SERVER_LOG_LEVEL")
+    parser.add_argument(
+        "--access-log", action=argparse.BooleanOptionalAction,
+        default=_env("ACCESS_LOG", "false").lower() in ("1", "true", "yes"), help="SERVER_ACCESS_LOG",
+    )
+    return parser.parse_args(argv)
+
+
+def build_config(args: argparse.Namespace) -> dict:
+    """
+    Translate the options into uvicorn settings.
+
+    :param args: Parsed options.
+    :return: Keyword arguments for `uvicorn.run`.
+    """
+    max_requests = args.max_requests or None
+    return {
+        "host": args.host,
+        "port": args.port,
+        "workers": args.workers or available_cpus(),
+        "loop": args.loop,
+        "http": args.http,
+        "timeout_keep_alive": args.keep_alive,
+        "backlog": args.backlog,
+        "limit_concurrency": args.limit_concurrency or None,
+        "timeout_graceful_shutdown": args.graceful_shutdown,
+        # Jitter keeps the workers from restarting all at once.
+        "limit_max_requests": max_requests,
+        "limit_max_requests_jitter": max_requests // 10 if max_requests else 0,
+        "proxy_headers": True,
+        "forwarded_allow_ips": args.forwarded_allow_ips,
+        "server_header": False,
+        "log_level": args.log_level,
+        "access_log": args.access_log,
+        "lifespan": "on",
+    }
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    uvicorn.run(APP, factory=True, **build_config(parse_args(argv)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from datetime import datetime
-from typing import Any, Literal, Optional
+from typing import Annotated, Any, List, Literal, Optional, Union
+
+
+MAX_BATCH_SIZE = 1000
 
 
 class TaskDTO(BaseModel):
@@ -48,3 +51,206 @@ class TaskUpdateDTO(BaseModel):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[Literal["pending", "completed", "archived"]] = None
+
+
+class TaskPageDTO(BaseModel):
+    """
+    DTO representing one page of the task listing.
+
+    Attributes:
+        items (List[TaskDTO]): Tasks on the current page.
+        next_cursor (Optional[str]): Opaque cursor to pass as `cursor` to fetch the next page.
+    """
+    items: List[TaskDTO]
+    next_cursor: Optional[str] = None
+
+
+class TaskChangesDTO(BaseModel):
+    """
+    DTO representing one page of changes to the user's tasks.
+
+    Attributes:
+        tasks (List[TaskDTO]): Tasks created or updated since the cursor.
+        deleted_ids (List[int]): IDs of tasks deleted since the cursor.
+        next_cursor (str): Cursor to pass as `since` on the next sync.
+        has_more (bool): Whether more changes can be fetched right away with `next_cursor`.
+    """
+    tasks: List[TaskDTO]
+    deleted_ids: List[int]
+    next_cursor: str
+    has_more: bool
+
+
+class TaskEventDTO(BaseModel):
+    """
+    DTO representing a change to one of the user's tasks, sent as Server-Sent Event data.
+
+    Attributes:
+        type (Literal["created", "updated", "deleted", "reset"]): Kind of change; on "reset"
+            the client must resync, e.g. with `GET /api/tasks/changes`.
+        task_id (Optional[int]): ID of the changed task.
+        task (Optional[TaskDTO]): The task after the change; None for deletions.
+    """
+    type: Literal["created", "updated", "deleted", "reset"]
+    task_id: Optional[int] = None
+    task: Optional[TaskDTO] = None
+
+
+class TaskSuggestionDTO(BaseModel):
+    """
+    DTO representing one autocomplete suggestion.
+
+    Attributes:
+        id (int): ID of the suggested task.
+        title (str): Title of the suggested task.
+    """
+    id: int
+    title: str
+
+
+class TaskBatchCreateDTO(BaseModel):
+    """
+    DTO representing a batch of tasks to create.
+
+    Attributes:
+        items (List[TaskCreateDTO]): Tasks to create, at most `MAX_BATCH_SIZE`.
+    """
+    items: List[TaskCreateDTO] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class TaskBatchUpdateItemDTO(TaskUpdateDTO):
+    """
+    DTO representing one item of a batch update.
+
+    Attributes:
+        id (int): ID of the task to update.
+    """
+    id: int
+
+
+class TaskBatchUpdateDTO(BaseModel):
+    """
+    DTO representing a batch of task updates.
+
+    Attributes:
+        items (List[TaskBatchUpdateItemDTO]): Task updates, at most `MAX_BATCH_SIZE`.
+    """
+    items: List[TaskBatchUpdateItemDTO] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class TaskBatchDeleteDTO(BaseModel):
+    """
+    DTO representing a batch of tasks to delete.
+
+    Attributes:
+        ids (List[int]): IDs of the tasks to delete, at most `MAX_BATCH_SIZE`.
+    """
+    ids: List[int] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class TaskBatchResultDTO(BaseModel):
+    """
+    DTO representing the outcome of one item of a batch operation.
+
+    Attributes:
+        index (int): Position of the item in the batch request.
+        id (Optional[int]): ID of the affected task, if known.
+        task (Optional[TaskDTO]): Resulting task for create and update operations.
+        error (Optional[str]): Error description if the item was not applied.
+    """
+    index: int
+    id: Optional[int] = None
+    task: Optional[TaskDTO] = None
+    error: Optional[str] = None
+
+
+class TaskImportErrorDTO(BaseModel):
+    """
+    DTO representing one rejected row of a bulk import.
+
+    Attributes:
+        line (int): Line of the uploaded file where the row starts (1-based).
+        error (str): Why the row was rejected.
+    """
+    line: int
+    error: str
+
+
+class TaskImportReportDTO(BaseModel):
+    """
+    DTO representing the outcome of a bulk import.
+
+    Attributes:
+        imported (int): Number of tasks created.
+        failed (int): Number of rejected rows.
+        errors (List[TaskImportErrorDTO]): Rejected rows, possibly truncated.
+    """
+    imported: int
+    failed: int
+    errors: List[TaskImportErrorDTO]
+
+
+class TaskCreateOperationDTO(BaseModel):
+    """
+    DTO representing a task creation sent over the operations WebSocket.
+
+    Attributes:
+        op (Literal["create"]): Operation type.
+        ref (Optional[str]): Client reference echoed in the acknowledgement.
+        data (TaskCreateDTO): Task to create.
+    """
+    op: Literal["create"]
+    ref: Optional[str] = None
+    data: TaskCreateDTO
+
+
+class TaskUpdateOperationDTO(BaseModel):
+    """
+    DTO representing a task update sent over the operations WebSocket.
+
+    Attributes:
+        op (Literal["update"]): Operation type.
+        ref (Optional[str]): Client reference echoed in the acknowledgement.
+        data (TaskBatchUpdateItemDTO): ID of the task and its updated fields.
+    """
+    op: Literal["update"]
+    ref: Optional[str] = None
+    data: TaskBatchUpdateItemDTO
+
+
+class TaskDeleteOperationDTO(BaseModel):
+    """
+    DTO representing a task deletion sent over the operations WebSocket.
+
+    Attributes:
+        op (Literal["delete"]): Operation type.
+        ref (Optional[str]): Client reference echoed in the acknowledgement.
+        id (int): ID of the task to delete.
+    """
+    op: Literal["delete"]
+    ref: Optional[str] = None
+    id: int
+
+
+TaskOperationDTO = Annotated[
+    Union[TaskCreateOperationDTO, TaskUpdateOperationDTO, TaskDeleteOperationDTO],
+    Field(discriminator="op"),
+]
+
+
+class TaskOperationResultDTO(BaseModel):
+    """
+    DTO representing the acknowledgement of one operation sent over the operations WebSocket.
+
+    Attributes:
+        ref (Optional[str]): Client reference of the operation.
+        op (Optional[str]): Operation type; None if the message could not be parsed.
+        id (Optional[int]): ID of the affected task, if known.
+        task (Optional[TaskDTO]): Resulting task for create and update operations.
+        error (Optional[str]): Error description if the operation was not applied.
+    """
+    ref: Optional[str] = None
+    op: Optional[Literal["create", "update", "delete"]] = None
+    id: Optional[int] = None
+    task: Optional[TaskDTO] = None
+    error: Optional[str] = None
@@ -1,11 +1,11 @@
-from typing import Any, Literal, Optional
-from dataclasses import dataclass
+from typing import Any, List, Literal, Optional
+from dataclasses import dataclass, field
 from datetime import datetime
 
 from src.core.domain.entity_base import EntityBase
 
 
-@dataclass
+@dataclass(slots=True)
 class Task(EntityBase):
     """
     Entity model representing a task in the task list.
@@ -29,11 +29,11 @@ class Task(EntityBase):
     owner_id: int
     description: Optional[str] = None
     status: Literal["pending", "completed", "archived"] = "pending"
-    created_at: datetime = datetime.now()
-    updated_at: datetime = datetime.now()
+    created_at: datetime = field(default_factory=datetime.now)
+    updated_at: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskCreate(EntityBase):
     """
     Entity model representing the data for creating a new task.
@@ -47,7 +47,7 @@ class TaskCreate(EntityBase):
     description: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskUpdate(EntityBase):
     """
     Entity model representing the data for updating an existing task.
@@ -64,3 +64,130 @@ class TaskUpdate(EntityBase):
     title: Optional[str] = None
     description: Optional[str] = None
     status: Optional[Literal["pending", "completed", "archived"]] = None
+
+
+@dataclass(slots=True)
+class TaskPage(EntityBase):
+    """
+    Entity model representing one page of a keyset-paginated task listing.
+
+    Attributes:
+        items (List[Task]): Tasks on the current page.
+        next_cursor (Optional[str]): Opaque cursor of the next page, None on the last page.
+    """
+    items: List[Task] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TaskChanges(EntityBase):
+    """
+    Entity model representing one page of changes to an owner's tasks.
+
+    Attributes:
+        tasks (List[Task]): Tasks created or updated after the cursor.
+        deleted_ids (List[int]): IDs of tasks deleted after the cursor.
+        next_cursor (str): Opaque high-water-mark cursor to pass as `since` next time.
+        has_more (bool): Whether more changes are available right away.
+    """
+    next_cursor: str
+    tasks: List[Task] = field(default_factory=list)
+    deleted_ids: List[int] = field(default_factory=list)
+    has_more: bool = False
+
+
+@dataclass(slots=True)
+class TaskEvent(EntityBase):
+    """
+    Entity model representing a change to one of an owner's tasks, as pushed to subscribers.
+
+    Attributes:
+        type (str): "created", "updated" or "deleted"; "reset" tells the
+                    subscriber that events were lost and it must resync.
+        owner_id (int): ID of the tasks owner.
+        task_id (Optional[int]): ID of the changed task.
+        task (Optional[Task]): The task after the change; None for deletions.
+        id (Optional[str]): Event ID, assigned on publishing; used to resume.
+    """
+    type: Literal["created", "updated", "deleted", "reset"]
+    owner_id: int
+    task_id: Optional[int] = None
+    task: Optional[Task] = None
+    id: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TaskSuggestion(EntityBase):
+    """
+    Entity model representing one autocomplete suggestion.
+
+    Attributes:
+        id (int): ID of the suggested task.
+        title (str): Title of the suggested task.
+    """
+    id: int
+    title: str
+
+
+@dataclass(slots=True)
+class TaskBatchResult(EntityBase):
+    """
+    Entity model representing the outcome of one item of a batch operation.
+
+    Attributes:
+        index (int): Position of the item in the batch request.
+        id (Optional[int]): ID of the affected task, if known.
+        task (Optional[Task]): Resulting task for create and update operations.
+        error (Optional[str]): Error description if the item was not applied.
+    """
+    index: int
+    id: Optional[int] = None
+    task: Optional[Task] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TaskOperationResult(EntityBase):
+    """
+    Entity model representing the outcome of one operation of a stream of task operations.
+
+    Attributes:
+        ref (Optional[str]): Client reference of the operation.
+        op (Optional[str]): Operation type: "create", "update" or "delete".
+        id (Optional[int]): ID of the affected task, if known.
+        task (Optional[Task]): Resulting task for create and update operations.
+        error (Optional[str]): Error description if the operation was not applied.
+    """
+    ref: Optional[str] = None
+    op: Optional[Literal["create", "update", "delete"]] = None
+    id: Optional[int] = None
+    task: Optional[Task] = None
+    error: Optional[str] = None
+
+
+@dataclass(slots=True)
+class TaskImportError(EntityBase):
+    """
+    Entity model representing one rejected row of a bulk import.
+
+    Attributes:
+        line (int): Line of the uploaded file where the row starts (1-based).
+        error (str): Why the row was rejected.
+    """
+    line: int
+    error: str
+
+
+@dataclass(slots=True)
+class TaskImportReport(EntityBase):
+    """
+    Entity model representing the outcome of a bulk import.
+
+    Attributes:
+        imported (int): Number of tasks created.
+        failed (int): Number of rejected rows.
+        errors (List[TaskImportError]): Rejected rows, possibly truncated.
+    """
+    imported: int = 0
+    failed: int = 0
+    errors: List[TaskImportError] = field(default_factory=list)
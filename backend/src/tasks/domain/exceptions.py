@@ -1,4 +1,6 @@
-from src.core.domain.exceptions.exceptions import AlreadyExists, NotFound
+from fastapi import status
+
+from src.core.domain.exceptions.exceptions import AlreadyExists, AppException, NotFound
 
 
 class TaskAlreadyExists(AlreadyExists):
@@ -7,3 +9,8 @@ class TaskAlreadyExists(AlreadyExists):
 
 class TaskNotFound(NotFound):
     detail = "Task with this ID not found"
+
+
+class TaskSyncExpired(AppException):
+    status_code = status.HTTP_410_GONE
+    detail = "Deletions since this sync cursor are no longer retained; sync again without it"
@@ -0,0 +1,68 @@
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from src.tasks.domain.entities import Task
+
+
+class ITaskCache(ABC):
+    """
+    Interface for a cache of task entities.
+
+    Sits in front of the task repository for reads. Besides tasks, it remembers
+    IDs known to be missing for a short time (negative caching).
+
+    Every task has a version, bumped by each invalidation. Readers take the
+    version before loading a task from the database and pass it back when
+    filling the cache; the fill is refused if a write invalidated the task in
+    between, so a stale read never outlives the write that superseded it.
+    """
+
+    @abstractmethod
+    async def get(self, task_id: int) -> Optional[Task]:
+        """
+        Return a cached task.
+
+        :param task_id: ID of the task.
+        :return: The cached Task entity, or None on a cache miss.
+        :raises TaskNotFound: If the task is cached as missing.
+        """
+        pass
+
+    @abstractmethod
+    async def version(self, task_id: int) -> Optional[int]:
+        """
+        Return the current version of a task, to be read before loading it.
+
+        :param task_id: ID of the task.
+        :return: The version, or None if it is unknown and the cache must not be filled.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, task: Task, version: Optional[int]) -> None:
+        """
+        Store a task in the cache unless it has been invalidated since `version`.
+
+        :param task: Task entity to cache.
+        :param version: Version of the task read before loading it.
+        """
+        pass
+
+    @abstractmethod
+    async def set_missing(self, task_id: int, version: Optional[int]) -> None:
+        """
+        Remember that a task does not exist, unless it has been invalidated since `version`.
+
+        :param task_id: ID of the missing task.
+        :param version: Version of the task read before looking it up.
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, task_ids: Iterable[int]) -> None:
+        """
+        Drop tasks from the cache and bump their versions.
+
+        :param task_ids: IDs of the tasks.
+        """
+        pass
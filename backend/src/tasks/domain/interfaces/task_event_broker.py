@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from typing import AsyncContextManager, Optional
+
+from src.tasks.domain.entities import TaskEvent
+
+
+class ITaskEventSubscription(ABC):
+    """
+    Interface for one subscriber's feed of task events.
+    """
+
+    @abstractmethod
+    async def get(self) -> Optional[TaskEvent]:
+        """
+        Wait for the next event.
+
+        :return: The next event, or None once the subscription is closed,
+                 e.g. because the subscriber fell behind.
+        """
+        pass
+
+
+class ITaskEventBroker(ABC):
+    """
+    Interface for subscribing to the events of an owner's tasks.
+    """
+
+    @abstractmethod
+    def subscribe(self, owner_id: int, last_event_id: Optional[str] = None) -> AsyncContextManager[ITaskEventSubscription]:
+        """
+        Subscribe to the owner's task events.
+
+        :param owner_id: ID of the tasks owner.
+        :param last_event_id: ID of the last event the subscriber saw; events
+                              published after it are delivered first.
+        :return: Async context manager yielding the subscription.
+        """
+        pass
@@ -0,0 +1,22 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.tasks.domain.entities import TaskEvent
+
+
+class ITaskEventPublisher(ABC):
+    """
+    Interface for publishing changes to tasks to their owner's subscribers.
+
+    Publishing is best effort: it happens after commit, and subscribers that
+    miss events resync through delta sync.
+    """
+
+    @abstractmethod
+    async def publish(self, events: List[TaskEvent]) -> None:
+        """
+        Publish events, in order.
+
+        :param events: Events to publish.
+        """
+        pass
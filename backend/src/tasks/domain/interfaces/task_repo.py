@@ -1,8 +1,8 @@
+import datetime
 from abc import ABC, abstractmethod
-from typing import List
+from typing import AsyncIterator, List, Literal, Optional
 
-from src.tasks.domain.entities import Task, TaskCreate, TaskUpdate
-from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+from src.tasks.domain.entities import Task, TaskChanges, TaskCreate, TaskPage, TaskSuggestion, TaskUpdate
 
 
 class ITaskRepo(ABC):
@@ -14,7 +14,7 @@ class ITaskRepo(ABC):
     """
 
     @abstractmethod
-    async def add(self, task: TaskCreate, user_uow: IUserUnitOfWork) -> Task:
+    async def add(self, task: TaskCreate) -> Task:
         """
         Add a new task to the repository.
 
@@ -51,3 +51,183 @@ class ITaskRepo(ABC):
         :param task_id: ID of the task to delete.
         """
         pass
+
+    @abstractmethod
+    async def get_for_owner(self, task_id: int, owner_id: int) -> Task:
+        """
+        Retrieve a task by its ID if it belongs to the given owner.
+
+        Tasks of other owners are reported as not found.
+
+        :param task_id: ID of the task.
+        :param owner_id: ID of the tasks owner.
+        :return: The matching Task entity.
+        """
+        pass
+
+    @abstractmethod
+    async def update_for_owner(self, task: TaskUpdate, owner_id: int) -> Task:
+        """
+        Update task information if the task belongs to the given owner.
+
+        Tasks of other owners are reported as not found.
+
+        :param task: Task entity with updated data.
+        :param owner_id: ID of the tasks owner.
+        :return: The updated Task entity.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_for_owner(self, task_id: int, owner_id: int) -> None:
+        """
+        Delete a task by ID if it belongs to the given owner.
+
+        Tasks of other owners are reported as not found.
+
+        :param task_id: ID of the task to delete.
+        :param owner_id: ID of the tasks owner.
+        """
+        pass
+
+    @abstractmethod
+    async def list_for_owner(
+        self,
+        owner_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[Literal["pending", "completed", "archived"]] = None,
+    ) -> TaskPage:
+        """
+        Return one page of the owner's tasks, newest first.
+
+        Pagination is keyset-based: the cursor encodes the position of the last
+        returned task, so the cost of a page does not depend on its depth.
+
+        :param owner_id: ID of the tasks owner.
+        :param limit: Maximum number of tasks on the page.
+        :param cursor: Opaque cursor returned with the previous page.
+        :param status: Optional status filter.
+        :return: The requested page of tasks.
+        """
+        pass
+
+    @abstractmethod
+    def stream_for_owner(self, owner_id: int, batch_size: int) -> AsyncIterator[List[Task]]:
+        """
+        Iterate over all of the owner's tasks in ID order, batch by batch.
+
+        Only one batch is held in memory at a time.
+
+        :param owner_id: ID of the tasks owner.
+        :param batch_size: Number of tasks per batch.
+        :return: Async iterator of task batches.
+        """
+        pass
+
+    @abstractmethod
+    async def changes_since(self, owner_id: int, cursor: Optional[str], limit: int) -> TaskChanges:
+        """
+        Return the owner's tasks created or updated, and IDs of tasks deleted, after a cursor.
+
+        :param owner_id: ID of the tasks owner.
+        :param cursor: Cursor returned by the previous call; None to start from
+            the beginning, with live tasks only and no earlier deletions.
+        :param limit: Maximum number of tasks, and of deleted IDs, on the page.
+        :return: The changes and the cursor to continue from.
+        :raises TaskSyncExpired: If deletions after the cursor may have been pruned.
+        """
+        pass
+
+    @abstractmethod
+    async def prune_tombstones(self, older_than: datetime.timedelta, limit: int) -> int:
+        """
+        Delete records of task deletions older than the retention period.
+
+        :param older_than: Retention period of the records.
+        :param limit: Maximum number of records to delete.
+        :return: Number of records deleted.
+        """
+        pass
+
+    @abstractmethod
+    async def search(self, owner_id: int, query: str, cursor: Optional[str], limit: int) -> TaskPage:
+        """
+        Return one page of the owner's tasks matching a full-text query, best match first.
+
+        :param owner_id: ID of the tasks owner.
+        :param query: Search query.
+        :param cursor: Opaque cursor returned with the previous page.
+        :param limit: Maximum number of tasks on the page.
+        :return: The requested page of tasks.
+        """
+        pass
+
+    @abstractmethod
+    async def autocomplete(self, owner_id: int, prefix: str, limit: int, timeout_ms: Optional[int] = None) -> List[TaskSuggestion]:
+        """
+        Return the owner's tasks whose titles best complete a typed prefix.
+
+        Titles starting with the prefix come first, followed by titles similar to it.
+
+        :param owner_id: ID of the tasks owner.
+        :param prefix: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :param timeout_ms: Time budget of the lookup; when exceeded, no suggestions are returned.
+        :return: Suggestions, best first.
+        """
+        pass
+
+    @abstractmethod
+    async def add_many(self, tasks: List[TaskCreate]) -> List[Task]:
+        """
+        Add several tasks in a single statement.
+
+        :param tasks: Task entities to be added.
+        :return: The created Task entities, in input order.
+        """
+        pass
+
+    @abstractmethod
+    async def stage_many(self, tasks: List[TaskCreate]) -> None:
+        """
+        Stage tasks for a bulk import within the current transaction.
+
+        :param tasks: Domain models representing the tasks to be imported.
+        """
+        pass
+
+    @abstractmethod
+    async def merge_staged(self) -> int:
+        """
+        Create all staged tasks at once.
+
+        :return: Number of tasks created.
+        """
+        pass
+
+    @abstractmethod
+    async def update_many(self, tasks: List[TaskUpdate], owner_id: int) -> List[Task]:
+        """
+        Update several tasks of one owner in a single statement.
+
+        Tasks that do not exist or belong to another owner are skipped.
+
+        :param tasks: Task entities with updated data, one per task ID.
+        :param owner_id: ID of the tasks owner.
+        :return: The updated Task entities.
+        """
+        pass
+
+    @abstractmethod
+    async def delete_many(self, task_ids: List[int], owner_id: int) -> List[int]:
+        """
+        Delete several tasks of one owner in a single statement.
+
+        Tasks that do not exist or belong to another owner are skipped.
+
+        :param task_ids: IDs of the tasks to delete.
+        :param owner_id: ID of the tasks owner.
+        :return: IDs of the deleted tasks.
+        """
+        pass
@@ -0,0 +1,37 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.tasks.domain.entities import TaskSuggestion
+
+
+class ITaskSuggestionCache(ABC):
+    """
+    Interface for a short-lived cache of autocomplete suggestions.
+
+    Entries are keyed by owner, prefix and limit, and are not invalidated
+    on writes: they only live long enough to absorb repeated keystrokes.
+    """
+
+    @abstractmethod
+    async def get(self, owner_id: int, prefix: str, limit: int) -> Optional[List[TaskSuggestion]]:
+        """
+        Return cached suggestions.
+
+        :param owner_id: ID of the tasks owner.
+        :param prefix: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :return: Cached suggestions, or None on a cache miss.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, owner_id: int, prefix: str, limit: int, suggestions: List[TaskSuggestion]) -> None:
+        """
+        Store suggestions in the cache.
+
+        :param owner_id: ID of the tasks owner.
+        :param prefix: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :param suggestions: Suggestions to cache.
+        """
+        pass
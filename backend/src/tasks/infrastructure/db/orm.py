@@ -2,7 +2,8 @@ from typing import Any, Optional
 import datetime
 import enum
 
-from sqlalchemy import Integer, String, Text, DateTime, Enum, ForeignKey
+from sqlalchemy import BigInteger, Column, Integer, MetaData, String, Table, Text, DateTime, Enum, ForeignKey, Index, Computed
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.db.base import Base
@@ -14,8 +15,30 @@ class TaskStatus(enum.Enum):
     archived = "archived"
 
 
+# Title matches rank above description matches. The 'simple' configuration
+# neither stems nor drops stop words, so it suits short, multilingual tasks.
+SEARCH_VECTOR_EXPRESSION = (
+    "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')"
+)
+
+
 class DBTask(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_owner_id_created_at_id", "owner_id", "created_at", "id"),
+        Index("ix_tasks_owner_id_id", "owner_id", "id"),
+        Index("ix_tasks_owner_id_updated_at_id", "owner_id", "updated_at", "id"),
+        # Needs the btree_gin extension for the owner_id column, created by
+        # migration e4b9a1c6d253; autogenerate does not emit CREATE EXTENSION.
+        Index("ix_tasks_owner_id_search_vector", "owner_id", "search_vector", postgresql_using="gin"),
+        # Needs the pg_trgm extension, created by migration f15c3b8e7a92;
+        # serves title prefix and similarity lookups.
+        Index(
+            "ix_tasks_owner_id_title_trgm", "owner_id", "title",
+            postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -23,5 +46,46 @@ class DBTask(Base):
     status: Mapped[TaskStatus] = mapped_column(Enum(TaskStatus), default=TaskStatus.pending)
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None))
     updated_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None), onupdate=lambda: datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None))
-    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id')) 
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id', ondelete="CASCADE"))
     owner: Mapped[Any] = relationship("DBUser", back_populates="tasks")
+    # Generated by the database; deferred so that ORM queries do not load it.
+    search_vector: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_EXPRESSION, persisted=True),
+        deferred=True,
+    )
+
+
+class DBTaskTombstone(Base):
+    """
+    Record of a deleted task, kept so that delta sync can report the deletion.
+
+    Attributes:
+        task_id (int): ID of the deleted task.
+        owner_id (int): ID of the owner of the deleted task.
+        deleted_at (datetime): Date and time of the deletion (UTC).
+    """
+    __tablename__ = "task_tombstones"
+    __table_args__ = (
+        Index("ix_task_tombstones_owner_id_deleted_at_task_id", "owner_id", "deleted_at", "task_id"),
+        Index("ix_task_tombstones_deleted_at", "deleted_at"),
+    )
+
+    task_id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    owner_id: Mapped[int] = mapped_column(Integer, ForeignKey('users.id', ondelete="CASCADE"))
+    deleted_at: Mapped[datetime.datetime] = mapped_column(DateTime, default=lambda: datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None))
+
+
+# Per-transaction staging table of bulk imports, filled with COPY and merged
+# into `tasks` in one statement. It is created on demand and dropped on
+# commit, so it lives in its own metadata, outside of migrations.
+task_import_staging = Table(
+    "task_import_staging",
+    MetaData(),
+    Column("position", BigInteger, nullable=False),
+    Column("title", String, nullable=False),
+    Column("description", Text, nullable=True),
+    Column("owner_id", Integer, nullable=False),
+    prefixes=["TEMPORARY"],
+    postgresql_on_commit="DROP",
+)
@@ -1,14 +1,35 @@
-from typing import List
+import datetime
+import logging
+from typing import AsyncIterator, Callable, List, Literal, Optional
 
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import REAL, Integer, String, Text, any_, cast, column, delete, func, insert, literal, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import ARRAY, REGCONFIG
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import DBAPIError, IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.schema import CreateTable
 
-from src.tasks.domain.entities import Task, TaskCreate, TaskUpdate
-from src.tasks.domain.exceptions import TaskNotFound, TaskAlreadyExists
+from src.core.domain.pagination import InvalidCursor, decode_cursor, encode_cursor
+from src.core.config import settings
+from src.core.infrastructure.metrics import metrics
+from src.tasks.domain.entities import Task, TaskChanges, TaskCreate, TaskPage, TaskSuggestion, TaskUpdate
+from src.tasks.domain.exceptions import TaskNotFound, TaskAlreadyExists, TaskSyncExpired
+from src.tasks.domain.interfaces.task_cache import ITaskCache
 from src.tasks.domain.interfaces.task_repo import ITaskRepo
-from src.tasks.infrastructure.db.orm import DBTask, TaskStatus
-from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+from src.tasks.infrastructure.db.orm import DBTask, DBTaskTombstone, TaskStatus, task_import_staging
+from src.users.domain.exceptions import UserNotFound
+
+
+logger = logging.getLogger(__name__)
+
+FOREIGN_KEY_VIOLATION = "23503"
+QUERY_CANCELED = "57014"
+
+# Columns returned by INSERT/UPDATE ... RETURNING; the generated search vector is never needed.
+TASK_COLUMNS = tuple(c for c in DBTask.__table__.c if c.key != "search_vector")
+
+# Position of a delta sync that has not seen any change yet.
+SYNC_START = (datetime.datetime(1970, 1, 1), 0)
 
 
 class PGTaskRepo(ITaskRepo):
@@ -19,93 +40,679 @@ class PGTaskRepo(ITaskRepo):
 
     Attributes:
         session (AsyncSession): The database session used for all operations.
+        cache (ITaskCache | None): Optional read-through cache for `get_by_id`.
+        dirty_ids (set[int]): IDs of tasks written in the current transaction;
+            the unit of work invalidates them in the cache after commit.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession | Callable[[], AsyncSession], cache: ITaskCache | None = None) -> None:
         """
-        Initialize the repository with an active database session.
+        Initialize the repository with a database session.
 
-        :param session: Async SQLAlchemy session.
+        :param session: Async SQLAlchemy session, or a callable returning it on first use.
+        :param cache: Optional read-through cache for `get_by_id`.
         """
-        self.session = session
+        self._session = session
+        self.cache = cache
+        self.dirty_ids: set[int] = set()
+        self._staged = 0
 
-    async def add(self, task: TaskCreate, user_uow: IUserUnitOfWork) -> Task:
+    @property
+    def session(self) -> AsyncSession:
+        """
+        Database session, resolved on first use so that repository calls
+        served without a query never create one.
+        """
+        if callable(self._session):
+            self._session = self._session()
+        return self._session
+
+    async def add(self, task: TaskCreate) -> Task:
         """
         Create a new task in the database.
 
+        The owner is referenced by `owner_id` only; its existence is enforced
+        by the foreign key instead of a separate lookup.
+
         :param task: Domain model representing the task to be created.
         :return: The created task as a domain model.
+        :raises UserNotFound: if the owner does not exist.
         :raises TaskAlreadyExists: if a task with the same unique fields already exists.
         """
-        async with user_uow:
-            owner = await user_uow.users.get_by_pk(task.owner_id, to_domain=False)
-        obj = DBTask(**task.dict, owner=owner)
+        obj = DBTask(**task.dict)
         self.session.add(obj)
 
         try:
             await self.session.flush()
         except IntegrityError as e:
             await self.session.rollback()
+            if getattr(e.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+                raise UserNotFound(detail=f"User with id {task.owner_id} not found")
             raise TaskAlreadyExists(detail=str(e.orig))
 
+        # The new ID may still be cached as missing.
+        self.dirty_ids.add(obj.id)
         return self._to_domain(obj)
 
     async def get_by_id(self, task_id: int) -> Task:
         """
         Return a task by primary key (ID).
 
+        Served from the cache when possible. Tasks written in the current
+        transaction bypass the cache so that uncommitted state is never cached,
+        and the cache version is read before the database, so a fill racing
+        with another transaction's write is refused.
+
         :param pk: Task ID.
         :return: The retrieved task as a domain model.
         :raises TaskNotFound: If no task with the given ID exists.
         """
+        use_cache = self.cache is not None and task_id not in self.dirty_ids
+        if use_cache:
+            cached = await self.cache.get(task_id)
+            if cached is not None:
+                return cached
+            version = await self.cache.version(task_id)
+
         obj: DBTask | None = await self.session.get(DBTask, task_id)
         if not obj:
+            if use_cache:
+                await self.cache.set_missing(task_id, version)
             raise TaskNotFound(detail=f"Task with id {task_id} not found")
 
-        return self._to_domain(obj)
+        task = self._to_domain(obj)
+        if use_cache:
+            await self.cache.set(task, version)
+        return task
+
+    async def get_for_owner(self, task_id: int, owner_id: int) -> Task:
+        """
+        Return a task by primary key (ID) if it belongs to the owner.
+
+        The owner is matched in the same statement, backed by the
+        (owner_id, id) index. Cached tasks are checked against the owner and
+        filled as in `get_by_id`. A miss is not negatively cached, since the
+        task may belong to another owner.
+
+        :param task_id: Task ID.
+        :param owner_id: ID of the tasks owner.
+        :return: The retrieved task as a domain model.
+        :raises TaskNotFound: If the owner has no task with the given ID.
+        """
+        use_cache = self.cache is not None and task_id not in self.dirty_ids
+        if use_cache:
+            cached = await self.cache.get(task_id)
+            if cached is not None:
+                if cached.owner_id != owner_id:
+                    raise TaskNotFound(detail=f"Task with id {task_id} not found")
+                return cached
+            version = await self.cache.version(task_id)
+
+        stmt = select(DBTask).where(DBTask.id == task_id, DBTask.owner_id == owner_id)
+        result = await self.session.execute(stmt)
+        obj: DBTask | None = result.scalar_one_or_none()
+        if not obj:
+            raise TaskNotFound(detail=f"Task with id {task_id} not found")
+
+        task = self._to_domain(obj)
+        if use_cache:
+            await self.cache.set(task, version)
+        return task
 
     async def update(self, task: TaskUpdate) -> Task:
         """
         Update task fields based on input data.
 
+        Issues a single UPDATE ... RETURNING setting the fields that are not None;
+        `updated_at` is refreshed by the column's `onupdate`.
+
         :param task_data: Domain model containing updated task fields.
         :return: Updated task as a domain model.
         :raises TaskNotFound: If the task with the specified ID does not exist.
         """
-        stmt = select(DBTask).where(DBTask.id == task.id)
-        result = await self.session.execute(stmt)
-        obj: DBTask | None = result.scalar_one_or_none()
-
-        if not obj:
-            raise TaskNotFound(detail=f"Task with id {task.id} not found")
-        
-        print(task.dict)
-        for field, value in task.dict.items():
-            if value is not None:
-                if field == 'status':
-                    value = TaskStatus[value]
-                setattr(obj, field, value)
+        return await self._update(task)
 
-        await self.session.flush()
+    async def update_for_owner(self, task: TaskUpdate, owner_id: int) -> Task:
+        """
+        Update task fields if the task belongs to the owner, as in `update`.
 
-        return self._to_domain(obj)
+        :param task: Domain model containing updated task fields.
+        :param owner_id: ID of the tasks owner.
+        :return: Updated task as a domain model.
+        :raises TaskNotFound: If the owner has no task with the specified ID.
+        """
+        return await self._update(task, owner_id=owner_id)
 
     async def delete(self, task_id: int) -> None:
         """
-        Delete a task by primary key (ID).
+        Delete a task by primary key (ID) with a single DELETE ... RETURNING.
 
         :param pk: ID of the task to delete.
         :raises TaskNotFound: If the task with the given ID does not exist.
         """
-        obj = await self.session.get(DBTask, task_id)
-        if not obj:
+        await self._delete(task_id)
+
+    async def delete_for_owner(self, task_id: int, owner_id: int) -> None:
+        """
+        Delete a task if it belongs to the owner, as in `delete`.
+
+        :param task_id: ID of the task to delete.
+        :param owner_id: ID of the tasks owner.
+        :raises TaskNotFound: If the owner has no task with the given ID.
+        """
+        await self._delete(task_id, owner_id=owner_id)
+
+    async def list_for_owner(
+        self,
+        owner_id: int,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[Literal["pending", "completed", "archived"]] = None,
+    ) -> TaskPage:
+        """
+        Return one page of the owner's tasks ordered by (created_at, id) descending.
+
+        Seeks past the cursor position instead of using OFFSET, which lets
+        PostgreSQL walk the (owner_id, created_at, id) index directly to the page.
+
+        :param owner_id: ID of the tasks owner.
+        :param limit: Maximum number of tasks on the page.
+        :param cursor: Opaque cursor returned with the previous page.
+        :param status: Optional status filter.
+        :return: The requested page of tasks.
+        :raises InvalidCursor: If the cursor is malformed.
+        """
+        stmt = select(DBTask).where(DBTask.owner_id == owner_id)
+        if status is not None:
+            stmt = stmt.where(DBTask.status == TaskStatus[status])
+        if cursor is not None:
+            created_at, task_id = decode_cursor(cursor, size=2)
+            try:
+                position = (datetime.datetime.fromisoformat(created_at), int(task_id))
+            except (TypeError, ValueError):
+                raise InvalidCursor()
+            stmt = stmt.where(tuple_(DBTask.created_at, DBTask.id) < position)
+
+        # One extra row tells whether another page exists without a COUNT query.
+        stmt = stmt.order_by(DBTask.created_at.desc(), DBTask.id.desc()).limit(limit + 1)
+        result = await self.session.execute(stmt)
+        rows = result.scalars().all()
+
+        items = [self._to_domain(obj) for obj in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = items[-1]
+            next_cursor = encode_cursor(last.created_at.isoformat(), last.id)
+
+        return TaskPage(items=items, next_cursor=next_cursor)
+
+    async def stream_for_owner(self, owner_id: int, batch_size: int) -> AsyncIterator[List[Task]]:
+        """
+        Iterate over all of the owner's tasks in ID order, batch by batch.
+
+        Rows are fetched through a server-side cursor (`AsyncSession.stream`),
+        `batch_size` at a time, so memory does not grow with the number of
+        tasks. The cursor needs a transaction, so the session must not be in
+        AUTOCOMMIT mode, and it holds its connection until iteration ends.
+
+        :param owner_id: ID of the tasks owner.
+        :param batch_size: Number of tasks per batch.
+        :return: Async iterator of task batches.
+        """
+        stmt = (
+            select(*TASK_COLUMNS)
+            .where(DBTask.owner_id == owner_id)
+            .order_by(DBTask.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.session.stream(stmt)
+        try:
+            async for partition in result.partitions():
+                yield [self._to_domain(row) for row in partition]
+        finally:
+            await result.close()
+
+    async def changes_since(self, owner_id: int, cursor: Optional[str], limit: int) -> TaskChanges:
+        """
+        Return the owner's tasks created or updated, and IDs of tasks deleted, after a cursor.
+
+        Changed tasks are read by (updated_at, id) through the
+        (owner_id, updated_at, id) index, deletions by (deleted_at, task_id)
+        from the tombstone table; the cursor keeps both positions. Changes
+        younger than `TASK_SYNC_SETTLE_SECONDS` are left for the next call,
+        so that transactions committing slightly out of timestamp order are
+        never skipped.
+
+        A first sync reports no deletions: the client has nothing to delete
+        yet. Once all deletions up to the settle point have been read, the
+        deletion position moves up to it, so the cursor of a client syncing
+        regularly never falls behind the `TASK_TOMBSTONE_RETENTION_DAYS`
+        after which tombstones are pruned; older cursors are refused.
+
+        :param owner_id: ID of the tasks owner.
+        :param cursor: Cursor returned by the previous call; None to start from the beginning.
+        :param limit: Maximum number of tasks, and of deleted IDs, on the page.
+        :return: The changes and the cursor to continue from.
+        :raises InvalidCursor: If the cursor is malformed.
+        :raises TaskSyncExpired: If deletions after the cursor may have been pruned.
+        """
+        now = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None)
+        settled = now - datetime.timedelta(seconds=settings.TASK_SYNC_SETTLE_SECONDS)
+        if cursor is None:
+            task_position, tombstone_position = SYNC_START, None
+        else:
+            updated_at, task_id, deleted_at, deleted_id = decode_cursor(cursor, size=4)
+            try:
+                task_position = (datetime.datetime.fromisoformat(updated_at), int(task_id))
+                tombstone_position = (datetime.datetime.fromisoformat(deleted_at), int(deleted_id))
+            except (TypeError, ValueError):
+                raise InvalidCursor()
+            if tombstone_position[0] < now - datetime.timedelta(days=settings.TASK_TOMBSTONE_RETENTION_DAYS):
+                raise TaskSyncExpired()
+
+        task_stmt = (
+            select(DBTask)
+            .where(
+                DBTask.owner_id == owner_id,
+                tuple_(DBTask.updated_at, DBTask.id) > task_position,
+                DBTask.updated_at < settled,
+            )
+            .order_by(DBTask.updated_at, DBTask.id)
+            .limit(limit + 1)
+        )
+        tasks = (await self.session.execute(task_stmt)).scalars().all()
+
+        tombstones = []
+        if tombstone_position is not None:
+            tombstone_stmt = (
+                select(DBTaskTombstone.task_id, DBTaskTombstone.deleted_at)
+                .where(
+                    DBTaskTombstone.owner_id == owner_id,
+                    tuple_(DBTaskTombstone.deleted_at, DBTaskTombstone.task_id) > tombstone_position,
+                    DBTaskTombstone.deleted_at < settled,
+                )
+                .order_by(DBTaskTombstone.deleted_at, DBTaskTombstone.task_id)
+                .limit(limit + 1)
+            )
+            tombstones = (await self.session.execute(tombstone_stmt)).all()
+
+        has_more = len(tasks) > limit or len(tombstones) > limit
+        if len(tombstones) > limit:
+            tombstones = tombstones[:limit]
+            tombstone_position = (tombstones[-1].deleted_at, tombstones[-1].task_id)
+        else:
+            # Every deletion up to the settle point has been read.
+            tombstone_position = (settled, 0)
+        tasks = tasks[:limit]
+        if tasks:
+            task_position = (tasks[-1].updated_at, tasks[-1].id)
+
+        return TaskChanges(
+            tasks=[self._to_domain(obj) for obj in tasks],
+            deleted_ids=[row.task_id for row in tombstones],
+            next_cursor=encode_cursor(
+                task_position[0].isoformat(), task_position[1],
+                tombstone_position[0].isoformat(), tombstone_position[1],
+            ),
+            has_more=has_more,
+        )
+
+    async def prune_tombstones(self, older_than: datetime.timedelta, limit: int) -> int:
+        """
+        Delete up to `limit` tombstones of tasks deleted more than `older_than` ago.
+
+        The oldest tombstones are found through the deleted_at index and
+        locked with SKIP LOCKED, so workers pruning at the same time split
+        the work instead of waiting on each other.
+
+        :param older_than: Retention period of tombstones.
+        :param limit: Maximum number of tombstones to delete.
+        :return: Number of tombstones deleted.
+        """
+        deleted_before = datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None) - older_than
+        expired = (
+            select(DBTaskTombstone.task_id)
+            .where(DBTaskTombstone.deleted_at < deleted_before)
+            .order_by(DBTaskTombstone.deleted_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = delete(DBTaskTombstone).where(DBTaskTombstone.task_id.in_(expired.scalar_subquery()))
+        result = await self.session.execute(stmt)
+        return result.rowcount
+
+    async def search(self, owner_id: int, query: str, cursor: Optional[str], limit: int) -> TaskPage:
+        """
+        Return one page of the owner's tasks matching a full-text query, best match first.
+
+        The query uses web search syntax (quoted phrases, `or`, `-word`) and is
+        matched against the generated `search_vector` column through the
+        (owner_id, search_vector) GIN index. Pages are keyset-paginated by
+        (rank, id).
+
+        :param owner_id: ID of the tasks owner.
+        :param query: Search query.
+        :param cursor: Opaque cursor returned with the previous page.
+        :param limit: Maximum number of tasks on the page.
+        :return: The requested page of tasks.
+        :raises InvalidCursor: If the cursor is malformed.
+        """
+        ts_query = func.websearch_to_tsquery(literal("simple").cast(REGCONFIG), query)
+        rank = func.ts_rank(DBTask.search_vector, ts_query).label("rank")
+        stmt = (
+            select(*TASK_COLUMNS, rank)
+            .where(DBTask.owner_id == owner_id, DBTask.search_vector.bool_op("@@")(ts_query))
+        )
+        if cursor is not None:
+            last_rank, task_id = decode_cursor(cursor, size=2)
+            try:
+                position = (cast(float(last_rank), REAL), int(task_id))
+            except (TypeError, ValueError):
+                raise InvalidCursor()
+            stmt = stmt.where(tuple_(rank, DBTask.id) < position)
+
+        stmt = stmt.order_by(rank.desc(), DBTask.id.desc()).limit(limit + 1)
+        result = await self.session.execute(stmt)
+        rows = result.all()
+
+        items = [self._to_domain(row) for row in rows[:limit]]
+        next_cursor = None
+        if len(rows) > limit:
+            last = rows[limit - 1]
+            next_cursor = encode_cursor(last.rank, last.id)
+
+        return TaskPage(items=items, next_cursor=next_cursor)
+
+    async def autocomplete(self, owner_id: int, prefix: str, limit: int, timeout_ms: Optional[int] = None) -> List[TaskSuggestion]:
+        """
+        Return the owner's tasks whose titles best complete a typed prefix.
+
+        Titles starting with the prefix (case-insensitive) come first, then
+        titles trigram-similar to it, both served by the (owner_id, title)
+        pg_trgm GIN index. The time budget is enforced server-side with a
+        `statement_timeout` local to a savepoint; in AUTOCOMMIT mode, where
+        there is no transaction to hold one, the budget is not applied. A
+        lookup over budget only rolls back to the savepoint; the enclosing
+        transaction stays usable and unaffected.
+
+        :param owner_id: ID of the tasks owner.
+        :param prefix: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :param timeout_ms: Time budget of the lookup; when exceeded, no suggestions are returned.
+        :return: Suggestions, best first.
+        """
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        starts_with = DBTask.title.ilike(f"{escaped}%", escape="\\")
+        stmt = (
+            select(DBTask.id, DBTask.title)
+            .where(DBTask.owner_id == owner_id, or_(starts_with, DBTask.title.op("%")(prefix)))
+            .order_by(starts_with.desc(), func.similarity(DBTask.title, prefix).desc(), DBTask.id.desc())
+            .limit(limit)
+        )
+
+        autocommit = self.session.get_bind().get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+        if not timeout_ms or autocommit:
+            result = await self.session.execute(stmt)
+            return [TaskSuggestion(id=row.id, title=row.title) for row in result]
+
+        # Only reads happen under the savepoint, so it is always rolled back,
+        # which also undoes the timeout for the rest of the transaction.
+        savepoint = await self.session.begin_nested()
+        try:
+            await self.session.execute(select(func.set_config("statement_timeout", str(timeout_ms), True)))
+            rows = (await self.session.execute(stmt)).all()
+        except DBAPIError as e:
+            if getattr(e.orig, "sqlstate", None) != QUERY_CANCELED:
+                raise
+            metrics.incr("task_autocomplete.timeouts")
+            logger.warning("Task autocomplete exceeded %s ms for owner %s", timeout_ms, owner_id)
+            return []
+        finally:
+            await savepoint.rollback()
+
+        return [TaskSuggestion(id=row.id, title=row.title) for row in rows]
+
+    async def add_many(self, tasks: List[TaskCreate]) -> List[Task]:
+        """
+        Create several tasks with one multi-row INSERT ... RETURNING.
+
+        :param tasks: Domain models representing the tasks to be created.
+        :return: The created tasks as domain models, in input order.
+        :raises TaskAlreadyExists: if any task violates a constraint; nothing is inserted then.
+        """
+        if not tasks:
+            return []
+
+        stmt = insert(DBTask).returning(*TASK_COLUMNS, sort_by_parameter_order=True)
+        try:
+            result = await self.session.execute(stmt, [task.dict for task in tasks])
+        except IntegrityError as e:
+            # The failed statement aborts the transaction; the unit of work rolls it back.
+            raise TaskAlreadyExists(detail=str(e.orig))
+
+        created_tasks = [self._to_domain(row) for row in result]
+        self.dirty_ids.update(task.id for task in created_tasks)
+        return created_tasks
+
+    async def stage_many(self, tasks: List[TaskCreate]) -> None:
+        """
+        Load tasks into the transaction's import staging table with COPY.
+
+        The staging table is created on first use and dropped on commit or
+        rollback. Rows are sent through asyncpg's binary COPY protocol, which
+        skips statement parsing and per-row round trips entirely.
+
+        :param tasks: Domain models representing the tasks to be imported.
+        """
+        if not tasks:
+            return
+
+        connection = await self.session.connection()
+        if not self._staged:
+            await connection.execute(CreateTable(task_import_staging, if_not_exists=True))
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            task_import_staging.name,
+            records=[
+                (position, task.title, task.description, task.owner_id)
+                for position, task in enumerate(tasks, start=self._staged)
+            ],
+            columns=[c.name for c in task_import_staging.c],
+        )
+        self._staged += len(tasks)
+
+    async def merge_staged(self) -> int:
+        """
+        Move all staged tasks into `tasks` with one INSERT ... SELECT.
+
+        Tasks get IDs in staging order and are stamped with the time of the
+        merge rather than of the transaction start, so that delta sync sees
+        them within its settle window.
+
+        :return: Number of tasks created.
+        :raises UserNotFound: if the owner no longer exists; nothing is inserted
+            once the unit of work rolls back.
+        """
+        if not self._staged:
+            return 0
+
+        now = func.timezone("utc", func.statement_timestamp())
+        moved = delete(task_import_staging).returning(*task_import_staging.c).cte("moved")
+        stmt = (
+            insert(DBTask)
+            .from_select(
+                ["title", "description", "owner_id", "status", "created_at", "updated_at"],
+                select(
+                    moved.c.title,
+                    moved.c.description,
+                    moved.c.owner_id,
+                    literal(TaskStatus.pending, DBTask.__table__.c.status.type),
+                    now,
+                    now,
+                ).order_by(moved.c.position),
+            )
+            .returning(DBTask.id)
+        )
+        try:
+            result = await self.session.execute(stmt)
+        except IntegrityError as e:
+            # The failed statement aborts the transaction; the unit of work rolls it back.
+            if getattr(e.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+                raise UserNotFound(detail="Owner of the imported tasks not found")
+            raise TaskAlreadyExists(detail=str(e.orig))
+
+        created_ids = result.scalars().all()
+        self.dirty_ids.update(created_ids)
+        self._staged = 0
+        return len(created_ids)
+
+    async def update_many(self, tasks: List[TaskUpdate], owner_id: int) -> List[Task]:
+        """
+        Update several tasks with one UPDATE ... FROM (VALUES ...) ... RETURNING.
+
+        Fields left as None keep their current value, as in `update`; tasks
+        with no field set are only read, so their `updated_at` is not touched.
+
+        :param tasks: Domain models containing updated task fields, one per task ID.
+        :param owner_id: ID of the tasks owner.
+        :return: The updated tasks as domain models; missing tasks are skipped.
+        """
+        changing, unchanged_ids = [], []
+        for task in tasks:
+            if any(value is not None for field, value in task.items() if field != "id"):
+                changing.append(task)
+            else:
+                unchanged_ids.append(task.id)
+
+        updated_tasks = []
+
+        if changing:
+            status_type = DBTask.__table__.c.status.type
+            data = values(
+                column("id", Integer),
+                column("title", String),
+                column("description", Text),
+                column("status", status_type),
+                name="data",
+            ).data([
+                (task.id, task.title, task.description, TaskStatus[task.status] if task.status else None)
+                for task in changing
+            ])
+            stmt = (
+                update(DBTask)
+                .where(DBTask.id == data.c.id, DBTask.owner_id == owner_id)
+                .values(
+                    title=func.coalesce(data.c.title, DBTask.title),
+                    description=func.coalesce(data.c.description, DBTask.description),
+                    # All-NULL VALUES columns are typed as text, so the enum needs an explicit cast.
+                    status=func.coalesce(cast(data.c.status, status_type), DBTask.status),
+                )
+                .returning(*TASK_COLUMNS)
+                .execution_options(synchronize_session=False)
+            )
+            result = await self.session.execute(stmt)
+            updated_tasks = [self._to_domain(row) for row in result]
+            self.dirty_ids.update(task.id for task in updated_tasks)
+
+        if unchanged_ids:
+            # Nothing to change: return the tasks as they are, as `update` does.
+            result = await self.session.execute(
+                select(*TASK_COLUMNS).where(DBTask.id.in_(unchanged_ids), DBTask.owner_id == owner_id)
+            )
+            updated_tasks.extend(self._to_domain(row) for row in result)
+
+        return updated_tasks
+
+    async def delete_many(self, task_ids: List[int], owner_id: int) -> List[int]:
+        """
+        Delete several tasks with one DELETE ... WHERE id = ANY(...) ... RETURNING.
+
+        :param task_ids: IDs of the tasks to delete.
+        :param owner_id: ID of the tasks owner.
+        :return: IDs of the deleted tasks; missing tasks are skipped.
+        """
+        if not task_ids:
+            return []
+
+        deleted_ids = await self._delete_with_tombstones(
+            DBTask.id == any_(literal(task_ids, ARRAY(Integer))), DBTask.owner_id == owner_id,
+        )
+        self.dirty_ids.update(deleted_ids)
+        return deleted_ids
+
+    async def _update(self, task: TaskUpdate, owner_id: Optional[int] = None) -> Task:
+        """
+        Update a task with a single UPDATE ... RETURNING, optionally scoped to an owner.
+        """
+        conditions = [DBTask.id == task.id]
+        if owner_id is not None:
+            conditions.append(DBTask.owner_id == owner_id)
+
+        changes = {field: value for field, value in task.items() if field != "id" and value is not None}
+        if "status" in changes:
+            changes["status"] = TaskStatus[changes["status"]]
+        if not changes:
+            # Nothing to change: return the task as is, without touching updated_at.
+            result = await self.session.execute(select(DBTask).where(*conditions))
+            obj: DBTask | None = result.scalar_one_or_none()
+            if not obj:
+                raise TaskNotFound(detail=f"Task with id {task.id} not found")
+            return self._to_domain(obj)
+
+        stmt = (
+            update(DBTask)
+            .where(*conditions)
+            .values(**changes)
+            .returning(*TASK_COLUMNS)
+        )
+        result = await self.session.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            raise TaskNotFound(detail=f"Task with id {task.id} not found")
+
+        self.dirty_ids.add(row.id)
+        return self._to_domain(row)
+
+    async def _delete(self, task_id: int, owner_id: Optional[int] = None) -> None:
+        """
+        Delete a task with a single statement, optionally scoped to an owner.
+        """
+        conditions = [DBTask.id == task_id]
+        if owner_id is not None:
+            conditions.append(DBTask.owner_id == owner_id)
+        if not await self._delete_with_tombstones(*conditions):
             raise TaskNotFound(detail=f"Task with id {task_id} not found")
 
-        await self.session.delete(obj)
-        await self.session.flush()
+        self.dirty_ids.add(task_id)
+
+    async def _delete_with_tombstones(self, *conditions) -> List[int]:
+        """
+        Delete matching tasks and record their tombstones in one statement:
+        WITH deleted AS (DELETE ... RETURNING) INSERT INTO task_tombstones ... RETURNING.
+
+        :return: IDs of the deleted tasks.
+        """
+        deleted = (
+            delete(DBTask.__table__)
+            .where(*conditions)
+            .returning(DBTask.__table__.c.id, DBTask.__table__.c.owner_id)
+            .cte("deleted")
+        )
+        tombstones = DBTaskTombstone.__table__
+        stmt = (
+            insert(tombstones)
+            .from_select(
+                ["task_id", "owner_id", "deleted_at"],
+                select(deleted.c.id, deleted.c.owner_id, literal(datetime.datetime.now(datetime.timezone.utc).replace(tzinfo=None))),
+            )
+            .returning(tombstones.c.task_id)
+        )
+        result = await self.session.execute(stmt)
+        return list(result.scalars())
 
     @staticmethod
-    def _to_domain(obj: DBTask) -> Task:
+    def _to_domain(obj: DBTask | Row) -> Task:
         return Task(
             id=obj.id,
             title=obj.title,
@@ -1,5 +1,6 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from src.db.engine import async_session_maker
+from src.db.engine import get_readonly_session_maker, get_session_maker
+from src.tasks.domain.interfaces.task_cache import ITaskCache
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
 from src.tasks.infrastructure.db.repo import PGTaskRepo
 
@@ -11,46 +12,101 @@ class PGTaskUnitOfWork(ITaskUnitOfWork):
     Manages a database session and provides access to the task repository.
     Ensures that operations are executed within a transactional context.
 
+    The session is created on the first repository call that needs it, so a
+    unit of work served entirely from the cache never checks out a connection
+    and never issues a rollback. Alternatively, a request-scoped session can be
+    passed in to share one connection with the other units of work of a request;
+    the unit of work then never closes it, but ends the transaction it began,
+    which returns the connection to the pool until the next unit of work.
+
     Attributes:
         session_factory (Callable): A factory to create new async database sessions.
-        session (AsyncSession): The current active session.
+        session (AsyncSession): The current session, created on first access.
+        shared_session (AsyncSession | None): Request-scoped session owned by the caller.
         tasks (PGTaskRepo): Repository for task operations.
+        cache (ITaskCache | None): Optional task cache, invalidated after each commit.
+        read_only (bool): Whether the unit of work only reads; commits are then no-ops.
     """
-    def __init__(self, session_factory=async_session_maker):
+    def __init__(
+        self,
+        session_factory=None,
+        cache: ITaskCache | None = None,
+        read_only: bool = False,
+        session: AsyncSession | None = None,
+    ):
         """
-        Initialize the unit of work with a session factory.
+        Initialize the unit of work with a session factory or a shared session.
 
-        :param session_factory: Callable that returns a new AsyncSession.
+        :param session_factory: Callable that returns a new AsyncSession. Defaults to
+            an AUTOCOMMIT session maker for read-only units of work.
+        :param cache: Optional task cache shared with the repository.
+        :param read_only: Skip commits, and with the default factory run without
+            transactions entirely.
+        :param session: Request-scoped session to use instead of creating one.
         """
+        if session_factory is None:
+            session_factory = get_readonly_session_maker() if read_only else get_session_maker()
         self.session_factory = session_factory
+        self.cache = cache
+        self.read_only = read_only
+        self.shared_session = session
+        self._session: AsyncSession | None = None
+        self._began_transaction = False
+
+    @property
+    def session(self) -> AsyncSession:
+        """
+        The current session, created on first access.
+        """
+        if self._session is None:
+            self._session = self.session_factory()
+        return self._session
 
     async def __aenter__(self):
         """
         Enter the async context manager.
 
-        Creates a new session and initializes the task repository.
+        Initializes the task repository; the session is created lazily.
         """
-        self.session: AsyncSession = self.session_factory()
-        self.tasks = PGTaskRepo(self.session)
+        self._session = self.shared_session
+        self._began_transaction = self.shared_session is not None and not self.shared_session.in_transaction()
+        self.tasks = PGTaskRepo(lambda: self.session, cache=self.cache)
         return await super().__aenter__()
 
     async def __aexit__(self, *args):
         """
         Exit the async context manager.
 
-        Performs rollback if needed and closes the session.
+        Performs rollback if needed and closes the session, if one was created.
+        A shared session is left open for the next unit of work of the request.
+        A read-only unit of work ends the transaction it began on it, releasing
+        the connection, but leaves alone one begun by an enclosing unit of work.
         """
-        await super().__aexit__(*args)
-        await self.session.close()
+        if self.shared_session is None:
+            await super().__aexit__(*args)
+            if self._session is not None:
+                await self._session.close()
+        elif not self.read_only or self._began_transaction:
+            await super().__aexit__(*args)
+        self._session = None
 
     async def _commit(self):
         """
         Commit the current transaction.
+
+        Cached copies of the written tasks are dropped only once the commit
+        has succeeded, so readers never cache state that was rolled back.
         """
-        await self.session.commit()
+        if not self.read_only and self._session is not None:
+            await self._session.commit()
+        if self.cache is not None and self.tasks.dirty_ids:
+            await self.cache.invalidate(self.tasks.dirty_ids)
+        self.tasks.dirty_ids.clear()
 
     async def rollback(self):
         """
-        Rollback the current transaction.
+        Rollback the current transaction, if one was started.
         """
-        await self.session.rollback()
+        if self._session is not None and self._session.in_transaction():
+            await self._session.rollback()
+        self.tasks.dirty_ids.clear()
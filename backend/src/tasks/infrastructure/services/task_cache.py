@@ -0,0 +1,156 @@
+import datetime
+import json
+import logging
+from typing import Iterable, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.core.infrastructure.cache import FILL_SCRIPT, INVALIDATE_SCRIPT
+from src.core.infrastructure.metrics import metrics
+from src.tasks.domain.entities import Task
+from src.tasks.domain.exceptions import TaskNotFound
+from src.tasks.domain.interfaces.task_cache import ITaskCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisTaskCache(ITaskCache):
+    """
+    Redis implementation of the task cache.
+
+    Tasks are stored as JSON with a TTL; missing tasks are stored as a marker
+    with a shorter TTL. Fills are compare-and-set against a per-task version
+    bumped by invalidations, so a read racing with a write cannot cache the
+    row the write replaced. Versions live as long as cached tasks; an expired
+    version reads as 0, which refuses fills begun before it expired. Redis
+    failures are logged and treated as cache misses, so the database remains
+    the source of truth.
+
+    Attributes:
+        redis_client (aioredis.Redis): Redis client used for storage.
+        ttl (int): Time to live of cached tasks in seconds.
+        negative_ttl (int): Time to live of missing-task markers in seconds.
+    """
+
+    key_prefix = "tasks:task:"
+    version_key_prefix = "tasks:version:"
+    missing_marker = "missing"
+
+    def __init__(self, redis_client: aioredis.Redis, ttl: int, negative_ttl: int) -> None:
+        """
+        Initialize the cache.
+
+        :param redis_client: Redis client used for storage.
+        :param ttl: Time to live of cached tasks in seconds.
+        :param negative_ttl: Time to live of missing-task markers in seconds.
+        """
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._fill_script = redis_client.register_script(FILL_SCRIPT)
+        self._invalidate_script = redis_client.register_script(INVALIDATE_SCRIPT)
+
+    async def get(self, task_id: int) -> Optional[Task]:
+        """
+        Return a cached task.
+
+        :param task_id: ID of the task.
+        :return: The cached Task entity, or None on a cache miss.
+        :raises TaskNotFound: If the task is cached as missing.
+        """
+        try:
+            raw = await self.redis_client.get(self._key(task_id))
+        except RedisError:
+            logger.warning("Task cache read failed", exc_info=True)
+            raw = None
+
+        if raw is None:
+            metrics.incr("task_cache.misses")
+            return None
+
+        if raw == self.missing_marker:
+            metrics.incr("task_cache.negative_hits")
+            raise TaskNotFound(detail=f"Task with id {task_id} not found")
+
+        metrics.incr("task_cache.hits")
+        return self._deserialize(raw)
+
+    async def version(self, task_id: int) -> Optional[int]:
+        """
+        Return the current version of a task, to be read before loading it.
+
+        :param task_id: ID of the task.
+        :return: The version, or None if Redis failed and the cache must not be filled.
+        """
+        try:
+            raw = await self.redis_client.get(self._version_key(task_id))
+        except RedisError:
+            logger.warning("Task cache version read failed", exc_info=True)
+            return None
+        return int(raw or 0)
+
+    async def set(self, task: Task, version: Optional[int]) -> None:
+        """
+        Store a task in the cache unless it has been invalidated since `version`.
+
+        :param task: Task entity to cache.
+        :param version: Version of the task read before loading it.
+        """
+        await self._store(task.id, self._serialize(task), self.ttl, version)
+
+    async def set_missing(self, task_id: int, version: Optional[int]) -> None:
+        """
+        Remember that a task does not exist, unless it has been invalidated since `version`.
+
+        :param task_id: ID of the missing task.
+        :param version: Version of the task read before looking it up.
+        """
+        await self._store(task_id, self.missing_marker, self.negative_ttl, version)
+
+    async def invalidate(self, task_ids: Iterable[int]) -> None:
+        """
+        Drop tasks from the cache and bump their versions.
+
+        :param task_ids: IDs of the tasks.
+        """
+        keys = [key for task_id in task_ids for key in (self._key(task_id), self._version_key(task_id))]
+        if not keys:
+            return
+        try:
+            await self._invalidate_script(keys=keys, args=[self.ttl])
+        except RedisError:
+            logger.warning("Task cache invalidation failed, entries expire in %s s", self.ttl, exc_info=True)
+        metrics.incr("task_cache.invalidations", len(keys) // 2)
+
+    async def _store(self, task_id: int, value: str, ttl: int, version: Optional[int]) -> None:
+        if version is None:
+            return
+        try:
+            stored = await self._fill_script(keys=[self._key(task_id), self._version_key(task_id)], args=[version, value, ttl])
+        except RedisError:
+            logger.warning("Task cache write failed", exc_info=True)
+            return
+        if not stored:
+            metrics.incr("task_cache.stale_fills")
+
+    def _key(self, task_id: int) -> str:
+        return f"{self.key_prefix}{task_id}"
+
+    def _version_key(self, task_id: int) -> str:
+        return f"{self.version_key_prefix}{task_id}"
+
+    @staticmethod
+    def _serialize(task: Task) -> str:
+        data = task.dict
+        data["created_at"] = task.created_at.isoformat()
+        data["updated_at"] = task.updated_at.isoformat()
+        return json.dumps(data)
+
+    @staticmethod
+    def _deserialize(raw: str) -> Task:
+        data = json.loads(raw)
+        data["created_at"] = datetime.datetime.fromisoformat(data["created_at"])
+        data["updated_at"] = datetime.datetime.fromisoformat(data["updated_at"])
+        return Task(**data)
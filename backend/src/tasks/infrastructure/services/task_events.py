@@ -0,0 +1,311 @@
+import asyncio
+import collections
+import contextlib
+import datetime
+import json
+import logging
+from typing import AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.core.infrastructure.metrics import metrics
+from src.tasks.domain.entities import Task, TaskEvent
+from src.tasks.domain.interfaces.task_event_broker import ITaskEventBroker, ITaskEventSubscription
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
+
+
+logger = logging.getLogger(__name__)
+
+# Events of an owner are appended to the stream `tasks:events:{owner_id}` and
+# published on the channel of the same name.
+KEY_PREFIX = "tasks:events:"
+
+# Appends the event to the owner's bounded stream and publishes it together
+# with its stream ID in one atomic step, so that live and replayed events
+# always agree on IDs and order.
+PUBLISH_SCRIPT = """
+local id = redis.call('XADD', KEYS[1], 'MAXLEN', '~', ARGV[1], '*', 'event', ARGV[2])
+redis.call('PUBLISH', KEYS[1], id .. ' ' .. ARGV[2])
+return id
+"""
+
+
+class RedisTaskEventPublisher(ITaskEventPublisher):
+    """
+    Redis implementation of the task event publisher.
+
+    Every event is appended to a bounded per-owner stream, which serves
+    `Last-Event-ID` resumes, and published through pub/sub to the workers
+    serving the owner's subscribers. Redis failures are logged and the events
+    dropped; subscribers recover through delta sync.
+
+    Attributes:
+        redis_client (aioredis.Redis): Redis client used for publishing.
+        stream_maxlen (int): Approximate number of events kept per owner for resumes.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis, stream_maxlen: int) -> None:
+        """
+        Initialize the publisher.
+
+        :param redis_client: Redis client used for publishing.
+        :param stream_maxlen: Approximate number of events kept per owner for resumes.
+        """
+        self.redis_client = redis_client
+        self.stream_maxlen = stream_maxlen
+        self._script = redis_client.register_script(PUBLISH_SCRIPT)
+
+    async def publish(self, events: List[TaskEvent]) -> None:
+        """
+        Publish events, in order, in one round trip.
+
+        :param events: Events to publish.
+        """
+        if not events:
+            return
+        try:
+            async with self.redis_client.pipeline(transaction=False) as pipe:
+                for event in events:
+                    await self._script(keys=[_key(event.owner_id)], args=[self.stream_maxlen, _encode(event)], client=pipe)
+                await pipe.execute()
+        except RedisError:
+            logger.warning("Publishing %s task events failed", len(events), exc_info=True)
+            return
+        metrics.incr("task_events.published", len(events))
+
+
+class RedisTaskEventSubscription(ITaskEventSubscription):
+    """
+    One subscriber's feed: replayed events first, then live ones from a bounded queue.
+
+    A subscriber whose queue is full is disconnected instead of buffering
+    without bound; it resumes from the stream with its last event ID.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        """
+        Initialize the subscription.
+
+        :param queue_size: Maximum number of live events waiting for the subscriber.
+        """
+        self.closed = False
+        self._queue: asyncio.Queue[Optional[TaskEvent]] = asyncio.Queue(maxsize=queue_size)
+        self._backlog: Deque[TaskEvent] = collections.deque()
+        self._replayed_up_to: Optional[Tuple[int, int]] = None
+
+    async def get(self) -> Optional[TaskEvent]:
+        """
+        Wait for the next event.
+
+        :return: The next event, or None once the subscription is closed.
+        """
+        if self._backlog:
+            return self._backlog.popleft()
+        while True:
+            event = await self._queue.get()
+            # Live events received while replaying are part of the replay.
+            if event is None or self._replayed_up_to is None or _stream_id(event.id) > self._replayed_up_to:
+                return event
+
+    def replay(self, events: List[TaskEvent], up_to: Optional[str]) -> None:
+        """
+        Deliver events read from the stream before any live ones.
+
+        :param events: Replayed events, oldest first.
+        :param up_to: ID of the newest event in the stream when it was read.
+        """
+        self._backlog.extend(events)
+        if up_to is not None:
+            self._replayed_up_to = _stream_id(up_to)
+
+    def deliver(self, event: TaskEvent) -> None:
+        """
+        Queue a live event, closing the subscription if the subscriber fell behind.
+
+        :param event: Live event.
+        """
+        if self.closed:
+            return
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            metrics.incr("task_events.slow_subscribers")
+            self.close()
+
+    def close(self) -> None:
+        """
+        Close the subscription, dropping queued events.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+
+class RedisTaskEventBroker(ITaskEventBroker):
+    """
+    Per-worker fan-out of task events from Redis to local subscribers.
+
+    One pattern subscription per worker receives the events of all owners,
+    started on first use, and dispatches them to the owner's local
+    subscriptions. If the connection to Redis drops, every subscription is
+    closed, since events may have been missed; subscribers resume from the
+    stream with their last event ID.
+
+    Attributes:
+        redis_client (aioredis.Redis): Redis client used for pub/sub and replays.
+        queue_size (int): Maximum number of live events waiting for one subscriber.
+        reconnect_delay (float): Pause before resubscribing after a failure, in seconds.
+    """
+
+    def __init__(self, redis_client: aioredis.Redis, queue_size: int, reconnect_delay: float = 1.0) -> None:
+        """
+        Initialize the broker.
+
+        :param redis_client: Redis client used for pub/sub and replays.
+        :param queue_size: Maximum number of live events waiting for one subscriber.
+        :param reconnect_delay: Pause before resubscribing after a failure, in seconds.
+        """
+        self.redis_client = redis_client
+        self.queue_size = queue_size
+        self.reconnect_delay = reconnect_delay
+        self._subscriptions: Dict[int, Set[RedisTaskEventSubscription]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+
+    @property
+    def subscribers(self) -> int:
+        """Number of local subscriptions."""
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    @contextlib.asynccontextmanager
+    async def subscribe(self, owner_id: int, last_event_id: Optional[str] = None) -> AsyncIterator[RedisTaskEventSubscription]:
+        """
+        Subscribe to the owner's task events.
+
+        The subscription is registered before the stream is read, so no event
+        falls between the replay and the live feed.
+
+        :param owner_id: ID of the tasks owner.
+        :param last_event_id: ID of the last event the subscriber saw.
+        :return: Async context manager yielding the subscription.
+        """
+        subscription = RedisTaskEventSubscription(self.queue_size)
+        self._subscriptions.setdefault(owner_id, set()).add(subscription)
+        try:
+            await self._start()
+            if last_event_id is not None:
+                await self._replay(owner_id, last_event_id, subscription)
+            yield subscription
+        finally:
+            subscription.close()
+            subscriptions = self._subscriptions.get(owner_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[owner_id]
+
+    async def close(self) -> None:
+        """
+        Stop listening and close all subscriptions.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        self._close_all()
+
+    async def _start(self, timeout: float = 5.0) -> None:
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+        # Events published before the pattern subscription is active would be missed.
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(self._ready.wait(), timeout)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            try:
+                await pubsub.psubscribe(f"{KEY_PREFIX}*")
+                self._ready.set()
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+            except Exception:
+                logger.warning("Task event subscription lost, resubscribing", exc_info=True)
+            finally:
+                self._ready.clear()
+                with contextlib.suppress(RedisError, OSError):
+                    await pubsub.aclose()
+            self._close_all()
+            await asyncio.sleep(self.reconnect_delay)
+
+    def _dispatch(self, channel: str, data: str) -> None:
+        subscriptions = self._subscriptions.get(int(channel[len(KEY_PREFIX):]))
+        if not subscriptions:
+            return
+        event_id, _, raw = data.partition(" ")
+        try:
+            event = _decode(event_id, raw)
+        except (ValueError, KeyError, TypeError):
+            logger.warning("Dropping malformed task event %s", event_id, exc_info=True)
+            return
+        for subscription in list(subscriptions):
+            subscription.deliver(event)
+
+    async def _replay(self, owner_id: int, last_event_id: str, subscription: RedisTaskEventSubscription) -> None:
+        try:
+            _stream_id(last_event_id)
+            entries = await self.redis_client.xrange(_key(owner_id), min=last_event_id, max="+")
+        except (ValueError, RedisError):
+            logger.warning("Replaying task events failed", exc_info=True)
+            subscription.replay([TaskEvent(type="reset", owner_id=owner_id)], up_to=None)
+            return
+
+        if not entries:
+            return
+        if entries[0][0] != last_event_id:
+            # The last seen event was trimmed from the stream: events were lost.
+            metrics.incr("task_events.resets")
+            subscription.replay([TaskEvent(type="reset", owner_id=owner_id)], up_to=entries[-1][0])
+            return
+        events = [_decode(entry_id, fields["event"]) for entry_id, fields in entries[1:]]
+        subscription.replay(events, up_to=entries[-1][0])
+        metrics.incr("task_events.replayed", len(events))
+
+    def _close_all(self) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.close()
+
+
+def _key(owner_id: int) -> str:
+    return f"{KEY_PREFIX}{owner_id}"
+
+
+def _stream_id(event_id: str) -> Tuple[int, int]:
+    milliseconds, _, sequence = event_id.partition("-")
+    return int(milliseconds), int(sequence or 0)
+
+
+def _encode(event: TaskEvent) -> str:
+    task = None
+    if event.task is not None:
+        task = event.task.dict
+        task["created_at"] = event.task.created_at.isoformat()
+        task["updated_at"] = event.task.updated_at.isoformat()
+    return json.dumps({"type": event.type, "owner_id": event.owner_id, "task_id": event.task_id, "task": task})
+
+
+def _decode(event_id: str, raw: str) -> TaskEvent:
+    data = json.loads(raw)
+    task = data["task"]
+    if task is not None:
+        task["created_at"] = datetime.datetime.fromisoformat(task["created_at"])
+        task["updated_at"] = datetime.datetime.fromisoformat(task["updated_at"])
+        task = Task(**task)
+    return TaskEvent(type=data["type"], owner_id=data["owner_id"], task_id=data["task_id"], task=task, id=event_id)
@@ -0,0 +1,81 @@
+import hashlib
+import json
+import logging
+from typing import List, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.core.infrastructure.metrics import metrics
+from src.tasks.domain.entities import TaskSuggestion
+from src.tasks.domain.interfaces.task_suggestion_cache import ITaskSuggestionCache
+
+
+logger = logging.getLogger(__name__)
+
+
+class RedisTaskSuggestionCache(ITaskSuggestionCache):
+    """
+    Redis implementation of the autocomplete suggestion cache.
+
+    Suggestions are stored as JSON under a per-owner key with a short TTL.
+    Redis failures are logged and treated as cache misses.
+
+    Attributes:
+        redis_client (aioredis.Redis): Redis client used for storage.
+        ttl (int): Time to live of cached suggestions in seconds.
+    """
+
+    key_prefix = "tasks:suggest:"
+
+    def __init__(self, redis_client: aioredis.Redis, ttl: int) -> None:
+        """
+        Initialize the cache.
+
+        :param redis_client: Redis client used for storage.
+        :param ttl: Time to live of cached suggestions in seconds.
+        """
+        self.redis_client = redis_client
+        self.ttl = ttl
+
+    async def get(self, owner_id: int, prefix: str, limit: int) -> Optional[List[TaskSuggestion]]:
+        """
+        Return cached suggestions.
+
+        :param owner_id: ID of the tasks owner.
+        :param prefix: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :return: Cached suggestions, or None on a cache miss.
+        """
+        try:
+            raw = await self.redis_client.get(self._key(owner_id, prefix, limit))
+        except RedisError:
+            logger.warning("Task suggestion cache read failed", exc_info=True)
+            raw = None
+
+        if raw is None:
+            metrics.incr("task_suggestion_cache.misses")
+            return None
+
+        metrics.incr("task_suggestion_cache.hits")
+        return [TaskSuggestion(**item) for item in json.loads(raw)]
+
+    async def set(self, owner_id: int, prefix: str, limit: int, suggestions: List[TaskSuggestion]) -> None:
+        """
+        Store suggestions in the cache.
+
+        :param owner_id: ID of the tasks owner.
+        :param prefix: Text typed so far.
+        :param limit: Maximum number of suggestions.
+        :param suggestions: Suggestions to cache.
+        """
+        raw = json.dumps([suggestion.dict for suggestion in suggestions])
+        try:
+            await self.redis_client.set(self._key(owner_id, prefix, limit), raw, ex=self.ttl)
+        except RedisError:
+            logger.warning("Task suggestion cache write failed", exc_info=True)
+
+    def _key(self, owner_id: int, prefix: str, limit: int) -> str:
+        # Hash the prefix to keep keys short and free of arbitrary user input.
+        digest = hashlib.sha1(prefix.encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}{owner_id}:{limit}:{digest}"
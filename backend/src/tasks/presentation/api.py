@@ -1,46 +1,355 @@
-from fastapi import APIRouter, Depends
+import asyncio
+import json
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, Query, Request, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter, ValidationError
+from starlette.status import WS_1003_UNSUPPORTED_DATA
 
 from src.users.domain.entities import User
-from src.tasks.domain.dtos import TaskCreateDTO, TaskUpdateDTO, TaskDTO
+from src.tasks.domain.dtos import (
+    TaskCreateDTO,
+    TaskUpdateDTO,
+    TaskDTO,
+    TaskPageDTO,
+    TaskChangesDTO,
+    TaskBatchCreateDTO,
+    TaskBatchUpdateDTO,
+    TaskBatchDeleteDTO,
+    TaskBatchResultDTO,
+    TaskSuggestionDTO,
+    TaskImportReportDTO,
+    TaskEventDTO,
+    TaskOperationDTO,
+    TaskOperationResultDTO,
+    MAX_BATCH_SIZE,
+)
 from src.tasks.use_cases.task_create import create_task
 from src.tasks.use_cases.task_read import read_task
+from src.tasks.use_cases.task_list import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, list_tasks
+from src.tasks.use_cases.task_search import search_tasks
+from src.tasks.use_cases.task_changes import DEFAULT_CHANGES_PAGE_SIZE, MAX_CHANGES_PAGE_SIZE, list_task_changes
+from src.tasks.use_cases.task_autocomplete import MAX_SUGGESTIONS, autocomplete_tasks
+from src.tasks.use_cases.task_export import export_tasks
+from src.tasks.use_cases.task_import import import_tasks
+from src.tasks.use_cases.task_events import watch_tasks
+from src.tasks.use_cases.task_operations import apply_task_operations
+from src.tasks.domain.entities import TaskOperationResult
 from src.tasks.use_cases.task_update import update_task
 from src.tasks.use_cases.task_delete import delete_task
-from src.tasks.presentation.dependencies import TaskUoWDep
-from src.users.presentation.dependencies import UserUoWDep
+from src.tasks.use_cases.task_batch import create_tasks, update_tasks, delete_tasks
+from src.tasks.presentation.dependencies import (
+    TaskEventBrokerDep,
+    TaskEventPublisherDep,
+    TaskExportUoWDep,
+    TaskReadUoWDep,
+    TaskSuggestionCacheDep,
+    TaskUoWDep,
+    TaskUoWFactoryDep,
+)
 from src.auth.presentation.dependencies import AuthDep, get_current_user
+from src.core.config import settings
+from src.core.presentation.responses import EntityResponse, encode_entity
+from src.core.presentation.streaming import SSE_HEARTBEAT, gzip_chunks, sse_message
 
 
 task_api_router = APIRouter(prefix='/api/tasks', tags=["tasks"])
 
+task_operation_adapter = TypeAdapter(TaskOperationDTO)
+
 
 @task_api_router.post("", response_model=TaskDTO, status_code=201)
-async def create(task_data: TaskCreateDTO, uow: TaskUoWDep, user_uow: UserUoWDep, user: AuthDep):
+async def create(task_data: TaskCreateDTO, uow: TaskUoWDep, events: TaskEventPublisherDep, user: AuthDep):
     """
     Create a new task.
     """
-    return await create_task(owner_id=user.id, task_data=task_data, uow=uow, user_uow=user_uow)
+    task = await create_task(owner_id=user.id, task_data=task_data, uow=uow, events=events)
+    return EntityResponse(task, TaskDTO, status_code=201)
+
+
+@task_api_router.get("", response_model=TaskPageDTO)
+async def get_list(
+    uow: TaskReadUoWDep,
+    user: AuthDep,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    status: Optional[Literal["pending", "completed", "archived"]] = None,
+):
+    """
+    List tasks of the current user, newest first.
+    """
+    page = await list_tasks(owner_id=user.id, uow=uow, cursor=cursor, limit=limit, status=status)
+    return EntityResponse(page, TaskPageDTO)
+
+
+@task_api_router.get("/changes", response_model=TaskChangesDTO)
+async def get_changes(
+    uow: TaskReadUoWDep,
+    user: AuthDep,
+    since: Optional[str] = None,
+    limit: int = Query(DEFAULT_CHANGES_PAGE_SIZE, ge=1, le=MAX_CHANGES_PAGE_SIZE),
+):
+    """
+    Return tasks of the current user created, updated or deleted since a sync cursor.
+    """
+    changes = await list_task_changes(owner_id=user.id, uow=uow, since=since, limit=limit)
+    return EntityResponse(changes, TaskChangesDTO)
+
+
+@task_api_router.get("/search", response_model=TaskPageDTO)
+async def search(
+    uow: TaskReadUoWDep,
+    user: AuthDep,
+    q: str = Query(min_length=1, max_length=256),
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """
+    Search tasks of the current user by title and description, best match first.
+    """
+    page = await search_tasks(owner_id=user.id, query=q, uow=uow, cursor=cursor, limit=limit)
+    return EntityResponse(page, TaskPageDTO)
+
+
+@task_api_router.get("/autocomplete", response_model=List[TaskSuggestionDTO])
+async def autocomplete(
+    uow: TaskReadUoWDep,
+    cache: TaskSuggestionCacheDep,
+    user: AuthDep,
+    q: str = Query(min_length=1, max_length=100),
+    limit: int = Query(settings.TASK_SUGGEST_LIMIT, ge=1, le=MAX_SUGGESTIONS),
+):
+    """
+    Suggest titles of the current user's tasks for a typed prefix.
+    """
+    suggestions = await autocomplete_tasks(owner_id=user.id, prefix=q, uow=uow, cache=cache, limit=limit)
+    return EntityResponse(suggestions, List[TaskSuggestionDTO])
+
+
+@task_api_router.get("/export", response_class=StreamingResponse)
+async def export(
+    uow: TaskExportUoWDep,
+    user: AuthDep,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    gzip: bool = False,
+):
+    """
+    Stream all tasks of the current user as NDJSON or CSV, optionally gzip-compressed.
+    """
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    headers = {"Content-Disposition": f'attachment; filename="tasks.{format}"'}
+    body = export_tasks(owner_id=user.id, uow=uow, format=format)
+    if gzip:
+        body = gzip_chunks(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@task_api_router.get("/events", response_class=StreamingResponse)
+async def stream_events(
+    broker: TaskEventBrokerDep,
+    user: AuthDep,
+    last_event_id: Optional[str] = Header(None, max_length=64),
+):
+    """
+    Stream changes to the current user's tasks as Server-Sent Events.
+
+    Reconnecting clients send the `Last-Event-ID` header to receive the events they missed.
+    """
+    stream = watch_tasks(
+        owner_id=user.id,
+        broker=broker,
+        last_event_id=last_event_id,
+        heartbeat_seconds=settings.TASK_EVENTS_HEARTBEAT_SECONDS,
+    )
+    return StreamingResponse(
+        _server_sent_events(stream),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@task_api_router.websocket("/ws")
+async def operations(
+    websocket: WebSocket,
+    uow_factory: TaskUoWFactoryDep,
+    events: TaskEventPublisherDep,
+    user: AuthDep,
+):
+    """
+    Apply create, update and delete operations sent as JSON text messages, acknowledging each with its result.
+
+    Operations arriving together are coalesced into batches applied in one
+    transaction each; acknowledgements follow the order of the operations.
+    A binary message closes the connection with 1003 once the operations
+    received before it are acknowledged.
+
+    The access token is checked only once, when the connection opens: an
+    open connection keeps working after the token expires or the user logs
+    out, until either side closes it.
+    """
+    await websocket.accept()
+    messages: asyncio.Queue[Optional[str]] = asyncio.Queue(maxsize=MAX_BATCH_SIZE)
+    receiver = asyncio.create_task(_receive_messages(websocket, messages))
+    try:
+        closed = False
+        while not closed:
+            batch = await _next_messages(messages, settings.TASK_OPERATIONS_BATCH_WINDOW_MS / 1000)
+            closed = batch[-1] is None
+            results = await _apply_messages(user.id, [message for message in batch if message is not None], uow_factory, events)
+            for result in results:
+                await websocket.send_text(encode_entity(result, TaskOperationResultDTO).decode())
+        # Re-raises whatever ended the receiver other than a disconnect.
+        close_code = await receiver
+    except WebSocketDisconnect:
+        return
+    finally:
+        receiver.cancel()
+    if close_code is not None:
+        await websocket.close(code=close_code, reason="Operations must be sent as text messages")
+
+
+@task_api_router.post("/import", response_model=TaskImportReportDTO)
+async def import_file(
+    request: Request,
+    uow: TaskUoWDep,
+    user: AuthDep,
+    format: Literal["ndjson", "csv"] = "ndjson",
+):
+    """
+    Create tasks of the current user from an NDJSON or CSV request body, reporting rejected rows.
+    """
+    report = await import_tasks(owner_id=user.id, chunks=request.stream(), uow=uow, format=format)
+    return EntityResponse(report, TaskImportReportDTO)
+
+
+@task_api_router.post("/batch", response_model=List[TaskBatchResultDTO], status_code=201)
+async def create_batch(batch: TaskBatchCreateDTO, uow: TaskUoWDep, events: TaskEventPublisherDep, user: AuthDep):
+    """
+    Create several tasks at once.
+
+    The batch is all-or-nothing: an invalid item rejects the request with 422
+    and a database error fails every item, so results carry no errors.
+    """
+    results = await create_tasks(owner_id=user.id, tasks_data=batch.items, uow=uow, events=events)
+    return EntityResponse(results, List[TaskBatchResultDTO], status_code=201)
+
+
+@task_api_router.patch("/batch", response_model=List[TaskBatchResultDTO])
+async def update_batch(batch: TaskBatchUpdateDTO, uow: TaskUoWDep, events: TaskEventPublisherDep, user: AuthDep):
+    """
+    Update several tasks at once, reporting errors per item.
+    """
+    results = await update_tasks(owner_id=user.id, tasks_data=batch.items, uow=uow, events=events)
+    return EntityResponse(results, List[TaskBatchResultDTO])
+
+
+@task_api_router.post("/batch/delete", response_model=List[TaskBatchResultDTO])
+async def delete_batch(batch: TaskBatchDeleteDTO, uow: TaskUoWDep, events: TaskEventPublisherDep, user: AuthDep):
+    """
+    Delete several tasks at once, reporting errors per item.
+    """
+    results = await delete_tasks(owner_id=user.id, task_ids=batch.ids, uow=uow, events=events)
+    return EntityResponse(results, List[TaskBatchResultDTO])
 
 
 @task_api_router.get("/{task_id}", response_model=TaskDTO)
-async def get(task_id: int, uow: TaskUoWDep):
+async def get(task_id: int, uow: TaskReadUoWDep, user: AuthDep):
     """
-    Get task by ID.
+    Get task of the current user by ID.
     """
-    return await read_task(task_id, uow=uow)
+    task = await read_task(task_id, owner_id=user.id, uow=uow)
+    return EntityResponse(task, TaskDTO)
 
 
 @task_api_router.patch("/{task_id}", response_model=TaskDTO)
-async def update(task_id: int, task_data: TaskUpdateDTO, uow: TaskUoWDep, user: AuthDep):
+async def update(task_id: int, task_data: TaskUpdateDTO, uow: TaskUoWDep, events: TaskEventPublisherDep, user: AuthDep):
     """
     Update task data.
     """
-    return await update_task(task_id, task_data, uow=uow)
+    task = await update_task(task_id, task_data, owner_id=user.id, uow=uow, events=events)
+    return EntityResponse(task, TaskDTO)
 
 
 @task_api_router.delete("/{task_id}", status_code=204)
-async def delete(task_id: int, uow: TaskUoWDep, user: AuthDep):
+async def delete(task_id: int, uow: TaskUoWDep, events: TaskEventPublisherDep, user: AuthDep):
     """
     Delete task by ID.
     """
-    return await delete_task(task_id, uow=uow)
+    return await delete_task(task_id, owner_id=user.id, uow=uow, events=events)
+
+
+async def _server_sent_events(stream):
+    """
+    Encode task events, and heartbeats for idle periods, as Server-Sent Events.
+    """
+    yield sse_message("{}", event="ready", retry_ms=3000)
+    async for event in stream:
+        if event is None:
+            yield SSE_HEARTBEAT
+            continue
+        yield sse_message(encode_entity(event, TaskEventDTO).decode(), event=event.type, id=event.id)
+
+
+async def _receive_messages(websocket: WebSocket, messages: asyncio.Queue) -> Optional[int]:
+    """
+    Queue incoming text messages, then None once receiving ends for any reason.
+
+    The queue is bounded, so a client sending faster than operations are
+    applied is slowed down by TCP flow control. Receiving stops at a
+    disconnect, and at a binary message, for which the code to close the
+    connection with is returned.
+    """
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                return None
+            if message.get("text") is None:
+                return WS_1003_UNSUPPORTED_DATA
+            await messages.put(message["text"])
+    finally:
+        # Once cancelled, the handler has stopped reading the queue.
+        if not asyncio.current_task().cancelling():
+            await messages.put(None)
+
+
+async def _next_messages(messages: asyncio.Queue, window: float) -> List[Optional[str]]:
+    """
+    Wait for a message, then collect those arriving within the batching window.
+
+    The batch ends with None if the client disconnected.
+    """
+    batch = [await messages.get()]
+    if window > 0 and batch[-1] is not None:
+        await asyncio.sleep(window)
+    while batch[-1] is not None and len(batch) < MAX_BATCH_SIZE and not messages.empty():
+        batch.append(messages.get_nowait())
+    return batch
+
+
+async def _apply_messages(owner_id: int, batch: List[str], uow_factory, events) -> List[TaskOperationResult]:
+    """
+    Parse and apply a batch of messages, with a result for each, in order.
+    """
+    results: List[Optional[TaskOperationResult]] = []
+    operations = []
+    for message in batch:
+        try:
+            operations.append(task_operation_adapter.validate_json(message))
+            results.append(None)
+        except ValidationError as e:
+            error = "; ".join(f"{'.'.join(map(str, item['loc'])) or 'message'}: {item['msg']}" for item in e.errors())
+            results.append(TaskOperationResult(ref=_message_ref(message), error=error))
+
+    applied = iter(await apply_task_operations(owner_id, operations, uow_factory, events))
+    return [result if result is not None else next(applied) for result in results]
+
+
+def _message_ref(message: str) -> Optional[str]:
+    try:
+        ref = json.loads(message).get("ref")
+    except (ValueError, AttributeError):
+        return None
+    return ref if isinstance(ref, str) else None
@@ -1,21 +1,144 @@
-from typing import Annotated
+from functools import lru_cache
+from typing import Annotated, Callable
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.core.infrastructure.metrics import metrics
+from src.db.dependencies import get_async_session
+from src.db.engine import get_session_maker
+from src.tasks.domain.interfaces.task_cache import ITaskCache
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
 from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.domain.interfaces.task_suggestion_cache import ITaskSuggestionCache
+from src.tasks.domain.interfaces.task_event_broker import ITaskEventBroker
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
+from src.tasks.infrastructure.services.task_cache import RedisTaskCache
+from src.tasks.infrastructure.services.task_suggestion_cache import RedisTaskSuggestionCache
+from src.tasks.infrastructure.services.task_events import RedisTaskEventBroker, RedisTaskEventPublisher
 
 
-def get_task_uow() -> ITaskUnitOfWork:
+@lru_cache
+def get_task_cache() -> ITaskCache | None:
+    """
+    Provide the application-wide Redis cache of tasks.
+
+    Returns None when `TASK_CACHE_ENABLED` is off, which makes units of work
+    read straight from the database.
+
+    :return: ITaskCache instance or None.
+    """
+    if not settings.TASK_CACHE_ENABLED:
+        return None
+    return RedisTaskCache(
+        redis_client=get_redis_client(),
+        ttl=settings.TASK_CACHE_TTL_SECONDS,
+        negative_ttl=settings.TASK_CACHE_NEGATIVE_TTL_SECONDS,
+    )
+
+
+@lru_cache
+def get_task_suggestion_cache() -> ITaskSuggestionCache | None:
+    """
+    Provide the application-wide Redis cache of autocomplete suggestions.
+
+    Returns None when `TASK_CACHE_ENABLED` is off.
+
+    :return: ITaskSuggestionCache instance or None.
+    """
+    if not settings.TASK_CACHE_ENABLED:
+        return None
+    return RedisTaskSuggestionCache(redis_client=get_redis_client(), ttl=settings.TASK_SUGGEST_CACHE_TTL_SECONDS)
+
+
+@lru_cache
+def get_task_event_publisher() -> ITaskEventPublisher | None:
+    """
+    Provide the application-wide publisher of task events.
+
+    Returns None when `TASK_EVENTS_ENABLED` is off, which makes writes skip publishing.
+
+    :return: ITaskEventPublisher instance or None.
+    """
+    if not settings.TASK_EVENTS_ENABLED:
+        return None
+    return RedisTaskEventPublisher(redis_client=get_redis_client(), stream_maxlen=settings.TASK_EVENTS_STREAM_MAXLEN)
+
+
+@lru_cache
+def get_task_event_broker() -> ITaskEventBroker:
+    """
+    Provide the worker-wide broker of task events.
+
+    `lru_cache` makes the broker, together with its single Redis subscription
+    shared by all subscribers of the worker, a singleton.
+
+    :return: ITaskEventBroker instance.
+    """
+    broker = RedisTaskEventBroker(redis_client=get_redis_client(), queue_size=settings.TASK_EVENTS_QUEUE_SIZE)
+    metrics.register_collector("task_events", lambda: {"subscribers": broker.subscribers})
+    return broker
+
+
+def get_task_uow(session: AsyncSession = Depends(get_async_session)) -> ITaskUnitOfWork:
     """
     Dependency that provides an instance of ITaskUnitOfWork.
 
     This allows the presentation layer to remain decoupled from the actual implementation.
     By default, it returns a PostgreSQL-based unit of work (PGTaskUnitOfWork), but the implementation
     can be easily overridden for testing or different environments.
+    The unit of work runs on the request-scoped session.
+
+    :param session: Request-scoped database session.
+    :return: ITaskUnitOfWork instance.
+    """
+    return PGTaskUnitOfWork(cache=get_task_cache(), session=session)
+
+
+def get_task_read_uow(session: AsyncSession = Depends(get_async_session)) -> ITaskUnitOfWork:
+    """
+    Dependency that provides a read-only instance of ITaskUnitOfWork.
+
+    Commits are no-ops; the read transaction ends, and the connection returns
+    to the pool, when the unit of work exits. Use it for endpoints that never write.
+
+    :param session: Request-scoped database session.
+    :return: ITaskUnitOfWork instance.
+    """
+    return PGTaskUnitOfWork(cache=get_task_cache(), read_only=True, session=session)
+
+
+def get_task_export_uow() -> ITaskUnitOfWork:
+    """
+    Dependency that provides a read-only instance of ITaskUnitOfWork for streaming exports.
+
+    The unit of work owns its session instead of sharing the request one,
+    because the response body, and with it the server-side cursor, outlives
+    the endpoint. The session is transactional, as cursors require.
 
     :return: ITaskUnitOfWork instance.
     """
-    return PGTaskUnitOfWork()
+    return PGTaskUnitOfWork(session_factory=get_session_maker(), read_only=True)
+
+
+def get_task_uow_factory() -> Callable[[], ITaskUnitOfWork]:
+    """
+    Dependency that provides a factory of ITaskUnitOfWork instances.
+
+    Every unit of work owns its session, so long-lived connections such as
+    WebSockets hold a pooled connection only while a transaction runs.
+
+    :return: Callable returning a new ITaskUnitOfWork instance.
+    """
+    return lambda: PGTaskUnitOfWork(cache=get_task_cache())
+
 
 TaskUoWDep = Annotated[ITaskUnitOfWork, Depends(get_task_uow)]
+TaskReadUoWDep = Annotated[ITaskUnitOfWork, Depends(get_task_read_uow)]
+TaskExportUoWDep = Annotated[ITaskUnitOfWork, Depends(get_task_export_uow)]
+TaskUoWFactoryDep = Annotated[Callable[[], ITaskUnitOfWork], Depends(get_task_uow_factory)]
+TaskSuggestionCacheDep = Annotated[ITaskSuggestionCache | None, Depends(get_task_suggestion_cache)]
+TaskEventPublisherDep = Annotated[ITaskEventPublisher | None, Depends(get_task_event_publisher)]
+TaskEventBrokerDep = Annotated[ITaskEventBroker, Depends(get_task_event_broker)]
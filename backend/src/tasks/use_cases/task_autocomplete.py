@@ -0,0 +1,49 @@
+from typing import List, Optional
+
+from src.core.config import settings
+from src.tasks.domain.entities import TaskSuggestion
+from src.tasks.domain.interfaces.task_suggestion_cache import ITaskSuggestionCache
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+
+
+MAX_SUGGESTIONS = 20
+
+
+async def autocomplete_tasks(
+    owner_id: int,
+    prefix: str,
+    uow: ITaskUnitOfWork,
+    cache: Optional[ITaskSuggestionCache] = None,
+    limit: int = settings.TASK_SUGGEST_LIMIT,
+) -> List[TaskSuggestion]:
+    """
+    Suggest task titles of the owner for a typed prefix.
+
+    Repeated prefixes are served from the short-lived cache. The database
+    lookup is bounded by `TASK_SUGGEST_TIMEOUT_MS`; a lookup over budget
+    yields no suggestions rather than a slow response. Empty results are
+    not cached, so an over-budget lookup is retried on the next keystroke.
+
+    :param owner_id: ID of the authenticated owner.
+    :param prefix: Text typed so far.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param cache: Optional cache of suggestions.
+    :param limit: Maximum number of suggestions, capped at `MAX_SUGGESTIONS`.
+    :return: Suggestions, best first.
+    """
+    prefix = " ".join(prefix.split()).lower()
+    if not prefix:
+        return []
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+
+    if cache is not None:
+        cached = await cache.get(owner_id, prefix, limit)
+        if cached is not None:
+            return cached
+
+    async with uow:
+        suggestions = await uow.tasks.autocomplete(owner_id, prefix, limit=limit, timeout_ms=settings.TASK_SUGGEST_TIMEOUT_MS)
+
+    if cache is not None and suggestions:
+        await cache.set(owner_id, prefix, limit, suggestions)
+    return suggestions
@@ -0,0 +1,129 @@
+from typing import List, Optional
+
+from src.tasks.domain.dtos import TaskCreateDTO, TaskBatchUpdateItemDTO
+from src.tasks.domain.entities import TaskBatchResult, TaskCreate, TaskEvent, TaskUpdate
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
+
+
+async def create_tasks(
+    owner_id: int,
+    tasks_data: List[TaskCreateDTO],
+    uow: ITaskUnitOfWork,
+    events: Optional[ITaskEventPublisher] = None,
+) -> List[TaskBatchResult]:
+    """
+    Create several tasks in one transaction.
+
+    Creation is all-or-nothing: the items are validated before the call, and
+    a failure to insert any of them fails the whole batch, so the results
+    carry no per-item errors.
+
+    :param owner_id: ID of the authenticated owner.
+    :param tasks_data: Data Transfer Objects containing task creation details.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param events: Optional publisher of task events, notified after commit.
+    :return: Per-item results, in input order.
+    """
+    new_tasks = [TaskCreate(owner_id=owner_id, **task_data.model_dump()) for task_data in tasks_data]
+    async with uow:
+        created_tasks = await uow.tasks.add_many(new_tasks)
+        await uow.commit()
+
+    if events is not None:
+        await events.publish([
+            TaskEvent(type="created", owner_id=owner_id, task_id=task.id, task=task) for task in created_tasks
+        ])
+
+    return [
+        TaskBatchResult(index=index, id=task.id, task=task)
+        for index, task in enumerate(created_tasks)
+    ]
+
+
+async def update_tasks(
+    owner_id: int,
+    tasks_data: List[TaskBatchUpdateItemDTO],
+    uow: ITaskUnitOfWork,
+    events: Optional[ITaskEventPublisher] = None,
+) -> List[TaskBatchResult]:
+    """
+    Update several tasks of the owner in one transaction.
+
+    Items referring to a missing task, or repeating a task ID already present
+    earlier in the batch, are reported as errors and do not affect the others.
+    Items setting no field return the task unchanged and notify no one.
+
+    :param owner_id: ID of the authenticated owner.
+    :param tasks_data: Data Transfer Objects containing task IDs and updated details.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param events: Optional publisher of task events, notified after commit.
+    :return: Per-item results, in input order.
+    """
+    results = [TaskBatchResult(index=index, id=task_data.id) for index, task_data in enumerate(tasks_data)]
+    updates = {}
+    unchanged_ids = set()
+    for result, task_data in zip(results, tasks_data):
+        if task_data.id in updates:
+            result.error = f"Task with id {task_data.id} is repeated in the batch"
+            continue
+        fields = {key: value for key, value in task_data.model_dump(mode="json").items() if value is not None}
+        updates[task_data.id] = TaskUpdate(**fields)
+        if fields.keys() == {"id"}:
+            unchanged_ids.add(task_data.id)
+
+    async with uow:
+        updated_tasks = {task.id: task for task in await uow.tasks.update_many(list(updates.values()), owner_id)}
+        await uow.commit()
+
+    if events is not None:
+        await events.publish([
+            TaskEvent(type="updated", owner_id=owner_id, task_id=task.id, task=task)
+            for task in updated_tasks.values()
+            if task.id not in unchanged_ids
+        ])
+    for result in results:
+        if result.error is None:
+            result.task = updated_tasks.get(result.id)
+            if result.task is None:
+                result.error = f"Task with id {result.id} not found"
+    return results
+
+
+async def delete_tasks(
+    owner_id: int,
+    task_ids: List[int],
+    uow: ITaskUnitOfWork,
+    events: Optional[ITaskEventPublisher] = None,
+) -> List[TaskBatchResult]:
+    """
+    Delete several tasks of the owner in one transaction.
+
+    Items referring to a missing task, or repeating a task ID already present
+    earlier in the batch, are reported as errors and do not affect the others.
+
+    :param owner_id: ID of the authenticated owner.
+    :param task_ids: IDs of the tasks to delete.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param events: Optional publisher of task events, notified after commit.
+    :return: Per-item results, in input order.
+    """
+    results = [TaskBatchResult(index=index, id=task_id) for index, task_id in enumerate(task_ids)]
+    deletes = {}
+    for result in results:
+        if result.id in deletes:
+            result.error = f"Task with id {result.id} is repeated in the batch"
+            continue
+        deletes[result.id] = result
+
+    async with uow:
+        deleted_ids = await uow.tasks.delete_many(list(deletes), owner_id)
+        await uow.commit()
+
+    if events is not None:
+        await events.publish([TaskEvent(type="deleted", owner_id=owner_id, task_id=task_id) for task_id in deleted_ids])
+    deleted_ids = set(deleted_ids)
+    for result in deletes.values():
+        if result.id not in deleted_ids:
+            result.error = f"Task with id {result.id} not found"
+    return results
@@ -0,0 +1,37 @@
+from typing import Optional
+
+from src.tasks.domain.entities import TaskChanges
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+
+
+DEFAULT_CHANGES_PAGE_SIZE = 200
+MAX_CHANGES_PAGE_SIZE = 1000
+
+
+async def list_task_changes(
+    owner_id: int,
+    uow: ITaskUnitOfWork,
+    since: Optional[str] = None,
+    limit: int = DEFAULT_CHANGES_PAGE_SIZE,
+) -> TaskChanges:
+    """
+    Return what changed in the owner's tasks since a sync cursor.
+
+    Clients store `next_cursor` and pass it as `since` on the next sync,
+    repeating right away while `has_more` is set. Without `since` every
+    live task is returned, page by page, and no earlier deletions. Deletions
+    are retained for `TASK_TOMBSTONE_RETENTION_DAYS`; a client whose cursor
+    is older gets `TaskSyncExpired` and syncs again without `since`. The
+    page size is capped at `MAX_CHANGES_PAGE_SIZE` regardless of the
+    requested limit.
+
+    :param owner_id: ID of the authenticated owner.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param since: Cursor returned by the previous sync.
+    :param limit: Requested maximum number of tasks, and of deleted IDs, per page.
+    :return: The changes and the cursor to continue from.
+    :raises TaskSyncExpired: If deletions after `since` are no longer retained.
+    """
+    limit = max(1, min(limit, MAX_CHANGES_PAGE_SIZE))
+    async with uow:
+        return await uow.tasks.changes_since(owner_id, cursor=since, limit=limit)
@@ -1,27 +1,34 @@
-from src.tasks.domain.entities import Task, TaskCreate
+from typing import Optional
+
+from src.tasks.domain.entities import Task, TaskCreate, TaskEvent
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
 from src.tasks.domain.dtos import TaskCreateDTO
-from src.users.domain.interfaces.user_uow import IUserUnitOfWork
 
 
 async def create_task(
     owner_id: int,
     task_data: TaskCreateDTO,
     uow: ITaskUnitOfWork,
-    user_uow: IUserUnitOfWork
+    events: Optional[ITaskEventPublisher] = None,
 ) -> Task:
     """
     Create a new task in the system.
 
     This function creates a new task entity, saves it to the database, 
-    and commits the transaction.
+    and commits the transaction. Subscribers are notified after commit.
 
+    :param owner_id: ID of the authenticated owner.
     :param task_data: Data Transfer Object containing task creation details.
     :param uow: Unit of Work instance for handling task repository operations.
+    :param events: Optional publisher of task events.
     :return: Newly created task object.
     """
     new_task = TaskCreate(owner_id=owner_id, **task_data.model_dump())
     async with uow:
-        created_task = await uow.tasks.add(new_task, user_uow)
+        created_task = await uow.tasks.add(new_task)
         await uow.commit()
-        return created_task
+
+    if events is not None:
+        await events.publish([TaskEvent(type="created", owner_id=owner_id, task_id=created_task.id, task=created_task)])
+    return created_task
@@ -1,18 +1,30 @@
+from typing import Optional
+
+from src.tasks.domain.entities import TaskEvent
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
 
 
 async def delete_task(
     task_id: int,
+    owner_id: int,
     uow: ITaskUnitOfWork,
+    events: Optional[ITaskEventPublisher] = None,
 ) -> None:
     """
-    Delete a task by its ID.
+    Delete a task of the given owner by its ID.
 
     This function removes the task from the database and commits the transaction.
+    Subscribers are notified after commit.
 
     :param task_id: ID of the task to delete.
+    :param owner_id: ID of the tasks owner; tasks of other owners are not found.
     :param uow: Unit of Work instance for handling task repository operations.
+    :param events: Optional publisher of task events.
     """
     async with uow:
-        await uow.tasks.delete(task_id)
+        await uow.tasks.delete_for_owner(task_id, owner_id)
         await uow.commit()
+
+    if events is not None:
+        await events.publish([TaskEvent(type="deleted", owner_id=owner_id, task_id=task_id)])
@@ -0,0 +1,38 @@
+import asyncio
+from typing import AsyncIterator, Optional
+
+from src.tasks.domain.entities import TaskEvent
+from src.tasks.domain.interfaces.task_event_broker import ITaskEventBroker
+
+
+async def watch_tasks(
+    owner_id: int,
+    broker: ITaskEventBroker,
+    last_event_id: Optional[str] = None,
+    heartbeat_seconds: float = 15,
+) -> AsyncIterator[Optional[TaskEvent]]:
+    """
+    Follow changes to the owner's tasks as they are published.
+
+    Events published after `last_event_id` are delivered first, as far back
+    as they are retained; if some were lost, a "reset" event asks the caller
+    to resync. The iterator ends when the subscription is closed, e.g.
+    because the caller fell behind, and it can then resume from the last
+    event it saw.
+
+    :param owner_id: ID of the authenticated owner.
+    :param broker: Broker of task events.
+    :param last_event_id: ID of the last event the caller saw, if resuming.
+    :param heartbeat_seconds: Idle time after which None is yielded, so that the caller can keep its connection alive.
+    :return: Async iterator of events, with None for heartbeats.
+    """
+    async with broker.subscribe(owner_id, last_event_id) as subscription:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), heartbeat_seconds)
+            except asyncio.TimeoutError:
+                yield None
+                continue
+            if event is None:
+                return
+            yield event
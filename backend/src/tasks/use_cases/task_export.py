@@ -0,0 +1,57 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Literal
+
+from src.tasks.domain.entities import Task
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+
+
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = ("id", "title", "description", "status", "created_at", "updated_at", "owner_id")
+
+
+async def export_tasks(
+    owner_id: int,
+    uow: ITaskUnitOfWork,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = EXPORT_BATCH_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Serialize all of the owner's tasks as NDJSON or CSV, chunk by chunk.
+
+    Tasks are read and encoded one batch at a time, so memory stays constant
+    regardless of the number of tasks. The unit of work stays open until the
+    iterator is exhausted or closed.
+
+    :param owner_id: ID of the authenticated owner.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param format: Output format, "ndjson" (one JSON object per line) or "csv" (with a header row).
+    :param batch_size: Number of tasks per chunk.
+    :return: Async iterator of UTF-8 encoded chunks.
+    """
+    encode = _encode_csv if format == "csv" else _encode_ndjson
+    if format == "csv":
+        yield (",".join(EXPORT_FIELDS) + "\r\n").encode("utf-8")
+
+    async with uow:
+        async for tasks in uow.tasks.stream_for_owner(owner_id, batch_size=batch_size):
+            yield encode(tasks)
+
+
+def _row(task: Task) -> dict:
+    row = {field: getattr(task, field) for field in EXPORT_FIELDS}
+    row["created_at"] = task.created_at.isoformat()
+    row["updated_at"] = task.updated_at.isoformat()
+    return row
+
+
+def _encode_ndjson(tasks: list[Task]) -> bytes:
+    return "".join(json.dumps(_row(task), ensure_ascii=False) + "\n" for task in tasks).encode("utf-8")
+
+
+def _encode_csv(tasks: list[Task]) -> bytes:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    writer.writerows(_row(task) for task in tasks)
+    return buffer.getvalue().encode("utf-8")
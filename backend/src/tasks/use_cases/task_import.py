@@ -0,0 +1,167 @@
+import codecs
+import csv
+from typing import Any, AsyncIterable, AsyncIterator, Literal, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.tasks.domain.dtos import TaskCreateDTO
+from src.tasks.domain.entities import TaskCreate, TaskImportError, TaskImportReport
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+
+
+IMPORT_BATCH_SIZE = 5000
+MAX_IMPORT_ERRORS = 1000
+MAX_IMPORT_RECORD_LENGTH = 1024 * 1024
+
+
+async def import_tasks(
+    owner_id: int,
+    chunks: AsyncIterable[bytes],
+    uow: ITaskUnitOfWork,
+    format: Literal["ndjson", "csv"] = "ndjson",
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_record_length: int = MAX_IMPORT_RECORD_LENGTH,
+) -> TaskImportReport:
+    """
+    Create the owner's tasks from an uploaded NDJSON or CSV file.
+
+    The file is parsed and validated against `TaskCreateDTO` row by row as it
+    arrives, and valid rows are staged in batches, so memory does not grow
+    with its size. Valid rows are then created in one transaction; invalid
+    ones are reported by line and skipped.
+
+    NDJSON files hold one JSON object per line. CSV files start with a header
+    row naming the columns; empty descriptions are imported as missing.
+
+    Rows longer than `max_record_length` characters are reported instead of
+    buffered. Since a CSV row only ends where its quotes balance, an overlong
+    CSV row, such as one opened by a stray quote, also ends the import of the
+    rows after it.
+
+    :param owner_id: ID of the authenticated owner.
+    :param chunks: The uploaded file, as UTF-8 encoded chunks.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param format: Input format, "ndjson" or "csv".
+    :param batch_size: Number of rows staged at once.
+    :param max_record_length: Maximum length of a row in characters.
+    :return: Number of created tasks and the rejected rows.
+    """
+    report = TaskImportReport()
+    records = _csv_records(chunks, max_record_length) if format == "csv" else _ndjson_records(chunks, max_record_length)
+    batch = []
+    async with uow:
+        async for line, record, error in records:
+            if error is None:
+                try:
+                    if isinstance(record, str):
+                        task_data = TaskCreateDTO.model_validate_json(record)
+                    else:
+                        task_data = TaskCreateDTO.model_validate(record)
+                except ValidationError as e:
+                    error = "; ".join(f"{'.'.join(map(str, item['loc'])) or 'row'}: {item['msg']}" for item in e.errors())
+            if error is not None:
+                report.failed += 1
+                if len(report.errors) < MAX_IMPORT_ERRORS:
+                    report.errors.append(TaskImportError(line=line, error=error))
+                continue
+
+            batch.append(TaskCreate(owner_id=owner_id, title=task_data.title, description=task_data.description))
+            if len(batch) >= batch_size:
+                await uow.tasks.stage_many(batch)
+                batch = []
+
+        await uow.tasks.stage_many(batch)
+        report.imported = await uow.tasks.merge_staged()
+        await uow.commit()
+
+    return report
+
+
+Record = Tuple[int, Any, Optional[str]]
+
+
+async def _lines(chunks: AsyncIterable[bytes], max_length: int) -> AsyncIterator[Optional[str]]:
+    """
+    Split UTF-8 encoded chunks into lines, keeping their line endings.
+
+    Lines longer than `max_length` characters are yielded as None and the
+    rest of them is skipped, so memory stays bounded by `max_length`.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    skipping = False
+    async for chunk in chunks:
+        *lines, rest = decoder.decode(chunk).split("\n")
+        for line in lines:
+            if skipping:
+                skipping = False
+                continue
+            line, tail = tail + line, ""
+            yield line + "\n" if len(line) <= max_length else None
+        if skipping:
+            continue
+        tail += rest
+        if len(tail) > max_length:
+            yield None
+            tail, skipping = "", True
+    tail += decoder.decode(b"", final=True)
+    if tail and not skipping:
+        yield tail if len(tail) <= max_length else None
+
+
+async def _ndjson_records(chunks: AsyncIterable[bytes], max_length: int) -> AsyncIterator[Record]:
+    """
+    Yield (line, raw JSON, error) for every non-blank line of an NDJSON file.
+
+    Lines are left unparsed: validating them straight from JSON is faster.
+    """
+    line_number = 0
+    async for line in _lines(chunks, max_length):
+        line_number += 1
+        if line is None:
+            yield line_number, None, f"Line exceeds {max_length} characters"
+        elif line.strip():
+            yield line_number, line, None
+
+
+async def _csv_records(chunks: AsyncIterable[bytes], max_length: int) -> AsyncIterator[Record]:
+    """
+    Yield (line, row mapping, error) for every data row of a CSV file with a header.
+
+    A quoted field may span lines: lines are joined until their quotes
+    balance, since escaped quotes inside fields always come in pairs. A row
+    longer than `max_length` characters is reported and ends the file, as the
+    rows after it can no longer be told apart.
+    """
+    header = None
+    line_number = start = 0
+    pending = ""
+    async for line in _lines(chunks, max_length):
+        line_number += 1
+        if not pending:
+            start = line_number
+        if line is None or len(pending) + len(line) > max_length:
+            yield start, None, f"Row exceeds {max_length} characters, the rest of the file was skipped"
+            return
+        pending += line
+        if pending.count('"') % 2:
+            continue
+
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+        try:
+            values = next(csv.reader([record]))
+        except csv.Error as e:
+            yield start, None, f"Invalid CSV: {e}"
+            continue
+        if header is None:
+            header = [name.strip().lower() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start, {name: value or None for name, value in zip(header, values)}, None
+
+    if pending:
+        yield start, None, "Invalid CSV: unterminated quoted field"
@@ -0,0 +1,32 @@
+from typing import Literal, Optional
+
+from src.tasks.domain.entities import TaskPage
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+async def list_tasks(
+    owner_id: int,
+    uow: ITaskUnitOfWork,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    status: Optional[Literal["pending", "completed", "archived"]] = None,
+) -> TaskPage:
+    """
+    Return one page of the owner's tasks.
+
+    The page size is capped at `MAX_PAGE_SIZE` regardless of the requested limit.
+
+    :param owner_id: ID of the authenticated owner.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param cursor: Opaque cursor returned with the previous page.
+    :param limit: Requested page size.
+    :param status: Optional status filter.
+    :return: The requested page of tasks.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    async with uow:
+        return await uow.tasks.list_for_owner(owner_id, limit=limit, cursor=cursor, status=status)
@@ -0,0 +1,82 @@
+from typing import Callable, List, Optional, Union
+
+from src.core.domain.exceptions.exceptions import AppException
+from src.tasks.domain.dtos import TaskCreateOperationDTO, TaskDeleteOperationDTO, TaskUpdateOperationDTO
+from src.tasks.domain.entities import TaskBatchResult, TaskOperationResult
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.use_cases.task_batch import create_tasks, delete_tasks, update_tasks
+
+
+TaskOperation = Union[TaskCreateOperationDTO, TaskUpdateOperationDTO, TaskDeleteOperationDTO]
+
+
+async def apply_task_operations(
+    owner_id: int,
+    operations: List[TaskOperation],
+    uow_factory: Callable[[], ITaskUnitOfWork],
+    events: Optional[ITaskEventPublisher] = None,
+) -> List[TaskOperationResult]:
+    """
+    Apply a sequence of task operations with as few transactions as possible.
+
+    Consecutive operations of the same type are coalesced into one batch and
+    applied in one transaction by the batch use cases. A batch is cut short
+    when the type changes or a task ID repeats, so operations still take
+    effect in the order they were sent. A batch that fails as a whole
+    reports its error on each of its operations and does not affect the
+    other batches.
+
+    :param owner_id: ID of the authenticated owner.
+    :param operations: Operations, in the order they were sent.
+    :param uow_factory: Callable returning a new Unit of Work for each batch.
+    :param events: Optional publisher of task events, notified after each commit.
+    :return: Per-operation results, in input order.
+    """
+    results: List[TaskOperationResult] = []
+    for batch in _coalesce(operations):
+        try:
+            batch_results = await _apply(owner_id, batch, uow_factory(), events)
+        except AppException as e:
+            batch_results = [TaskBatchResult(index=index, error=e.detail) for index in range(len(batch))]
+        results.extend(
+            TaskOperationResult(ref=operation.ref, op=operation.op, id=result.id, task=result.task, error=result.error)
+            for operation, result in zip(batch, batch_results)
+        )
+    return results
+
+
+def _coalesce(operations: List[TaskOperation]) -> List[List[TaskOperation]]:
+    batches: List[List[TaskOperation]] = []
+    task_ids: set[int] = set()
+    for operation in operations:
+        task_id = _task_id(operation)
+        if not batches or batches[-1][0].op != operation.op or task_id in task_ids:
+            batches.append([])
+            task_ids = set()
+        batches[-1].append(operation)
+        if task_id is not None:
+            task_ids.add(task_id)
+    return batches
+
+
+def _task_id(operation: TaskOperation) -> Optional[int]:
+    if isinstance(operation, TaskUpdateOperationDTO):
+        return operation.data.id
+    if isinstance(operation, TaskDeleteOperationDTO):
+        return operation.id
+    return None
+
+
+async def _apply(
+    owner_id: int,
+    batch: List[TaskOperation],
+    uow: ITaskUnitOfWork,
+    events: Optional[ITaskEventPublisher],
+) -> List[TaskBatchResult]:
+    op = batch[0].op
+    if op == "create":
+        return await create_tasks(owner_id, [operation.data for operation in batch], uow, events)
+    if op == "update":
+        return await update_tasks(owner_id, [operation.data for operation in batch], uow, events)
+    return await delete_tasks(owner_id, [operation.id for operation in batch], uow, events)
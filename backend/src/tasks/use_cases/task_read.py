@@ -4,17 +4,19 @@ from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
 
 async def read_task(
     task_pk: int,
+    owner_id: int,
     uow: ITaskUnitOfWork,
 ) -> Task:
     """
-    Retrieve a task by its ID.
+    Retrieve a task of the given owner by its ID.
 
     This function fetches the task from the database and returns it.
 
     :param task_id: ID of the task to retrieve.
+    :param owner_id: ID of the tasks owner; tasks of other owners are not found.
     :param uow: Unit of Work instance for handling task repository operations.
     :return: The task object.
     """
     async with uow:
-        task = await uow.tasks.get_by_id(task_pk)
+        task = await uow.tasks.get_for_owner(task_pk, owner_id)
         return task
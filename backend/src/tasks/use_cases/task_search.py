@@ -0,0 +1,34 @@
+from typing import Optional
+
+from src.tasks.domain.entities import TaskPage
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.use_cases.task_list import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
+
+async def search_tasks(
+    owner_id: int,
+    query: str,
+    uow: ITaskUnitOfWork,
+    cursor: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> TaskPage:
+    """
+    Return one page of the owner's tasks matching a full-text query, best match first.
+
+    The page size is capped at `MAX_PAGE_SIZE` regardless of the requested limit.
+    A blank query matches nothing.
+
+    :param owner_id: ID of the authenticated owner.
+    :param query: Search query in web search syntax.
+    :param uow: Unit of Work instance for handling task repository operations.
+    :param cursor: Opaque cursor returned with the previous page.
+    :param limit: Requested page size.
+    :return: The requested page of tasks.
+    """
+    query = query.strip()
+    if not query:
+        return TaskPage()
+
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    async with uow:
+        return await uow.tasks.search(owner_id, query, cursor=cursor, limit=limit)
@@ -0,0 +1,35 @@
+import datetime
+from typing import Callable
+
+from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+
+
+TOMBSTONE_PRUNE_BATCH_SIZE = 1000
+
+
+async def prune_task_tombstones(
+    uow_factory: Callable[[], ITaskUnitOfWork],
+    retention: datetime.timedelta,
+    batch_size: int = TOMBSTONE_PRUNE_BATCH_SIZE,
+) -> int:
+    """
+    Delete the records of task deletions older than the retention period.
+
+    Runs in batches of `batch_size`, each in its own short transaction, until
+    a batch comes back incomplete. Sync cursors older than the retention
+    period are refused, so no client misses a pruned deletion.
+
+    :param uow_factory: Callable returning a new unit of work for each batch.
+    :param retention: How long deletions are kept for delta sync.
+    :param batch_size: Maximum number of records deleted per transaction.
+    :return: Number of records deleted.
+    """
+    pruned = 0
+    while True:
+        uow = uow_factory()
+        async with uow:
+            count = await uow.tasks.prune_tombstones(retention, limit=batch_size)
+            await uow.commit()
+        pruned += count
+        if count < batch_size:
+            return pruned
@@ -1,5 +1,8 @@
-from src.tasks.domain.entities import Task, TaskUpdate
+from typing import Optional
+
+from src.tasks.domain.entities import Task, TaskEvent, TaskUpdate
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
+from src.tasks.domain.interfaces.task_event_publisher import ITaskEventPublisher
 from src.tasks.domain.dtos import TaskUpdateDTO
 from src.tasks.domain.exceptions import TaskNotFound
 
@@ -7,16 +10,21 @@ from src.tasks.domain.exceptions import TaskNotFound
 async def update_task(
     task_pk: int,
     task_data: TaskUpdateDTO,
+    owner_id: int,
     uow: ITaskUnitOfWork,
+    events: Optional[ITaskEventPublisher] = None,
 ) -> Task:
     """
-    Update an existing task.
+    Update an existing task of the given owner.
 
     This function updates the task's details in the database and commits the transaction.
+    Subscribers are notified after commit.
 
     :param task_id: ID of the task to update.
     :param updated_data: Data Transfer Object containing the updated task details.
+    :param owner_id: ID of the tasks owner; tasks of other owners are not found.
     :param uow: Unit of Work instance for handling task repository operations.
+    :param events: Optional publisher of task events.
     :return: The updated task object.
     """
     updated_task = TaskUpdate(
@@ -25,7 +33,9 @@ async def update_task(
     )
 
     async with uow:
-        task = await uow.tasks.update(updated_task)
+        task = await uow.tasks.update_for_owner(updated_task, owner_id)
         await uow.commit()
-    print(task.dict)
+
+    if events is not None:
+        await events.publish([TaskEvent(type="updated", owner_id=owner_id, task_id=task.id, task=task)])
     return task
@@ -4,7 +4,7 @@ from typing import Any
 from src.core.domain.entity_base import EntityBase
 
 
-@dataclass
+@dataclass(slots=True)
 class User(EntityBase):
     """
     Domain model representing a user in the system.
@@ -31,7 +31,7 @@ class User(EntityBase):
     tasks: Any = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserCreate(EntityBase):
     """
     Domain model representing user data required for creation.
@@ -54,7 +54,7 @@ class UserCreate(EntityBase):
     is_verified: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class UserUpdate(EntityBase):
     """
     Domain model for updating user information.
@@ -1,4 +1,4 @@
-from src.core.domain.exceptions.exceptions import AlreadyExists, NotFound
+from src.core.domain.exceptions.exceptions import AlreadyExists, NotFound, ServiceUnavailable
 
 
 class UserAlreadyExists(AlreadyExists):
@@ -7,3 +7,7 @@ class UserAlreadyExists(AlreadyExists):
 
 class UserNotFound(NotFound):
     detail = "User with this data not found"
+
+
+class PasswordHasherBusy(ServiceUnavailable):
+    detail = "Too many password operations in progress, try again later"
@@ -11,3 +11,22 @@ class IPasswordHasher(ABC):
     def verify(self, password: str, hashed_password: str) -> bool:
         """Verify is a password matches the hashed one."""
         pass
+
+
+class IAsyncPasswordHasher(ABC):
+    """
+    Password hasher whose operations do not block the event loop.
+
+    Hashing is deliberately CPU-expensive, so implementations are expected
+    to run it outside the event loop thread.
+    """
+
+    @abstractmethod
+    async def hash(self, password: str) -> str:
+        """Generate a hash from a text password."""
+        pass
+
+    @abstractmethod
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """Verify is a password matches the hashed one."""
+        pass
@@ -0,0 +1,52 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.users.domain.entities import User
+
+
+class IUserCache(ABC):
+    """
+    Interface for a cache of authenticated users (principals).
+
+    Lets the authentication layer resolve a user by ID without a database
+    round trip. Implementations must be invalidated whenever the user changes.
+    """
+
+    @abstractmethod
+    async def get(self, user_id: int) -> Optional[User]:
+        """
+        Return a cached user.
+
+        :param user_id: ID of the user.
+        :return: The cached User entity, or None on a cache miss.
+        """
+        pass
+
+    @abstractmethod
+    async def version(self, user_id: int) -> Optional[int]:
+        """
+        Return the current version of a user, to be read before loading it.
+
+        :param user_id: ID of the user.
+        :return: The version, or None if it could not be read.
+        """
+        pass
+
+    @abstractmethod
+    async def set(self, user: User, version: Optional[int]) -> None:
+        """
+        Store a user in the cache unless it has been invalidated since `version`.
+
+        :param user: User entity to cache.
+        :param version: Version of the user read before loading it.
+        """
+        pass
+
+    @abstractmethod
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user from the cache.
+
+        :param user_id: ID of the user.
+        """
+        pass
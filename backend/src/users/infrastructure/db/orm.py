@@ -49,4 +49,5 @@ class DBUser(Base):
         default=False,
         nullable=False
     )
-    tasks: Mapped[Any] = relationship("DBTask", back_populates="owner")
+    # Tasks are deleted by the ON DELETE CASCADE foreign key; the ORM never loads them for that.
+    tasks: Mapped[Any] = relationship("DBTask", back_populates="owner", passive_deletes=True)
@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from typing import Callable
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.engine import Row
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -18,14 +21,24 @@ class PGUserRepo(IUserRepo):
         session (AsyncSession): The database session used for all operations.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(self, session: AsyncSession | Callable[[], AsyncSession]) -> None:
         """
-        Initialize the repository with an active database session.
+        Initialize the repository with a database session.
 
-        :param session: Async SQLAlchemy session.
+        :param session: Async SQLAlchemy session, or a callable returning it on first use.
         """
         super().__init__()
-        self.session = session
+        self._session = session
+
+    @property
+    def session(self) -> AsyncSession:
+        """
+        Database session, resolved on first use so that repository calls
+        served without a query never create one.
+        """
+        if callable(self._session):
+            self._session = self._session()
+        return self._session
 
     async def add(self, user: UserCreate) -> User:
         """
@@ -89,41 +102,51 @@ class PGUserRepo(IUserRepo):
         """
         Update user fields based on input data.
 
+        Issues a single UPDATE ... RETURNING setting the fields that are not None.
+
         :param user_data: Domain model containing updated user fields.
         :return: Updated user as a domain model.
         :raises UserNotFound: If the user with the specified ID does not exist.
         """
-        stmt = select(DBUser).where(DBUser.id == user_data.id)
+        columns = DBUser.__table__.c
+        changes = {
+            field: value for field, value in user_data.items()
+            if field != "id" and field in columns and value is not None
+        }
+        if not changes:
+            return await self.get_by_pk(user_data.id)
+
+        stmt = (
+            update(DBUser)
+            .where(DBUser.id == user_data.id)
+            .values(**changes)
+            .returning(*columns)
+        )
         result = await self.session.execute(stmt)
-        obj: DBUser | None = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if not obj:
+        if row is None:
             raise UserNotFound(detail=f"User with id {user_data.id} not found")
 
-        for field, value in user_data.dict.items():
-            if value != None:
-                setattr(obj, field, value)
-
-        await self.session.flush()
-
-        return self._to_domain(obj)
+        return self._to_domain(row)
 
     async def delete(self, pk: int) -> None:
         """
-        Delete a user by primary key (ID).
+        Delete a user by primary key (ID) with a single DELETE ... RETURNING.
+
+        The user's tasks are removed by the database through the
+        `ON DELETE CASCADE` foreign key, without loading them.
 
         :param pk: ID of the user to delete.
         :raises UserNotFound: If the user with the given ID does not exist.
         """
-        obj = await self.session.get(DBUser, pk)
-        if not obj:
+        stmt = delete(DBUser).where(DBUser.id == pk).returning(DBUser.id)
+        result = await self.session.execute(stmt)
+        if result.scalar_one_or_none() is None:
             raise UserNotFound(detail=f"User with id {pk} not found")
 
-        await self.session.delete(obj)
-
-
     @staticmethod
-    def _to_domain(obj: DBUser) -> User:
+    def _to_domain(obj: DBUser | Row) -> User:
         return User(
             id=obj.id,
             name=obj.name,
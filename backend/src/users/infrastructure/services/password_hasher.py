@@ -1,6 +1,13 @@
+import asyncio
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable
+
 import bcrypt
 
-from src.users.domain.interfaces.password_hasher import IPasswordHasher
+from src.core.infrastructure.metrics import metrics
+from src.users.domain.exceptions import PasswordHasherBusy
+from src.users.domain.interfaces.password_hasher import IAsyncPasswordHasher, IPasswordHasher
 
 
 class BcryptPasswordHasher(IPasswordHasher):
@@ -24,4 +31,80 @@ class BcryptPasswordHasher(IPasswordHasher):
         :param hashed_password: Hashed password stored in the database.
         :return: True if the password matches, False otherwise.
         """
-        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
\ No newline at end of file
+        return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+class PooledPasswordHasher(IAsyncPasswordHasher):
+    """
+    Asynchronous password hasher running a synchronous one in an executor.
+
+    At most `max_concurrency` operations run at once and at most `max_queue`
+    more may wait for a slot; further calls are rejected immediately with
+    `PasswordHasherBusy` (503) instead of piling up behind a slow pool.
+
+    Attributes:
+        hasher (IPasswordHasher): Synchronous hasher doing the actual work.
+        executor (Executor): Thread or process pool running the hasher.
+        max_concurrency (int): Maximum number of operations running at once.
+        max_queue (int): Maximum number of operations waiting for a slot.
+    """
+
+    def __init__(self, hasher: IPasswordHasher, executor: Executor, max_concurrency: int, max_queue: int) -> None:
+        """
+        Initialize the hasher.
+
+        :param hasher: Synchronous hasher doing the actual work; must be picklable for process pools.
+        :param executor: Thread or process pool running the hasher.
+        :param max_concurrency: Maximum number of operations running at once.
+        :param max_queue: Maximum number of operations waiting for a slot.
+        """
+        self.hasher = hasher
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending = 0
+
+    async def hash(self, password: str) -> str:
+        """
+        Generate a hash from a text password in the executor.
+
+        :param password: Text password.
+        :return: Hashed password.
+        :raises PasswordHasherBusy: If the wait queue is full.
+        """
+        return await self._run(self.hasher.hash, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Verify if a password matches the hashed one in the executor.
+
+        :param password: Text password to check.
+        :param hashed_password: Hashed password stored in the database.
+        :return: True if the password matches, False otherwise.
+        :raises PasswordHasherBusy: If the wait queue is full.
+        """
+        return await self._run(self.hasher.verify, password, hashed_password)
+
+    @property
+    def pending(self) -> int:
+        """Number of operations running or waiting for a slot."""
+        return self._pending
+
+    async def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if self._pending >= self.max_concurrency + self.max_queue:
+            metrics.incr("password_hasher.rejected")
+            raise PasswordHasherBusy()
+
+        self._pending += 1
+        queued_at = time.perf_counter()
+        try:
+            async with self._semaphore:
+                started_at = time.perf_counter()
+                metrics.observe("password_hasher.wait", started_at - queued_at)
+                try:
+                    return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+                finally:
+                    metrics.observe("password_hasher.hash", time.perf_counter() - started_at)
+        finally:
+            self._pending -= 1
@@ -0,0 +1,146 @@
+import json
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+
+from src.core.infrastructure.cache import FILL_SCRIPT, INVALIDATE_SCRIPT, TTLCache
+from src.core.infrastructure.metrics import metrics
+from src.users.domain.entities import User
+from src.users.domain.interfaces.user_cache import IUserCache
+
+
+logger = logging.getLogger(__name__)
+
+class UserPrincipalCache(IUserCache):
+    """
+    Two-level cache of authenticated users.
+
+    The first level is an in-process TTL/LRU cache, the optional second level
+    is Redis, shared by all workers. Invalidation clears both levels, but other
+    workers may keep serving their local copy until its TTL expires, so the
+    local TTL should stay short. Redis fills are compare-and-set against a
+    per-user version bumped by invalidations, so a request racing with an
+    update or a deletion cannot share the row it replaced.
+
+    Only the fields authentication needs are written to Redis; users read
+    back from it carry no password hash. Redis failures are logged and
+    treated as cache misses, so authentication falls back to the database.
+
+    Attributes:
+        local (TTLCache): In-process cache of User entities.
+        redis_client (aioredis.Redis | None): Redis client of the shared level.
+        redis_ttl (int): Time to live of shared entries in seconds.
+    """
+
+    key_prefix = "auth:user:"
+    version_key_prefix = "auth:user-version:"
+    shared_fields = ("id", "name", "email", "is_active", "is_superuser", "is_verified")
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        redis_client: Optional[aioredis.Redis] = None,
+        redis_ttl: int = 300,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        :param maxsize: Maximum number of users kept in process.
+        :param ttl: Time to live of in-process entries in seconds.
+        :param redis_client: Redis client of the shared level, None to disable it.
+        :param redis_ttl: Time to live of shared entries in seconds.
+        """
+        self.local = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.redis_client = redis_client
+        self.redis_ttl = redis_ttl
+        if redis_client is not None:
+            self._fill_script = redis_client.register_script(FILL_SCRIPT)
+            self._invalidate_script = redis_client.register_script(INVALIDATE_SCRIPT)
+
+    async def get(self, user_id: int) -> Optional[User]:
+        """
+        Return a cached user, looking in process first and then in Redis.
+
+        :param user_id: ID of the user.
+        :return: The cached User entity, or None on a cache miss.
+        """
+        user = self.local.get(user_id)
+        if user is not None:
+            metrics.incr("user_cache.local_hits")
+            return user
+
+        if self.redis_client is not None:
+            try:
+                raw = await self.redis_client.get(self._key(user_id))
+            except RedisError:
+                logger.warning("User cache read failed", exc_info=True)
+                raw = None
+            if raw is not None:
+                user = User(**json.loads(raw), hashed_password="")
+                self.local.set(user_id, user)
+                metrics.incr("user_cache.redis_hits")
+                return user
+
+        metrics.incr("user_cache.misses")
+        return None
+
+    async def version(self, user_id: int) -> Optional[int]:
+        """
+        Return the current version of a user, to be read before loading it.
+
+        :param user_id: ID of the user.
+        :return: The version, or None if Redis failed and only the local level may be filled.
+        """
+        if self.redis_client is None:
+            return 0
+        try:
+            raw = await self.redis_client.get(self._version_key(user_id))
+        except RedisError:
+            logger.warning("User cache version read failed", exc_info=True)
+            return None
+        return int(raw or 0)
+
+    async def set(self, user: User, version: Optional[int]) -> None:
+        """
+        Store a user in both cache levels unless it has been invalidated since `version`.
+
+        If Redis is unavailable the user is only cached in process, where it
+        is bounded by the local TTL like any other local copy.
+
+        :param user: User entity to cache.
+        :param version: Version of the user read before loading it, None to skip Redis.
+        """
+        if self.redis_client is not None and version is not None:
+            value = json.dumps({name: getattr(user, name) for name in self.shared_fields})
+            try:
+                stored = await self._fill_script(keys=[self._key(user.id), self._version_key(user.id)], args=[version, value, self.redis_ttl])
+            except RedisError:
+                logger.warning("User cache write failed", exc_info=True)
+            else:
+                if not stored:
+                    metrics.incr("user_cache.stale_fills")
+                    return
+        self.local.set(user.id, user)
+
+    async def invalidate(self, user_id: int) -> None:
+        """
+        Drop a user from both cache levels and bump its version.
+
+        :param user_id: ID of the user.
+        """
+        self.local.pop(user_id)
+        if self.redis_client is not None:
+            try:
+                await self._invalidate_script(keys=[self._key(user_id), self._version_key(user_id)], args=[self.redis_ttl])
+            except RedisError:
+                logger.warning("User cache invalidation failed, the entry expires in %s s", self.redis_ttl, exc_info=True)
+        metrics.incr("user_cache.invalidations")
+
+    def _key(self, user_id: int) -> str:
+        return f"{self.key_prefix}{user_id}"
+
+    def _version_key(self, user_id: int) -> str:
+        return f"{self.version_key_prefix}{user_id}"
@@ -1,22 +1,64 @@
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
+from src.core.infrastructure.clients.redis import get_redis_client
+from src.db.dependencies import get_async_session
+from src.users.domain.interfaces.user_cache import IUserCache
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
 from src.users.infrastructure.db.unit_of_work import PGUserUnitOfWork
+from src.users.infrastructure.services.user_cache import UserPrincipalCache
 
 
-def get_user_uow() -> IUserUnitOfWork:
+def get_user_uow(session: AsyncSession = Depends(get_async_session)) -> IUserUnitOfWork:
     """
     Dependency that provides an instance of IUserUnitOfWork.
 
     This allows the presentation layer to remain decoupled from the actual implementation.
     By default, it returns a PostgreSQL-based unit of work (PGUserUnitOfWork), but the implementation
     can be easily overridden for testing or different environments.
+    The unit of work runs on the request-scoped session.
 
+    :param session: Request-scoped database session.
     :return: IUserUnitOfWork instance.
     """
-    return PGUserUnitOfWork()
+    return PGUserUnitOfWork(session=session)
 
 
-UserUoWDep = Annotated[IUserUnitOfWork, Depends(get_user_uow)]
\ No newline at end of file
+def get_user_read_uow(session: AsyncSession = Depends(get_async_session)) -> IUserUnitOfWork:
+    """
+    Dependency that provides a read-only instance of IUserUnitOfWork.
+
+    Commits are no-ops; the read transaction ends, and the connection returns
+    to the pool, when the unit of work exits. Use it for endpoints that never write.
+
+    :param session: Request-scoped database session.
+    :return: IUserUnitOfWork instance.
+    """
+    return PGUserUnitOfWork(read_only=True, session=session)
+
+
+@lru_cache
+def get_user_cache() -> IUserCache:
+    """
+    Dependency that provides the application-wide cache of authenticated users.
+
+    The cache lives in process and, if `USER_CACHE_REDIS_ENABLED` is set,
+    is backed by Redis shared between workers. `lru_cache` makes it a singleton.
+
+    :return: IUserCache instance.
+    """
+    return UserPrincipalCache(
+        maxsize=settings.USER_CACHE_MAX_SIZE,
+        ttl=settings.USER_CACHE_TTL_SECONDS,
+        redis_client=get_redis_client() if settings.USER_CACHE_REDIS_ENABLED else None,
+        redis_ttl=settings.USER_CACHE_REDIS_TTL_SECONDS,
+    )
+
+
+UserUoWDep = Annotated[IUserUnitOfWork, Depends(get_user_uow)]
+UserReadUoWDep = Annotated[IUserUnitOfWork, Depends(get_user_read_uow)]
+UserCacheDep = Annotated[IUserCache, Depends(get_user_cache)]
\ No newline at end of file
@@ -1,9 +1,11 @@
+from src.users.domain.interfaces.user_cache import IUserCache
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
 
 
 async def delete_user(
     user_pk: int,
     uow: IUserUnitOfWork,
+    user_cache: IUserCache | None = None,
 ) -> None:
     """
     Delete a user by primary key.
@@ -13,7 +15,10 @@ async def delete_user(
 
     :param user_pk: Primary key of the user to be deleted.
     :param uow: Unit Of Work instance for handling user repository operations.
+    :param user_cache: Cache of authenticated users to invalidate after the commit.
     """
     async with uow:
         await uow.users.delete(user_pk)
         await uow.commit()
+    if user_cache is not None:
+        await user_cache.invalidate(user_pk)
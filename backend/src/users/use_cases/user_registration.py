@@ -1,12 +1,12 @@
 from src.users.domain.entities import UserCreate, User
-from src.users.domain.interfaces.password_hasher import IPasswordHasher
+from src.users.domain.interfaces.password_hasher import IAsyncPasswordHasher
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
 from src.users.domain.dtos import UserCreateDTO
 
 
 async def register_user(
     user_data: UserCreateDTO,
-    pwd_hasher: IPasswordHasher,
+    pwd_hasher: IAsyncPasswordHasher,
     uow: IUserUnitOfWork,
 ) -> User:
     """
@@ -22,7 +22,7 @@ async def register_user(
     """
     new_user_data = UserCreate(
         **{key: value for key, value in user_data.model_dump(mode="json").items() if key != "password"},
-        hashed_password=pwd_hasher.hash(user_data.password)
+        hashed_password=await pwd_hasher.hash(user_data.password)
     )
     async with uow:
         new_user = await uow.users.add(new_user_data)
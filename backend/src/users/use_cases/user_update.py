@@ -1,14 +1,16 @@
 from src.users.domain.dtos import UserUpdateDTO
 from src.users.domain.entities import User, UserUpdate
-from src.users.domain.interfaces.password_hasher import IPasswordHasher
+from src.users.domain.interfaces.password_hasher import IAsyncPasswordHasher
+from src.users.domain.interfaces.user_cache import IUserCache
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
 
 
 async def update_user(
     user_pk: int,
     user_data: UserUpdateDTO,
-    pwd_hasher: IPasswordHasher,
+    pwd_hasher: IAsyncPasswordHasher,
     uow: IUserUnitOfWork,
+    user_cache: IUserCache | None = None,
 ) -> User:
     """
     Update an existing user's data.
@@ -19,14 +21,17 @@ async def update_user(
     :param user_pk: Primary key of the user to update.
     :param user_data: Data Transfer Object with fields to update.
     :param uow: Unit Of Work instance for handling user repository operations.
+    :param user_cache: Cache of authenticated users to invalidate after the commit.
     :return: Updated user entity object.
     """
     new_user_data = UserUpdate(
         id=user_pk,
         **{key: value for key, value in user_data.model_dump(mode="json").items() if key != "password" and value is not None},
-        hashed_password=pwd_hasher.hash(user_data.password) if user_data.password else None
+        hashed_password=await pwd_hasher.hash(user_data.password) if user_data.password else None
     )
     async with uow:
         user = await uow.users.update(new_user_data)
         await uow.commit()
+    if user_cache is not None:
+        await user_cache.invalidate(user_pk)
     return user
@@ -13,25 +13,32 @@ async_engine = create_async_engine(settings.test_database_url, poolclass=NullPoo
 
 async_session_maker = async_sessionmaker(async_engine, expire_on_commit=False)
 
+async_readonly_session_maker = async_sessionmaker(
+    async_engine.execution_options(isolation_level="AUTOCOMMIT"),
+    expire_on_commit=False,
+)
+
 
 class TestPGUserUnitOfWork(PGUserUnitOfWork):
-    def __init__(self, session_factory=async_session_maker):
+    def __init__(self, session_factory=async_session_maker, read_only: bool = False):
         """
         Initialize the test unit of work with a session factory.
 
         :param session_factory: Callable that returns a new AsyncSession.
+        :param read_only: Skip commits.
         """
-        self.session_factory = session_factory
+        super().__init__(session_factory=session_factory, read_only=read_only)
 
 
 class TestPGTaskUnitOfWork(PGTaskUnitOfWork):
-    def __init__(self, session_factory=async_session_maker):
+    def __init__(self, session_factory=async_session_maker, read_only: bool = False):
         """
         Initialize the test unit of work with a session factory.
 
         :param session_factory: Callable that returns a new AsyncSession.
+        :param read_only: Skip commits.
         """
-        self.session_factory = session_factory
+        super().__init__(session_factory=session_factory, read_only=read_only)
 
 
 class TestRedisRefreshTokenRepository(RedisRefreshTokenRepository):
@@ -1,5 +1,7 @@
+from typing import Callable
+
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
-from tests.fakes.integration.pgtest_uow import TestPGTaskUnitOfWork
+from tests.fakes.integration.pgtest_uow import TestPGTaskUnitOfWork, async_readonly_session_maker
 
 
 def get_test_task_uow() -> ITaskUnitOfWork:
@@ -13,3 +15,30 @@ def get_test_task_uow() -> ITaskUnitOfWork:
     :return: IUserUnitOfWork instance.
     """
     return TestPGTaskUnitOfWork()
+
+
+def get_test_task_export_uow() -> ITaskUnitOfWork:
+    """
+    Dependency that provides a read-only test instance of ITaskUnitOfWork for streaming exports.
+
+    :return: ITaskUnitOfWork instance.
+    """
+    return TestPGTaskUnitOfWork(read_only=True)
+
+
+def get_test_task_uow_factory() -> Callable[[], ITaskUnitOfWork]:
+    """
+    Dependency that provides a factory of test ITaskUnitOfWork instances.
+
+    :return: Callable returning a new ITaskUnitOfWork instance.
+    """
+    return TestPGTaskUnitOfWork
+
+
+def get_test_task_read_uow() -> ITaskUnitOfWork:
+    """
+    Dependency that provides a read-only test instance of ITaskUnitOfWork.
+
+    :return: ITaskUnitOfWork instance.
+    """
+    return TestPGTaskUnitOfWork(session_factory=async_readonly_session_maker, read_only=True)
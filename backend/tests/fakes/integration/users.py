@@ -1,5 +1,5 @@
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
-from tests.fakes.integration.pgtest_uow import TestPGUserUnitOfWork
+from tests.fakes.integration.pgtest_uow import TestPGUserUnitOfWork, async_readonly_session_maker
 
 def get_test_user_uow() -> IUserUnitOfWork:
     """
@@ -12,3 +12,12 @@ def get_test_user_uow() -> IUserUnitOfWork:
     :return: IUserUnitOfWork instance.
     """
     return TestPGUserUnitOfWork()
+
+
+def get_test_user_read_uow() -> IUserUnitOfWork:
+    """
+    Dependency that provides a read-only test instance of IUserUnitOfWork.
+
+    :return: IUserUnitOfWork instance.
+    """
+    return TestPGUserUnitOfWork(session_factory=async_readonly_session_maker, read_only=True)
@@ -0,0 +1,139 @@
+import asyncio
+import fnmatch
+
+from src.core.infrastructure.cache import FILL_SCRIPT, INVALIDATE_SCRIPT
+from src.tasks.infrastructure.services.task_events import PUBLISH_SCRIPT
+
+
+class FakeRedis:
+    """
+    Minimal in-memory stand-in for `redis.asyncio.Redis` for testing purposes.
+    Supports the string commands and scripts used by the caches, and the streams,
+    pub/sub and publishing script used by task events; expiration and trimming are ignored.
+    """
+
+    def __init__(self):
+        """Initialize with an empty keyspace and no subscribers."""
+        self.data = {}
+        self.streams = {}
+        self.pubsubs = []
+        self._last_stream_id = 0
+
+    async def get(self, key):
+        """Return the value stored at key, or None."""
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        """Store a value at key."""
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys):
+        """Delete keys and return how many existed."""
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+    async def xadd(self, key, fields, maxlen=None, approximate=True):
+        """Append an entry to a stream and return its ID."""
+        self._last_stream_id += 1
+        entry_id = f"{self._last_stream_id}-0"
+        self.streams.setdefault(key, []).append((entry_id, dict(fields)))
+        return entry_id
+
+    async def xrange(self, key, min="-", max="+", count=None):
+        """Return stream entries with IDs from min, inclusive."""
+        start = 0 if min == "-" else int(min.split("-")[0])
+        entries = [entry for entry in self.streams.get(key, []) if int(entry[0].split("-")[0]) >= start]
+        return entries[:count] if count else entries
+
+    async def publish(self, channel, message):
+        """Deliver a message to pattern subscribers and return how many received it."""
+        receivers = [pubsub for pubsub in self.pubsubs if pubsub.matches(channel)]
+        for pubsub in receivers:
+            pubsub.messages.put_nowait({"type": "pmessage", "channel": channel, "data": message})
+        return len(receivers)
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        """Return a new pub/sub connection."""
+        pubsub = FakePubSub(self)
+        self.pubsubs.append(pubsub)
+        return pubsub
+
+    def pipeline(self, transaction=True):
+        """Return a pipeline; commands run immediately."""
+        return FakePipeline(self)
+
+    def register_script(self, script):
+        """Return a Python stand-in of one of the application's scripts."""
+        return {
+            PUBLISH_SCRIPT: self._publish_event,
+            FILL_SCRIPT: self._fill,
+            INVALIDATE_SCRIPT: self._invalidate,
+        }[script]
+
+    async def _publish_event(self, keys, args, client=None):
+        """XADD to a stream, then PUBLISH with the entry ID."""
+        entry_id = await self.xadd(keys[0], {"event": args[1]})
+        await self.publish(keys[0], f"{entry_id} {args[1]}")
+        if client is not None and client is not self:
+            client.results.append(entry_id)
+        return entry_id
+
+    async def _fill(self, keys, args, client=None):
+        """SET a cached value if its version is unchanged."""
+        if str(self.data.get(keys[1], "0")) != str(args[0]):
+            return None
+        return await self.set(keys[0], args[1])
+
+    async def _invalidate(self, keys, args, client=None):
+        """DEL cached values and INCR their versions."""
+        for key, version_key in zip(keys[::2], keys[1::2]):
+            self.data.pop(key, None)
+            self.data[version_key] = str(int(self.data.get(version_key, "0")) + 1)
+        return len(keys) // 2
+
+
+class FakePubSub:
+    """In-memory pub/sub connection of FakeRedis supporting pattern subscriptions."""
+
+    def __init__(self, redis):
+        """Initialize without subscriptions."""
+        self.redis = redis
+        self.patterns = []
+        self.messages = asyncio.Queue()
+
+    def matches(self, channel):
+        """Return whether a channel matches one of the subscribed patterns."""
+        return any(fnmatch.fnmatchcase(channel, pattern) for pattern in self.patterns)
+
+    async def psubscribe(self, *patterns):
+        """Subscribe to channel patterns."""
+        self.patterns.extend(patterns)
+
+    async def listen(self):
+        """Yield published messages as they arrive."""
+        while True:
+            yield await self.messages.get()
+
+    async def aclose(self):
+        """Close the connection."""
+        self.redis.pubsubs.remove(self)
+
+
+class FakePipeline:
+    """Pipeline of FakeRedis collecting the results of commands run through it."""
+
+    def __init__(self, redis):
+        """Initialize with no results."""
+        self.redis = redis
+        self.results = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def execute(self):
+        """Return the collected results."""
+        results, self.results = self.results, []
+        return results
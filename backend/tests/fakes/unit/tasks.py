@@ -1,8 +1,10 @@
-from src.tasks.domain.entities import Task, TaskCreate, TaskUpdate
-from src.tasks.domain.exceptions import TaskNotFound
+import datetime
+
+from src.core.domain.pagination import decode_cursor, encode_cursor
+from src.tasks.domain.entities import Task, TaskChanges, TaskCreate, TaskPage, TaskSuggestion, TaskUpdate
+from src.tasks.domain.exceptions import TaskNotFound, TaskSyncExpired
 from src.tasks.domain.interfaces.task_repo import ITaskRepo
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
-from src.users.domain.interfaces.user_uow import IUserUnitOfWork
 
 
 class FakeTaskRepo(ITaskRepo):
@@ -12,23 +14,28 @@ class FakeTaskRepo(ITaskRepo):
     """
     
     def __init__(self):
-        """Initialize with empty task list and starting ID counter."""
+        """Initialize with empty task list, starting ID counter and change log."""
         self._tasks = []
         self._last_task_id = 0
+        self._version = 0
+        self._task_versions = {}
+        self._tombstones = []
+        self._pruned_version = 0
+        self._staged = []
 
-    async def add(self, task: TaskCreate, user_uow=IUserUnitOfWork) -> Task:
+    async def add(self, task: TaskCreate) -> Task:
         """
         Add a new task to the repository.
         
         Args:
             task: TaskCreate object containing task data
-            user_uow: User unit of work (unused in this implementation)
             
         Returns:
             Task: The newly created task with assigned ID
         """
         new_task = Task(id=self._get_new_task_id(), **task.dict,)
         self._tasks.append(new_task)
+        self._touch(new_task)
         return new_task
 
     async def get_by_id(self, task_id: int) -> Task:
@@ -60,9 +67,11 @@ class FakeTaskRepo(ITaskRepo):
             Task: The updated task
         """
         updated_task = await self.get_by_id(task.id)
-        for field, value in task.dict.items():
-            if value is not None:
-                setattr(updated_task, field, value)
+        changes = {field: value for field, value in task.items() if value is not None and field != "id"}
+        for field, value in changes.items():
+            setattr(updated_task, field, value)
+        if changes:
+            self._touch(updated_task)
         return updated_task
 
     async def delete(self, task_id: int) -> None:
@@ -77,6 +86,271 @@ class FakeTaskRepo(ITaskRepo):
         """
         task = await self.get_by_id(task_id)
         self._tasks.remove(task)
+        self._bury(task)
+
+    async def get_for_owner(self, task_id: int, owner_id: int) -> Task:
+        """
+        Retrieve a task by its ID if it belongs to the owner.
+        
+        Args:
+            task_id: ID of the task to retrieve
+            owner_id: ID of the tasks owner
+            
+        Returns:
+            Task: The found task
+            
+        Raises:
+            TaskNotFound: If the owner has no task with the given ID
+        """
+        task = await self.get_by_id(task_id)
+        if task.owner_id != owner_id:
+            raise TaskNotFound(detail=f"Task with id {task_id} not found")
+        return task
+
+    async def update_for_owner(self, task: TaskUpdate, owner_id: int) -> Task:
+        """
+        Update an existing task of the owner with new data.
+        
+        Args:
+            task: TaskUpdate object containing fields to update
+            owner_id: ID of the tasks owner
+            
+        Returns:
+            Task: The updated task
+        """
+        await self.get_for_owner(task.id, owner_id)
+        return await self.update(task)
+
+    async def delete_for_owner(self, task_id: int, owner_id: int) -> None:
+        """
+        Delete a task of the owner by its ID.
+        
+        Args:
+            task_id: ID of the task to delete
+            owner_id: ID of the tasks owner
+            
+        Raises:
+            TaskNotFound: If the owner has no task with the given ID
+        """
+        task = await self.get_for_owner(task_id, owner_id)
+        self._tasks.remove(task)
+        self._bury(task)
+
+    async def list_for_owner(self, owner_id: int, limit: int, cursor=None, status=None) -> TaskPage:
+        """
+        Return one page of the owner's tasks ordered by ID descending.
+        
+        Args:
+            owner_id: ID of the tasks owner
+            limit: Maximum number of tasks on the page
+            cursor: Cursor returned with the previous page
+            status: Optional status filter
+            
+        Returns:
+            TaskPage: The requested page of tasks
+        """
+        tasks = sorted(
+            (task for task in self._tasks if task.owner_id == owner_id and (status is None or task.status == status)),
+            key=lambda task: task.id,
+            reverse=True,
+        )
+        if cursor is not None:
+            last_id, = decode_cursor(cursor, size=1)
+            tasks = [task for task in tasks if task.id < last_id]
+        items = tasks[:limit]
+        next_cursor = encode_cursor(items[-1].id) if len(tasks) > limit else None
+        return TaskPage(items=items, next_cursor=next_cursor)
+
+    async def changes_since(self, owner_id: int, cursor=None, limit: int = 200) -> TaskChanges:
+        """
+        Return the owner's tasks changed, and IDs of tasks deleted, after a cursor.
+        
+        Args:
+            owner_id: ID of the tasks owner
+            cursor: Cursor returned by the previous call; None for live tasks only
+            limit: Maximum number of tasks, and of deleted IDs, on the page
+            
+        Returns:
+            TaskChanges: The changes and the cursor to continue from
+
+        Raises:
+            TaskSyncExpired: If tombstones after the cursor have been pruned
+        """
+        if cursor is None:
+            task_version, tombstone_version = 0, self._version
+        else:
+            task_version, tombstone_version = decode_cursor(cursor, size=2)
+            if tombstone_version < self._pruned_version:
+                raise TaskSyncExpired()
+        changed = sorted(
+            (
+                (self._task_versions[task.id], task) for task in self._tasks
+                if task.owner_id == owner_id and self._task_versions[task.id] > task_version
+            ),
+            key=lambda item: item[0],
+        )
+        buried = [item for item in self._tombstones if item[2] == owner_id and item[0] > tombstone_version]
+        has_more = len(changed) > limit or len(buried) > limit
+        changed = changed[:limit]
+        if changed:
+            task_version = changed[-1][0]
+        if len(buried) > limit:
+            buried = buried[:limit]
+            tombstone_version = buried[-1][0]
+        else:
+            tombstone_version = self._version
+        return TaskChanges(
+            tasks=[task for _, task in changed],
+            deleted_ids=[task_id for _, task_id, _, _ in buried],
+            next_cursor=encode_cursor(task_version, tombstone_version),
+            has_more=has_more,
+        )
+
+    async def search(self, owner_id: int, query: str, cursor=None, limit: int = 50) -> TaskPage:
+        """
+        Return one page of the owner's tasks containing every query word, ordered by ID descending.
+        
+        Args:
+            owner_id: ID of the tasks owner
+            query: Search query
+            cursor: Cursor returned with the previous page
+            limit: Maximum number of tasks on the page
+            
+        Returns:
+            TaskPage: The requested page of tasks
+        """
+        words = query.lower().split()
+        tasks = sorted(
+            (
+                task for task in self._tasks
+                if task.owner_id == owner_id
+                and all(word in f"{task.title} {task.description or ''}".lower().split() for word in words)
+            ),
+            key=lambda task: task.id,
+            reverse=True,
+        )
+        if cursor is not None:
+            last_id, = decode_cursor(cursor, size=1)
+            tasks = [task for task in tasks if task.id < last_id]
+        items = tasks[:limit]
+        next_cursor = encode_cursor(items[-1].id) if len(tasks) > limit else None
+        return TaskPage(items=items, next_cursor=next_cursor)
+
+    async def autocomplete(self, owner_id: int, prefix: str, limit: int, timeout_ms=None) -> list[TaskSuggestion]:
+        """
+        Return the owner's tasks whose titles start with the prefix, ordered by ID descending.
+        
+        Args:
+            owner_id: ID of the tasks owner
+            prefix: Text typed so far
+            limit: Maximum number of suggestions
+            timeout_ms: Ignored in this in-memory implementation
+            
+        Returns:
+            list[TaskSuggestion]: Matching suggestions
+        """
+        tasks = sorted(
+            (task for task in self._tasks if task.owner_id == owner_id and task.title.lower().startswith(prefix.lower())),
+            key=lambda task: task.id,
+            reverse=True,
+        )
+        return [TaskSuggestion(id=task.id, title=task.title) for task in tasks[:limit]]
+
+    async def stream_for_owner(self, owner_id: int, batch_size: int):
+        """
+        Iterate over the owner's tasks in ID order, batch by batch.
+        
+        Args:
+            owner_id: ID of the tasks owner
+            batch_size: Number of tasks per batch
+            
+        Yields:
+            list[Task]: The next batch of tasks
+        """
+        tasks = sorted((task for task in self._tasks if task.owner_id == owner_id), key=lambda task: task.id)
+        for start in range(0, len(tasks), batch_size):
+            yield tasks[start:start + batch_size]
+
+    async def add_many(self, tasks: list[TaskCreate]) -> list[Task]:
+        """
+        Add several tasks to the repository.
+        
+        Args:
+            tasks: TaskCreate objects containing task data
+            
+        Returns:
+            list[Task]: The newly created tasks, in input order
+        """
+        return [await self.add(task) for task in tasks]
+
+    async def stage_many(self, tasks: list[TaskCreate]) -> None:
+        """
+        Stage tasks for a bulk import.
+        
+        Args:
+            tasks: TaskCreate objects containing task data
+        """
+        self._staged.extend(tasks)
+
+    async def merge_staged(self) -> int:
+        """
+        Add all staged tasks to the repository.
+        
+        Returns:
+            int: Number of tasks created
+        """
+        created = await self.add_many(self._staged)
+        self._staged = []
+        return len(created)
+
+    async def update_many(self, tasks: list[TaskUpdate], owner_id: int) -> list[Task]:
+        """
+        Update several tasks of one owner, skipping missing ones.
+        
+        Args:
+            tasks: TaskUpdate objects containing fields to update
+            owner_id: ID of the tasks owner
+            
+        Returns:
+            list[Task]: The updated tasks
+        """
+        owned_ids = {task.id for task in self._tasks if task.owner_id == owner_id}
+        return [await self.update(task) for task in tasks if task.id in owned_ids]
+
+    async def delete_many(self, task_ids: list[int], owner_id: int) -> list[int]:
+        """
+        Delete several tasks of one owner, skipping missing ones.
+        
+        Args:
+            task_ids: IDs of the tasks to delete
+            owner_id: ID of the tasks owner
+            
+        Returns:
+            list[int]: IDs of the deleted tasks
+        """
+        deleted = [task for task in self._tasks if task.id in task_ids and task.owner_id == owner_id]
+        for task in deleted:
+            self._tasks.remove(task)
+            self._bury(task)
+        return [task.id for task in deleted]
+
+    async def prune_tombstones(self, older_than: datetime.timedelta, limit: int) -> int:
+        """
+        Delete up to `limit` of the oldest tombstones older than the retention period.
+        
+        Args:
+            older_than: Retention period of tombstones
+            limit: Maximum number of tombstones to delete
+            
+        Returns:
+            int: Number of tombstones deleted
+        """
+        deleted_before = datetime.datetime.now(datetime.timezone.utc) - older_than
+        expired = [item for item in self._tombstones if item[3] < deleted_before][:limit]
+        for item in expired:
+            self._tombstones.remove(item)
+            self._pruned_version = max(self._pruned_version, item[0])
+        return len(expired)
 
     async def list_tasks(self):
         """
@@ -87,6 +361,16 @@ class FakeTaskRepo(ITaskRepo):
         """
         return self._tasks
 
+    def _touch(self, task: Task) -> None:
+        """Record that a task was created or updated."""
+        self._version += 1
+        self._task_versions[task.id] = self._version
+
+    def _bury(self, task: Task) -> None:
+        """Record that a task was deleted."""
+        self._version += 1
+        self._tombstones.append((self._version, task.id, task.owner_id, datetime.datetime.now(datetime.timezone.utc)))
+
     def _get_new_task_id(self) -> int:
         """
         Generate a new unique task ID.
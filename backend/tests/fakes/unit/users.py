@@ -79,7 +79,7 @@ class FakeUserRepo(IUserRepo):
         """
         user = await self.get_by_pk(user_data.id)
 
-        for field, value in user_data.dict.items():
+        for field, value in user_data.items():
             if value is not None:
                 setattr(user, field, value)
 
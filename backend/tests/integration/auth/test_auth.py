@@ -5,3 +5,11 @@ import pytest
 async def test_me(async_client, test_auth):
     response = await async_client.get("/api/auth/me", cookies=test_auth)
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_metrics_require_superuser(async_client, test_auth):
+    response = await async_client.get("/api/metrics")
+    assert response.status_code == 403
+    response = await async_client.get("/api/metrics", cookies=test_auth)
+    assert response.status_code == 403
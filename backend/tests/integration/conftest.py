@@ -5,11 +5,11 @@ import pytest_asyncio
 from pytest_asyncio import is_async_test
 
 from src.main import app
-from src.users.presentation.dependencies import get_user_uow
-from src.tasks.presentation.dependencies import get_task_uow
+from src.users.presentation.dependencies import get_user_read_uow, get_user_uow
+from src.tasks.presentation.dependencies import get_task_export_uow, get_task_read_uow, get_task_uow, get_task_uow_factory
 from src.auth.presentation.dependencies import get_token_repository
-from tests.fakes.integration.users import get_test_user_uow
-from tests.fakes.integration.tasks import get_test_task_uow
+from tests.fakes.integration.users import get_test_user_read_uow, get_test_user_uow
+from tests.fakes.integration.tasks import get_test_task_export_uow, get_test_task_read_uow, get_test_task_uow, get_test_task_uow_factory
 from tests.fakes.integration.auth import get_test_refresh_token_repository
 
 
@@ -36,6 +36,10 @@ def user_data() -> dict[str, str | bool]:
 async def async_client() -> AsyncIterator:
     app.dependency_overrides[get_user_uow] = get_test_user_uow
     app.dependency_overrides[get_task_uow] = get_test_task_uow
+    app.dependency_overrides[get_user_read_uow] = get_test_user_read_uow
+    app.dependency_overrides[get_task_read_uow] = get_test_task_read_uow
+    app.dependency_overrides[get_task_export_uow] = get_test_task_export_uow
+    app.dependency_overrides[get_task_uow_factory] = get_test_task_uow_factory
     app.dependency_overrides[get_token_repository] = get_test_refresh_token_repository
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -44,6 +48,10 @@ async def async_client() -> AsyncIterator:
         yield ac
     app.dependency_overrides.pop(get_user_uow)
     app.dependency_overrides.pop(get_task_uow)
+    app.dependency_overrides.pop(get_user_read_uow)
+    app.dependency_overrides.pop(get_task_read_uow)
+    app.dependency_overrides.pop(get_task_export_uow)
+    app.dependency_overrides.pop(get_task_uow_factory)
     app.dependency_overrides.pop(get_token_repository)
 
 
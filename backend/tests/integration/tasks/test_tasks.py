@@ -1,5 +1,10 @@
+import json
+
 import pytest
 
+from src.tasks.domain.entities import TaskCreate
+from tests.fakes.integration.pgtest_uow import TestPGTaskUnitOfWork
+
 
 @pytest.mark.asyncio(loop_scope="session")
 async def test_update_task(async_client, test_auth, test_task):
@@ -13,3 +18,127 @@ async def test_get_task(async_client, test_auth, test_task):
     response = await async_client.get(f"/api/tasks/{test_task}", cookies=test_auth)
     assert response.status_code == 200
     assert response.json()["id"] == test_task
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_tasks(async_client, test_auth, test_task):
+    response = await async_client.get("/api/tasks", params={"limit": 10}, cookies=test_auth)
+    assert response.status_code == 200
+    assert test_task in [task["id"] for task in response.json()["items"]]
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_list_tasks_invalid_cursor(async_client, test_auth):
+    response = await async_client.get("/api/tasks", params={"cursor": "not-a-cursor"}, cookies=test_auth)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_batch_tasks(async_client, test_auth):
+    response = await async_client.post(
+        "/api/tasks/batch",
+        json={"items": [{"title": f"Batch Task {i}"} for i in range(3)]},
+        cookies=test_auth,
+    )
+    assert response.status_code == 201
+    created = response.json()
+    task_ids = [item["id"] for item in created]
+    assert len(task_ids) == 3
+
+    response = await async_client.patch(
+        "/api/tasks/batch",
+        json={"items": [{"id": task_ids[0], "status": "completed"}, {"id": -1, "title": "Missing"}, {"id": task_ids[1]}]},
+        cookies=test_auth,
+    )
+    assert response.status_code == 200
+    results = response.json()
+    assert results[0]["task"]["status"] == "completed"
+    assert results[1]["error"] is not None
+    assert results[2]["task"]["updated_at"] == created[1]["task"]["updated_at"]
+
+    response = await async_client.post("/api/tasks/batch/delete", json={"ids": task_ids}, cookies=test_auth)
+    assert response.status_code == 200
+    assert all(item["error"] is None for item in response.json())
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_search_tasks(async_client, test_auth, test_task):
+    response = await async_client.get("/api/tasks/search", params={"q": "test task"}, cookies=test_auth)
+    assert response.status_code == 200
+    assert test_task in [task["id"] for task in response.json()["items"]]
+
+    response = await async_client.get("/api/tasks/search", params={"q": "nonexistentword"}, cookies=test_auth)
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_autocomplete_tasks(async_client, test_auth):
+    response = await async_client.post("/api/tasks", json={"title": "Autocomplete probe"}, cookies=test_auth)
+    assert response.status_code == 201
+    task_id = response.json()["id"]
+
+    response = await async_client.get("/api/tasks/autocomplete", params={"q": "autoc"}, cookies=test_auth)
+    assert response.status_code == 200
+    assert task_id in [suggestion["id"] for suggestion in response.json()]
+
+    response = await async_client.delete(f"/api/tasks/{task_id}", cookies=test_auth)
+    assert response.status_code == 204
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_task_changes(async_client, test_auth):
+    response = await async_client.get("/api/tasks/changes", cookies=test_auth)
+    assert response.status_code == 200
+    body = response.json()
+    assert body["next_cursor"]
+
+    response = await async_client.get("/api/tasks/changes", params={"since": "not-a-cursor"}, cookies=test_auth)
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_tasks(async_client, test_auth, test_task):
+    response = await async_client.get("/api/tasks/export", cookies=test_auth)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert test_task in [json.loads(line)["id"] for line in response.text.splitlines()]
+
+    response = await async_client.get("/api/tasks/export", params={"format": "csv", "gzip": True}, cookies=test_auth)
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text.splitlines()[0].startswith("id,title,")
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_export_streams_from_server_side_cursor(async_client, user_data):
+    response = await async_client.post("/api/users", json={**user_data, "email": "exporter@example.com"})
+    assert response.status_code == 201
+    owner_id = response.json()["id"]
+    try:
+        async with TestPGTaskUnitOfWork() as uow:
+            await uow.tasks.add_many([TaskCreate(title=f"Exported {i}", owner_id=owner_id) for i in range(2500)])
+            await uow.commit()
+
+        # The export unit of work is transactional, as the cursor requires.
+        async with TestPGTaskUnitOfWork(read_only=True) as uow:
+            batch_sizes = [len(batch) async for batch in uow.tasks.stream_for_owner(owner_id, batch_size=1000)]
+        assert batch_sizes == [1000, 1000, 500]
+    finally:
+        response = await async_client.delete(f"/api/users/{owner_id}")
+        assert response.status_code == 204
+
+
+@pytest.mark.asyncio(loop_scope="session")
+async def test_import_tasks(async_client, test_auth):
+    body = '{"title": "Imported task"}\n{"description": "No title"}\n'
+    response = await async_client.post("/api/tasks/import", content=body, cookies=test_auth)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["imported"] == 1
+    assert [error["line"] for error in report["errors"]] == [2]
+
+    body = "title,description\r\nImported from CSV,\r\n"
+    response = await async_client.post("/api/tasks/import", params={"format": "csv"}, content=body, cookies=test_auth)
+    assert response.status_code == 200
+    assert response.json()["imported"] == 1
@@ -1,11 +1,13 @@
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import Response
+from fastapi import HTTPException, Response
+from jose import jwt
 
 from src.auth.use_cases.authenticate import authenticate_user
 from src.auth.use_cases.log_out import log_out
 from src.auth.domain.dtos import AuthRequest
 from src.auth.domain.exceptions import IncorrectPassword
+from src.auth.infrastructure.jwt_service import JWTTokenService
 from src.users.domain.exceptions import UserNotFound
 from src.users.domain.entities import User
 
@@ -33,7 +35,7 @@ def mock_dependencies():
     user_uow = AsyncMock()
     user_uow.users = AsyncMock()
     
-    pwd_hasher = MagicMock()
+    pwd_hasher = AsyncMock()
     token_service = MagicMock()
     token_repository = AsyncMock()
     
@@ -170,6 +172,21 @@ async def test_log_out_success(mock_dependencies, mock_response):
     mock_dependencies["token_repository"].delete_refresh_token.assert_called_once_with(1)
 
 
+@pytest.mark.asyncio
+async def test_log_out_invalidates_user_cache(mock_dependencies, mock_response):
+    """Test that logout drops the user from the principal cache"""
+    user_cache = AsyncMock()
+
+    await log_out(
+        response=mock_response,
+        token_repository=mock_dependencies["token_repository"],
+        current_user_id=1,
+        user_cache=user_cache,
+    )
+
+    user_cache.invalidate.assert_called_once_with(1)
+
+
 @pytest.mark.asyncio
 async def test_log_out_token_repository_error(mock_dependencies, mock_response):
     """Test logout with a repository error"""
@@ -220,3 +237,26 @@ async def test_authenticate_user_none_user(mock_auth_request, mock_dependencies,
             token_service=mock_dependencies["token_service"],
             token_repository=mock_dependencies["token_repository"]
         )
+
+
+def test_jwt_decode_cache(mock_user):
+    """Test that verified tokens are served from the cache and invalid ones are still rejected"""
+    service = JWTTokenService(
+        secret_key="secret",
+        algorithm="HS256",
+        access_token_expires_sec=60,
+        refresh_token_expires_sec=120,
+        decode_cache_size=10,
+    )
+    token = service.create_access_token(mock_user)
+
+    with patch("src.auth.infrastructure.jwt_service.jwt.decode", wraps=jwt.decode) as decode:
+        first = service.decode_token(token)
+        second = service.decode_token(token)
+    assert first == second
+    assert first["sub"] == str(mock_user.id)
+    decode.assert_called_once()
+
+    with pytest.raises(HTTPException) as exc_info:
+        service.decode_token(token[:-2] + "xx")
+    assert exc_info.value.status_code == 401
@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+
+import src
+
+
+# Cumulative import time of `src.main`, measured with `python -X importtime`.
+# It was above a second while the routers were imported eagerly.
+IMPORT_BUDGET_MS = 100
+
+# Packages `create_app()` imports; importing `src.main` must not.
+DEFERRED_PACKAGES = {"fastapi", "starlette", "pydantic", "pydantic_settings", "sqlalchemy", "asyncpg", "redis", "jose", "passlib", "bcrypt"}
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(src.__file__)))
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """
+    Import a module in a fresh interpreter and return the cumulative import time of every module, in microseconds.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_main_import_time():
+    """
+    Test that importing `src.main` defers the heavy imports and stays within its time budget.
+    """
+    times = _import_times("src.main")
+
+    assert not {name.partition(".")[0] for name in times} & DEFERRED_PACKAGES
+    assert times["src.main"] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_settings_loaded_on_first_use():
+    """
+    Test that importing the settings module does not validate the environment.
+    """
+    env = {name: value for name, value in os.environ.items() if name in ("PATH", "HOME", "SYSTEMROOT")}
+    result = subprocess.run(
+        [sys.executable, "-c", "import src.core.config as config; print(config.get_settings.cache_info().currsize)"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "0"
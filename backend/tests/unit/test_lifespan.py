@@ -0,0 +1,49 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+import src.lifespan
+from src.core.presentation.api import health_api_router
+from src.lifespan import lifespan
+
+
+@pytest.mark.asyncio
+async def test_readiness_after_warm_up(monkeypatch):
+    """
+    Test that the worker reports ready only once warm-up succeeded, retrying failures.
+    """
+    attempts = []
+    release = asyncio.Event()
+
+    async def warm_up(connections: int) -> None:
+        attempts.append(connections)
+        if len(attempts) == 1:
+            raise ConnectionRefusedError
+        await release.wait()
+
+    shutdown = AsyncMock()
+    monkeypatch.setattr(src.lifespan, "warm_up", warm_up)
+    monkeypatch.setattr(src.lifespan, "shutdown", shutdown)
+    monkeypatch.setattr(src.lifespan.settings, "WARMUP_RETRY_SECONDS", 0)
+
+    app = FastAPI(lifespan=lifespan)
+    app.include_router(health_api_router)
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            assert (await client.get("/api/health/live")).status_code == 200
+            response = await client.get("/api/health/ready")
+            assert response.status_code == 503
+
+            release.set()
+            while not app.state.ready:
+                await asyncio.sleep(0)
+            response = await client.get("/api/health/ready")
+            assert response.status_code == 200
+            assert response.json() == {"status": "ready"}
+
+        assert len(attempts) == 2
+        shutdown.assert_not_awaited()
+    shutdown.assert_awaited_once()
@@ -0,0 +1,158 @@
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+
+from src.auth.presentation.dependencies import get_current_user
+from src.tasks.presentation.api import task_api_router
+from src.tasks.presentation.dependencies import get_task_event_publisher, get_task_uow_factory
+from src.users.domain.entities import User
+from tests.fakes.unit.tasks import FakeTaskRepo, FakeTaskUnitOfWork
+
+
+user = User(id=1, name="username", email="user@example.com", hashed_password="", is_active=True, is_superuser=False, is_verified=True)
+
+
+class WebSocketSession:
+    """
+    Client side of a WebSocket connection to the operations endpoint, driven
+    through ASGI directly so that a handler that never finishes fails the test
+    instead of hanging it.
+    """
+
+    def __init__(self, app: FastAPI):
+        """Start the handler and connect."""
+        self.incoming = asyncio.Queue()
+        self.outgoing = asyncio.Queue()
+        scope = {
+            "type": "websocket",
+            "asgi": {"version": "3.0"},
+            "scheme": "ws",
+            "path": "/api/tasks/ws",
+            "raw_path": b"/api/tasks/ws",
+            "root_path": "",
+            "query_string": b"",
+            "headers": [],
+            "client": ("testclient", 50000),
+            "server": ("testserver", 80),
+            "subprotocols": [],
+        }
+        self.incoming.put_nowait({"type": "websocket.connect"})
+        self.handler = asyncio.create_task(app(scope, self.incoming.get, self.outgoing.put))
+
+    async def receive(self) -> dict:
+        """Return the next ASGI message sent by the server."""
+        return await asyncio.wait_for(self.outgoing.get(), 5)
+
+    async def receive_json(self) -> dict:
+        """Return the next text message sent by the server, decoded."""
+        message = await self.receive()
+        assert message["type"] == "websocket.send", message
+        return json.loads(message["text"])
+
+    def send_json(self, data: dict) -> None:
+        self.incoming.put_nowait({"type": "websocket.receive", "text": json.dumps(data)})
+
+    def send_bytes(self, data: bytes) -> None:
+        self.incoming.put_nowait({"type": "websocket.receive", "bytes": data})
+
+    def disconnect(self) -> None:
+        self.incoming.put_nowait({"type": "websocket.disconnect", "code": 1000})
+
+    async def finished(self) -> None:
+        """Wait for the handler to return."""
+        await asyncio.wait_for(self.handler, 5)
+
+
+class CountingTaskUoWFactory:
+    """
+    Factory of fake units of work sharing one in-memory repository, counting
+    the units of work, and so the transactions, it hands out.
+    """
+
+    def __init__(self):
+        """Initialize with an empty repository."""
+        self.tasks = FakeTaskRepo()
+        self.created = 0
+
+    def __call__(self) -> FakeTaskUnitOfWork:
+        self.created += 1
+        uow = FakeTaskUnitOfWork()
+        uow.tasks = self.tasks
+        return uow
+
+
+@pytest.fixture
+def uow_factory() -> CountingTaskUoWFactory:
+    return CountingTaskUoWFactory()
+
+
+@pytest.fixture
+def app(monkeypatch, uow_factory: CountingTaskUoWFactory) -> FastAPI:
+    """
+    Application serving the task routes to an authenticated user, with a
+    batching window long enough for messages sent together to share it.
+    """
+    monkeypatch.setattr("src.tasks.presentation.api.settings.TASK_OPERATIONS_BATCH_WINDOW_MS", 50)
+    app = FastAPI()
+    app.include_router(task_api_router)
+    app.dependency_overrides[get_current_user] = lambda: user
+    app.dependency_overrides[get_task_uow_factory] = lambda: uow_factory
+    app.dependency_overrides[get_task_event_publisher] = lambda: None
+    return app
+
+
+@pytest.mark.asyncio
+async def test_operations_batched_in_order(app: FastAPI, uow_factory: CountingTaskUoWFactory):
+    """
+    Test that operations sent together share a transaction and are acknowledged in order.
+    """
+    session = WebSocketSession(app)
+    assert (await session.receive())["type"] == "websocket.accept"
+
+    session.send_json({"op": "create", "ref": "a", "data": {"title": "First"}})
+    session.send_json({"op": "create", "ref": "b", "data": {"title": "Second"}})
+    session.send_json({"op": "delete", "ref": "c", "id": -1})
+    session.send_json({"op": "unknown", "ref": "d"})
+    acks = [await session.receive_json() for _ in range(4)]
+
+    assert [ack["ref"] for ack in acks] == ["a", "b", "c", "d"]
+    assert [ack["task"]["title"] for ack in acks[:2]] == ["First", "Second"]
+    assert acks[2]["error"] is not None and acks[3]["error"] is not None
+    # The two creates share a transaction; the invalid message needs none.
+    assert uow_factory.created == 2
+
+    session.disconnect()
+    await session.finished()
+
+
+@pytest.mark.asyncio
+async def test_operations_disconnect(app: FastAPI, uow_factory: CountingTaskUoWFactory):
+    """
+    Test that the handler applies what was received and returns once the client disconnects.
+    """
+    session = WebSocketSession(app)
+    assert (await session.receive())["type"] == "websocket.accept"
+
+    session.send_json({"op": "create", "ref": "a", "data": {"title": "Last words"}})
+    session.disconnect()
+    await session.finished()
+
+    assert [task.title for task in await uow_factory.tasks.list_tasks()] == ["Last words"]
+
+
+@pytest.mark.asyncio
+async def test_operations_binary_message(app: FastAPI):
+    """
+    Test that a binary message closes the connection with 1003 after the earlier operations are acknowledged.
+    """
+    session = WebSocketSession(app)
+    assert (await session.receive())["type"] == "websocket.accept"
+
+    session.send_json({"op": "create", "ref": "a", "data": {"title": "First"}})
+    session.send_bytes(b"\x00")
+    assert (await session.receive_json())["ref"] == "a"
+    closed = await session.receive()
+    assert (closed["type"], closed["code"]) == ("websocket.close", 1003)
+    await session.finished()
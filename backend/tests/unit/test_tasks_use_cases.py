@@ -1,15 +1,46 @@
-from unittest.mock import MagicMock
+import asyncio
+import datetime
+import json
+import os
+import zlib
+from unittest.mock import AsyncMock, MagicMock, NonCallableMagicMock
 import pytest
+from sqlalchemy.exc import DBAPIError
 
 from src.tasks.use_cases.task_create import create_task
 from src.tasks.use_cases.task_read import read_task
+from src.tasks.use_cases.task_list import list_tasks
+from src.tasks.use_cases.task_search import search_tasks
+from src.tasks.use_cases.task_changes import list_task_changes
+from src.tasks.use_cases.task_autocomplete import autocomplete_tasks
+from src.tasks.use_cases.task_export import export_tasks
+from src.tasks.use_cases.task_import import import_tasks
+from src.tasks.use_cases.task_events import watch_tasks
+from src.tasks.use_cases.task_operations import apply_task_operations
+from src.tasks.use_cases.task_batch import create_tasks, update_tasks, delete_tasks
+from src.tasks.use_cases.task_tombstones import prune_task_tombstones
 from src.tasks.use_cases.task_update import update_task
 from src.tasks.use_cases.task_delete import delete_task
-from src.tasks.domain.dtos import TaskCreateDTO, TaskUpdateDTO
+from src.tasks.domain.dtos import (
+    TaskPageDTO,
+    TaskCreateDTO,
+    TaskUpdateDTO,
+    TaskBatchUpdateItemDTO,
+    TaskCreateOperationDTO,
+    TaskUpdateOperationDTO,
+    TaskDeleteOperationDTO,
+)
 from src.tasks.domain.entities import Task
-from src.tasks.domain.exceptions import TaskNotFound
+from src.tasks.domain.exceptions import TaskNotFound, TaskSyncExpired
 from src.tasks.domain.interfaces.task_uow import ITaskUnitOfWork
-from src.users.domain.interfaces.user_uow import IUserUnitOfWork
+from src.tasks.infrastructure.db.repo import QUERY_CANCELED, PGTaskRepo
+from src.tasks.infrastructure.db.unit_of_work import PGTaskUnitOfWork
+from src.tasks.infrastructure.services.task_cache import RedisTaskCache
+from src.tasks.infrastructure.services.task_suggestion_cache import RedisTaskSuggestionCache
+from src.tasks.infrastructure.services.task_events import RedisTaskEventBroker, RedisTaskEventPublisher
+from src.core.presentation.streaming import gzip_chunks
+from src.core.presentation.responses import EntityResponse
+from tests.fakes.unit.redis import FakeRedis
 
 
 task_create_dto = TaskCreateDTO(
@@ -19,78 +50,556 @@ task_create_dto = TaskCreateDTO(
 
 
 @pytest.mark.asyncio
-async def test_create_task(fake_task_uow: ITaskUnitOfWork, fake_user_uow: IUserUnitOfWork):
+async def test_create_task(fake_task_uow: ITaskUnitOfWork):
     """
     Test that a task can be successfully created.
     """
-    task = await create_task(owner_id=1, task_data=task_create_dto, uow=fake_task_uow, user_uow=fake_user_uow)
+    task = await create_task(owner_id=1, task_data=task_create_dto, uow=fake_task_uow)
     assert task.title == task_create_dto.title
     assert task.description == task_create_dto.description
 
 
 @pytest.mark.asyncio
-async def test_get_task(fake_task_uow: ITaskUnitOfWork, fake_user_uow: IUserUnitOfWork):
+async def test_get_task(fake_task_uow: ITaskUnitOfWork):
     """
     Test retrieving a task by ID.
 
     Verifies that a created task is returned correctly,
     and that requesting a non-existent task raises TaskNotFound.
     """
-    task = await _create_task(fake_task_uow, fake_user_uow)
-    result = await read_task(task_pk=task.id, uow=fake_task_uow)
+    task = await _create_task(fake_task_uow)
+    result = await read_task(task_pk=task.id, owner_id=1, uow=fake_task_uow)
     assert result.id == task.id
     assert result.title == task_create_dto.title
 
     with pytest.raises(TaskNotFound) as exc:
-        await read_task(task_pk=-1, uow=fake_task_uow)
+        await read_task(task_pk=-1, owner_id=1, uow=fake_task_uow)
     assert exc.type is TaskNotFound
 
+    with pytest.raises(TaskNotFound):
+        await read_task(task_pk=task.id, owner_id=2, uow=fake_task_uow)
+
 
 @pytest.mark.asyncio
-async def test_update_task(fake_task_uow: ITaskUnitOfWork, fake_user_uow: IUserUnitOfWork):
+async def test_update_task(fake_task_uow: ITaskUnitOfWork):
     """
     Test updating a task's title.
 
     Verifies that the title is updated correctly, and that updating
     a non-existent task raises TaskNotFound.
     """
-    task = await _create_task(fake_task_uow, fake_user_uow)
+    task = await _create_task(fake_task_uow)
 
     update_data = TaskUpdateDTO(title="Updated Test Task")
-    updated_task = await update_task(task_pk=task.id, task_data=update_data, uow=fake_task_uow)
+    updated_task = await update_task(task_pk=task.id, task_data=update_data, owner_id=1, uow=fake_task_uow)
     assert updated_task.id == task.id
     assert updated_task.title == update_data.title
 
     with pytest.raises(TaskNotFound) as exc:
-        await update_task(task_pk=-1, task_data=update_data, uow=fake_task_uow)
+        await update_task(task_pk=-1, task_data=update_data, owner_id=1, uow=fake_task_uow)
     assert exc.type is TaskNotFound
 
+    with pytest.raises(TaskNotFound):
+        await update_task(task_pk=task.id, task_data=update_data, owner_id=2, uow=fake_task_uow)
+
 
 @pytest.mark.asyncio
-async def test_delete_task(fake_task_uow: ITaskUnitOfWork, fake_user_uow: IUserUnitOfWork):
+async def test_delete_task(fake_task_uow: ITaskUnitOfWork):
     """
     Test deleting a task by ID.
 
     Ensures that deletion returns None and that deleting
     the same task again raises TaskNotFound.
     """
-    task = await _create_task(fake_task_uow, fake_user_uow)
-    result = await delete_task(task_id=task.id, uow=fake_task_uow)
+    task = await _create_task(fake_task_uow)
+    with pytest.raises(TaskNotFound):
+        await delete_task(task_id=task.id, owner_id=2, uow=fake_task_uow)
+
+    result = await delete_task(task_id=task.id, owner_id=1, uow=fake_task_uow)
     assert result is None
 
     with pytest.raises(TaskNotFound) as exc:
-        await delete_task(task_id=task.id, uow=fake_task_uow)
+        await delete_task(task_id=task.id, owner_id=1, uow=fake_task_uow)
     assert exc.type is TaskNotFound
 
 
-async def _create_task(task_uow: ITaskUnitOfWork, fake_user_uow: IUserUnitOfWork) -> Task:
+@pytest.mark.asyncio
+async def test_list_tasks(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test paging through the owner's tasks.
+
+    Verifies that pages follow each other without gaps or duplicates
+    and that the last page has no next cursor.
+    """
+    created = [await _create_task(fake_task_uow) for _ in range(5)]
+
+    first_page = await list_tasks(owner_id=1, uow=fake_task_uow, limit=3)
+    assert [task.id for task in first_page.items] == [task.id for task in reversed(created)][:3]
+    assert first_page.next_cursor is not None
+
+    second_page = await list_tasks(owner_id=1, uow=fake_task_uow, cursor=first_page.next_cursor, limit=3)
+    assert [task.id for task in second_page.items] == [task.id for task in reversed(created)][3:]
+    assert second_page.next_cursor is None
+
+    other_owner_page = await list_tasks(owner_id=2, uow=fake_task_uow)
+    assert other_owner_page.items == []
+
+    body = json.loads(EntityResponse(first_page, TaskPageDTO).body)
+    assert body == TaskPageDTO.model_validate(first_page, from_attributes=True).model_dump(mode="json")
+
+
+@pytest.mark.asyncio
+async def test_task_changes(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test delta sync of the owner's tasks.
+
+    Verifies that a full sync pages through the live tasks only, that an
+    idle sync returns nothing, and that later updates and deletions are reported.
+    """
+    gone = await _create_task(fake_task_uow)
+    await delete_task(task_id=gone.id, owner_id=1, uow=fake_task_uow)
+    created = [await _create_task(fake_task_uow) for _ in range(3)]
+
+    first = await list_task_changes(owner_id=1, uow=fake_task_uow, limit=2)
+    assert [task.id for task in first.tasks] == [task.id for task in created[:2]]
+    assert first.deleted_ids == []
+    assert first.has_more
+    second = await list_task_changes(owner_id=1, uow=fake_task_uow, since=first.next_cursor, limit=2)
+    assert [task.id for task in second.tasks] == [created[2].id]
+    assert not second.has_more
+
+    idle = await list_task_changes(owner_id=1, uow=fake_task_uow, since=second.next_cursor)
+    assert idle.tasks == [] and idle.deleted_ids == []
+
+    await update_task(task_pk=created[0].id, task_data=TaskUpdateDTO(status="completed"), owner_id=1, uow=fake_task_uow)
+    await delete_task(task_id=created[1].id, owner_id=1, uow=fake_task_uow)
+    changes = await list_task_changes(owner_id=1, uow=fake_task_uow, since=idle.next_cursor)
+    assert [task.id for task in changes.tasks] == [created[0].id]
+    assert changes.deleted_ids == [created[1].id]
+
+    assert (await list_task_changes(owner_id=2, uow=fake_task_uow)).tasks == []
+
+
+@pytest.mark.asyncio
+async def test_prune_task_tombstones(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test pruning expired tombstones in batches.
+
+    Verifies that a cursor from before pruned deletions is refused and that
+    a client resyncing from scratch gets the live tasks.
+    """
+    created = [await _create_task(fake_task_uow) for _ in range(3)]
+    stale = await list_task_changes(owner_id=1, uow=fake_task_uow)
+    await delete_tasks(owner_id=1, task_ids=[task.id for task in created[:2]], uow=fake_task_uow)
+
+    assert await prune_task_tombstones(lambda: fake_task_uow, retention=datetime.timedelta(days=1)) == 0
+    pruned = await prune_task_tombstones(lambda: fake_task_uow, retention=datetime.timedelta(0), batch_size=1)
+    assert pruned == 2
+
+    with pytest.raises(TaskSyncExpired):
+        await list_task_changes(owner_id=1, uow=fake_task_uow, since=stale.next_cursor)
+    resync = await list_task_changes(owner_id=1, uow=fake_task_uow)
+    assert [task.id for task in resync.tasks] == [created[2].id]
+
+
+@pytest.mark.asyncio
+async def test_search_tasks(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test searching the owner's tasks.
+
+    Verifies that only matching tasks of the owner are returned,
+    and that a blank query matches nothing.
+    """
+    await _create_task(fake_task_uow)
+    match = await create_task(owner_id=1, task_data=TaskCreateDTO(title="Buy milk"), uow=fake_task_uow)
+    await create_task(owner_id=2, task_data=TaskCreateDTO(title="Buy milk"), uow=fake_task_uow)
+
+    page = await search_tasks(owner_id=1, query="milk", uow=fake_task_uow)
+    assert [task.id for task in page.items] == [match.id]
+    assert page.next_cursor is None
+
+    blank_page = await search_tasks(owner_id=1, query="  ", uow=fake_task_uow)
+    assert blank_page.items == []
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_tasks(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test suggesting task titles for a prefix.
+
+    Verifies that suggestions are scoped to the owner and that a repeated
+    prefix is served from the cache without touching the repository.
+    """
+    await _create_task(fake_task_uow)
+    match = await create_task(owner_id=1, task_data=TaskCreateDTO(title="Buy milk"), uow=fake_task_uow)
+    await create_task(owner_id=2, task_data=TaskCreateDTO(title="Buy bread"), uow=fake_task_uow)
+    cache = RedisTaskSuggestionCache(FakeRedis(), ttl=10)
+
+    suggestions = await autocomplete_tasks(owner_id=1, prefix="BU", uow=fake_task_uow, cache=cache)
+    assert [suggestion.id for suggestion in suggestions] == [match.id]
+
+    fake_task_uow.tasks.autocomplete = AsyncMock()
+    assert await autocomplete_tasks(owner_id=1, prefix="bu ", uow=fake_task_uow, cache=cache) == suggestions
+    fake_task_uow.tasks.autocomplete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_autocomplete_timeout_savepoint():
+    """
+    Test that an autocomplete lookup over budget rolls back only its savepoint.
+    """
+    savepoint = MagicMock(rollback=AsyncMock())
+    session = NonCallableMagicMock(begin_nested=AsyncMock(return_value=savepoint), rollback=AsyncMock())
+    canceled = DBAPIError("SELECT", {}, MagicMock(sqlstate=QUERY_CANCELED))
+    session.execute = AsyncMock(side_effect=[None, canceled])
+
+    assert await PGTaskRepo(session).autocomplete(owner_id=1, prefix="bu", limit=5, timeout_ms=50) == []
+    savepoint.rollback.assert_awaited_once()
+    session.rollback.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_export_tasks(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test exporting the owner's tasks as NDJSON and CSV.
+    """
+    first, second = await _create_task(fake_task_uow), await _create_task(fake_task_uow)
+    await create_task(owner_id=2, task_data=task_create_dto, uow=fake_task_uow)
+
+    ndjson = b"".join([chunk async for chunk in export_tasks(owner_id=1, uow=fake_task_uow, batch_size=1)])
+    assert [json.loads(line)["id"] for line in ndjson.splitlines()] == [first.id, second.id]
+
+    csv_lines = b"".join([chunk async for chunk in export_tasks(owner_id=1, uow=fake_task_uow, format="csv")]).splitlines()
+    assert csv_lines[0].startswith(b"id,title,")
+    assert len(csv_lines) == 3
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/statm"), reason="RSS is read from procfs")
+@pytest.mark.asyncio
+async def test_export_tasks_constant_memory(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test that exporting 1M tasks with gzip keeps memory bounded by one batch.
+    """
+    total, batch_size = 1_000_000, 1000
+    now = datetime.datetime(2024, 1, 1)
+
+    async def stream_for_owner(owner_id: int, batch_size: int):
+        for start in range(0, total, batch_size):
+            yield [
+                Task(id=task_id, title=f"Task {task_id}", owner_id=owner_id, created_at=now, updated_at=now)
+                for task_id in range(start + 1, start + batch_size + 1)
+            ]
+
+    fake_task_uow.tasks.stream_for_owner = stream_for_owner
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    lines = 0
+    baseline_rss = peak_rss = _rss()
+
+    async for chunk in gzip_chunks(export_tasks(owner_id=1, uow=fake_task_uow, batch_size=batch_size), level=1):
+        lines += decompressor.decompress(chunk).count(b"\n")
+        peak_rss = max(peak_rss, _rss())
+
+    assert lines == total
+    assert peak_rss - baseline_rss < 32 * 1024 * 1024
+
+
+@pytest.mark.asyncio
+async def test_import_tasks(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test importing tasks from NDJSON and CSV files split into arbitrary chunks.
+
+    Verifies that valid rows are created in order and that malformed
+    or invalid rows are reported by line.
+    """
+    ndjson = '{"title": "First"}\n\nnot json\n{"description": "No title"}\n{"title": "Ünïcode", "description": "d"}'
+    report = await import_tasks(owner_id=1, chunks=_chunks(ndjson.encode()), uow=fake_task_uow, batch_size=1)
+    assert report.imported == 2
+    assert [error.line for error in report.errors] == [3, 4]
+    assert [task.title for task in await fake_task_uow.tasks.list_tasks()] == ["First", "Ünïcode"]
+    assert fake_task_uow.committed
+
+    csv_data = 'title,description\r\nSecond,""\r\n"Multi\nline, ""quoted""",desc\r\ntoo,many,columns\r\n'
+    report = await import_tasks(owner_id=1, chunks=_chunks(csv_data.encode()), uow=fake_task_uow, format="csv")
+    assert report.imported == 2
+    assert [(error.line, report.failed) for error in report.errors] == [(5, 1)]
+    tasks = await fake_task_uow.tasks.list_tasks()
+    assert tasks[2].description is None
+    assert tasks[3].title == 'Multi\nline, "quoted"'
+
+
+@pytest.mark.asyncio
+async def test_import_tasks_overlong_rows(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test that rows longer than the limit are reported instead of buffered.
+
+    Verifies that an overlong NDJSON line is skipped up to its newline and
+    that a CSV row left open by a stray quote ends the import.
+    """
+    ndjson = '{"title": "First"}\n{"title": "' + "x" * 100 + '"}\n{"title": "Last"}'
+    report = await import_tasks(owner_id=1, chunks=_chunks(ndjson.encode()), uow=fake_task_uow, max_record_length=50)
+    assert (report.imported, [error.line for error in report.errors]) == (2, [2])
+
+    stream_lines = 0
+
+    async def unterminated_csv():
+        nonlocal stream_lines
+        yield b'title,description\nSecond,desc\n"Unterminated,desc\n'
+        while stream_lines < 1000:
+            stream_lines += 1
+            yield b"More,desc\n"
+
+    report = await import_tasks(owner_id=1, chunks=unterminated_csv(), uow=fake_task_uow, format="csv", max_record_length=50)
+    assert (report.imported, [error.line for error in report.errors]) == (1, [3])
+    assert stream_lines < 10
+    assert [task.title for task in await fake_task_uow.tasks.list_tasks()] == ["First", "Last", "Second"]
+
+
+@pytest.mark.asyncio
+async def test_task_events(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test publishing task changes to the owner's subscribers.
+
+    Verifies that events reach only the owner's subscribers, that a
+    subscriber falling behind is disconnected, and that resuming replays
+    missed events or asks for a resync when they are no longer retained.
+    """
+    redis = FakeRedis()
+    publisher = RedisTaskEventPublisher(redis, stream_maxlen=100)
+    broker = RedisTaskEventBroker(redis, queue_size=2)
+
+    async with broker.subscribe(owner_id=1) as subscription:
+        task = await create_task(owner_id=1, task_data=task_create_dto, uow=fake_task_uow, events=publisher)
+        await create_task(owner_id=2, task_data=task_create_dto, uow=fake_task_uow, events=publisher)
+        created = await asyncio.wait_for(subscription.get(), 1)
+        assert (created.type, created.task) == ("created", task)
+
+        await update_task(task_pk=task.id, task_data=TaskUpdateDTO(title="Updated"), owner_id=1, uow=fake_task_uow, events=publisher)
+        await delete_tasks(owner_id=1, task_ids=[task.id], uow=fake_task_uow, events=publisher)
+        await create_task(owner_id=1, task_data=task_create_dto, uow=fake_task_uow, events=publisher)
+        while not subscription.closed:
+            await asyncio.sleep(0)
+        assert await subscription.get() is None
+
+    resumed = watch_tasks(owner_id=1, broker=broker, last_event_id=created.id, heartbeat_seconds=0.01)
+    assert [(await anext(resumed)).type for _ in range(3)] == ["updated", "deleted", "created"]
+    assert await anext(resumed) is None
+    await resumed.aclose()
+
+    async with broker.subscribe(owner_id=1, last_event_id="0-1") as subscription:
+        assert (await subscription.get()).type == "reset"
+    assert broker.subscribers == 0
+    await broker.close()
+
+
+@pytest.mark.asyncio
+async def test_batch_tasks(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test creating, updating and deleting tasks in batches.
+
+    Verifies that results follow input order, that missing or repeated
+    task IDs are reported per item, and that items setting no field
+    return the task without recording or announcing a change.
+    """
+    created = await create_tasks(owner_id=1, tasks_data=[task_create_dto] * 3, uow=fake_task_uow)
+    assert [result.index for result in created] == [0, 1, 2]
+    assert all(result.task.title == task_create_dto.title for result in created)
+    assert fake_task_uow.committed
+
+    first_id, second_id, _ = (result.id for result in created)
+    since = (await list_task_changes(owner_id=1, uow=fake_task_uow)).next_cursor
+    events = AsyncMock()
+    updated = await update_tasks(
+        owner_id=1,
+        tasks_data=[
+            TaskBatchUpdateItemDTO(id=first_id, title="Updated"),
+            TaskBatchUpdateItemDTO(id=-1, title="Missing"),
+            TaskBatchUpdateItemDTO(id=first_id, status="completed"),
+            TaskBatchUpdateItemDTO(id=second_id),
+        ],
+        uow=fake_task_uow,
+        events=events,
+    )
+    assert updated[0].error is None and updated[0].task.title == "Updated"
+    assert updated[1].error is not None and updated[1].task is None
+    assert updated[2].error is not None
+    assert updated[3].error is None and updated[3].task.title == task_create_dto.title
+    assert [event.task_id for event in events.publish.call_args.args[0]] == [first_id]
+    changes = await list_task_changes(owner_id=1, uow=fake_task_uow, since=since)
+    assert [task.id for task in changes.tasks] == [first_id]
+
+    deleted = await delete_tasks(owner_id=1, task_ids=[first_id, -1, second_id, first_id], uow=fake_task_uow)
+    assert [result.error is None for result in deleted] == [True, False, True, False]
+    assert "repeated" in deleted[3].error
+    with pytest.raises(TaskNotFound):
+        await read_task(task_pk=first_id, owner_id=1, uow=fake_task_uow)
+
+
+@pytest.mark.asyncio
+async def test_batch_delete_matching_nothing(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test that a batch delete matching no task reports every item and records no deletion.
+    """
+    task = await _create_task(fake_task_uow)
+    since = (await list_task_changes(owner_id=1, uow=fake_task_uow)).next_cursor
+
+    assert await fake_task_uow.tasks.delete_many([-1, -2], owner_id=1) == []
+    deleted = await delete_tasks(owner_id=2, task_ids=[task.id, -1], uow=fake_task_uow)
+    assert [result.error for result in deleted] == [f"Task with id {task.id} not found", "Task with id -1 not found"]
+
+    changes = await list_task_changes(owner_id=1, uow=fake_task_uow, since=since)
+    assert changes.deleted_ids == []
+    assert (await read_task(task_pk=task.id, owner_id=1, uow=fake_task_uow)) == task
+
+
+@pytest.mark.asyncio
+async def test_apply_task_operations(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test coalescing a stream of operations into batches.
+
+    Verifies that consecutive operations of one type share a transaction,
+    that repeated task IDs start a new one so operations apply in order,
+    and that results follow input order.
+    """
+    task = await _create_task(fake_task_uow)
+    fake_task_uow.tasks.update_many = AsyncMock(wraps=fake_task_uow.tasks.update_many)
+    operations = [
+        TaskCreateOperationDTO(op="create", ref="a", data=task_create_dto),
+        TaskCreateOperationDTO(op="create", ref="b", data=task_create_dto),
+        TaskUpdateOperationDTO(op="update", ref="c", data=TaskBatchUpdateItemDTO(id=task.id, status="completed")),
+        TaskUpdateOperationDTO(op="update", ref="d", data=TaskBatchUpdateItemDTO(id=task.id, title="Updated")),
+        TaskDeleteOperationDTO(op="delete", ref="e", id=task.id),
+        TaskDeleteOperationDTO(op="delete", ref="f", id=task.id),
+    ]
+
+    results = await apply_task_operations(owner_id=1, operations=operations, uow_factory=lambda: fake_task_uow)
+    assert [result.ref for result in results] == ["a", "b", "c", "d", "e", "f"]
+    assert [result.error is None for result in results] == [True] * 5 + [False]
+    assert fake_task_uow.tasks.update_many.await_count == 2
+    assert (results[3].task.title, results[3].task.status) == ("Updated", "completed")
+
+
+def test_task_entity_fields():
+    """
+    Test that task entities are slotted and expose their fields without `__dict__`.
+    """
+    first = Task(id=1, title="First", owner_id=1)
+    second = Task(id=2, title="Second", owner_id=1)
+
+    assert not hasattr(first, "__dict__")
+    assert first.created_at <= second.created_at and first.created_at is not second.created_at
+    assert Task.field_names() == ("id", "title", "owner_id", "description", "status", "created_at", "updated_at")
+    assert dict(first.items()) == first.dict
+
+    first.dict["title"] = "Changed"
+    assert first.title == "First"
+
+
+@pytest.mark.asyncio
+async def test_task_cache(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test storing, negative caching and invalidation of tasks in the cache.
+    """
+    task_cache = RedisTaskCache(FakeRedis(), ttl=60, negative_ttl=5)
+    task = await _create_task(fake_task_uow)
+
+    assert await task_cache.get(task.id) is None
+    await task_cache.set(task, await task_cache.version(task.id))
+    assert await task_cache.get(task.id) == task
+
+    await task_cache.set_missing(-1, await task_cache.version(-1))
+    with pytest.raises(TaskNotFound):
+        await task_cache.get(-1)
+
+    await task_cache.invalidate([task.id, -1])
+    assert await task_cache.get(task.id) is None
+    assert await task_cache.get(-1) is None
+
+
+@pytest.mark.asyncio
+async def test_task_cache_stale_fill(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test that a fill racing with a write cannot cache the row the write replaced.
+    """
+    task_cache = RedisTaskCache(FakeRedis(), ttl=60, negative_ttl=5)
+    task = await _create_task(fake_task_uow)
+
+    # A reader misses and loads the task, then a write commits and invalidates it.
+    version = await task_cache.version(task.id)
+    await task_cache.invalidate([task.id])
+    await task_cache.set(task, version)
+    assert await task_cache.get(task.id) is None
+
+    await task_cache.set(task, await task_cache.version(task.id))
+    assert await task_cache.get(task.id) == task
+
+
+@pytest.mark.asyncio
+async def test_task_uow_lazy_session(fake_task_uow: ITaskUnitOfWork):
+    """
+    Test that reads served from the cache never create a database session.
+    """
+    task_cache = RedisTaskCache(FakeRedis(), ttl=60, negative_ttl=5)
+    task = await _create_task(fake_task_uow)
+    await task_cache.set(task, await task_cache.version(task.id))
+
+    session_factory = MagicMock()
+    uow = PGTaskUnitOfWork(session_factory=session_factory, cache=task_cache, read_only=True)
+    assert await read_task(task_pk=task.id, owner_id=1, uow=uow) == task
+    session_factory.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_task_uow_shared_session():
+    """
+    Test that units of work never close a shared session, and that read-only
+    ones end the transaction they began but not one begun around them.
+    """
+    session = MagicMock(close=AsyncMock(), rollback=AsyncMock(), commit=AsyncMock())
+
+    # The read-only unit of work begins the transaction and ends it, releasing the connection.
+    session.in_transaction.side_effect = [False, True]
+    async with PGTaskUnitOfWork(read_only=True, session=session) as uow:
+        assert uow.tasks.session is session
+    session.rollback.assert_awaited_once()
+
+    # A transaction begun before it, e.g. by an enclosing unit of work, is left alone.
+    session.rollback.reset_mock()
+    session.in_transaction.side_effect = None
+    session.in_transaction.return_value = True
+    async with PGTaskUnitOfWork(read_only=True, session=session) as uow:
+        assert uow.tasks.session is session
+    session.rollback.assert_not_called()
+
+    async with PGTaskUnitOfWork(session=session) as uow:
+        assert uow.tasks.session is session
+    session.rollback.assert_awaited_once()
+    session.close.assert_not_called()
+
+
+async def _chunks(data: bytes, size: int = 7):
+    """
+    Yield the data in small chunks, as a streamed request body arrives.
+    """
+    for start in range(0, len(data), size):
+        yield data[start:start + size]
+
+
+def _rss() -> int:
+    """
+    Return the resident set size of the current process in bytes.
+    """
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+async def _create_task(task_uow: ITaskUnitOfWork) -> Task:
     """
     Helper function to create a task using a mocked unit of work.
 
     :param task_uow: Fake unit of work.
     :return: Created Task entity.
     """
-    task = await create_task(owner_id=1, task_data=task_create_dto, uow=task_uow, user_uow=fake_user_uow)
+    task = await create_task(owner_id=1, task_data=task_create_dto, uow=task_uow)
     assert task.title == task_create_dto.title
     assert task.description == task_create_dto.description
     return task
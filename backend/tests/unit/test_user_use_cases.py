@@ -1,16 +1,26 @@
-from unittest.mock import MagicMock
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from redis.exceptions import ConnectionError as RedisConnectionError
 
 from src.users.use_cases.user_registration import register_user
 from src.users.use_cases.user_profile import get_user_profile
 from src.users.use_cases.user_update import update_user
 from src.users.use_cases.user_delete import delete_user
-from src.users.domain.dtos import UserCreateDTO, UserUpdateDTO
+from src.users.domain.dtos import UserCreateDTO, UserReadDTO, UserUpdateDTO
 from src.users.domain.entities import User
-from src.users.domain.exceptions import UserNotFound
+from src.users.domain.exceptions import PasswordHasherBusy, UserNotFound
 from src.users.domain.interfaces.user_uow import IUserUnitOfWork
-from src.users.domain.interfaces.password_hasher import IPasswordHasher
+from src.users.domain.interfaces.password_hasher import IAsyncPasswordHasher
+from src.users.infrastructure.services.password_hasher import PooledPasswordHasher
+from src.users.infrastructure.services.user_cache import UserPrincipalCache
+from src.core.presentation.responses import EntityResponse
+from tests.fakes.unit.redis import FakeRedis
 
 
 user_create_dto = UserCreateDTO(
@@ -23,8 +33,8 @@ user_create_dto = UserCreateDTO(
 )
 
 
-mock_hasher = MagicMock()
-mock_hasher.hash = MagicMock()
+mock_hasher = AsyncMock()
+mock_hasher.hash = AsyncMock()
 mock_hasher.hash.return_value = 'hashed_secure_pwd'
 
 
@@ -54,9 +64,13 @@ async def test_get_user_profile(fake_user_uow: IUserUnitOfWork):
     print(exc.value.detail)
     assert exc.type is UserNotFound
 
+    body = json.loads(EntityResponse(result, UserReadDTO).body)
+    assert body == UserReadDTO.model_validate(result.dict).model_dump(mode="json")
+    assert "hashed_password" not in body
+
 
 @pytest.mark.asyncio
-async def test_update_user(fake_user_uow: IUserUnitOfWork, fake_password_hasher: IPasswordHasher):
+async def test_update_user(fake_user_uow: IUserUnitOfWork, fake_password_hasher: IAsyncPasswordHasher):
     """
     Test updating a user's email.
 
@@ -92,6 +106,128 @@ async def test_delete_user(fake_user_uow: IUserUnitOfWork):
     assert exc.type is UserNotFound
 
 
+@pytest.mark.asyncio
+async def test_user_cache_invalidation(fake_user_uow: IUserUnitOfWork, fake_password_hasher: IAsyncPasswordHasher):
+    """
+    Test that updating or deleting a user drops it from the principal cache.
+    """
+    user_cache = UserPrincipalCache(maxsize=10, ttl=60)
+    user = await _register_user(fake_user_uow)
+
+    await user_cache.set(user, await user_cache.version(user.id))
+    assert await user_cache.get(user.id) is user
+
+    update_data = UserUpdateDTO(name="new name")
+    await update_user(user_pk=user.id, user_data=update_data, pwd_hasher=fake_password_hasher, uow=fake_user_uow, user_cache=user_cache)
+    assert await user_cache.get(user.id) is None
+
+    await user_cache.set(user, await user_cache.version(user.id))
+    await delete_user(user_pk=user.id, uow=fake_user_uow, user_cache=user_cache)
+    assert await user_cache.get(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_user_cache_redis_level(fake_user_uow: IUserUnitOfWork):
+    """
+    Test that users shared through Redis are stored without their password hash.
+    """
+    redis = FakeRedis()
+    user = await _register_user(fake_user_uow)
+    await UserPrincipalCache(maxsize=10, ttl=60, redis_client=redis).set(user, 0)
+
+    assert user.hashed_password not in next(iter(redis.data.values()))
+    cached = await UserPrincipalCache(maxsize=10, ttl=60, redis_client=redis).get(user.id)
+    assert (cached.id, cached.email, cached.hashed_password) == (user.id, user.email, "")
+
+
+@pytest.mark.asyncio
+async def test_user_cache_stale_fill(fake_user_uow: IUserUnitOfWork):
+    """
+    Test that a user loaded before an invalidation is not shared through Redis after it.
+    """
+    redis = FakeRedis()
+    user_cache = UserPrincipalCache(maxsize=10, ttl=60, redis_client=redis)
+    other_worker = UserPrincipalCache(maxsize=10, ttl=60, redis_client=redis)
+    user = await _register_user(fake_user_uow)
+
+    version = await user_cache.version(user.id)
+    await other_worker.invalidate(user.id)
+    await user_cache.set(user, version)
+    assert await user_cache.get(user.id) is None
+    assert await other_worker.get(user.id) is None
+
+    await user_cache.set(user, await user_cache.version(user.id))
+    assert (await other_worker.get(user.id)).id == user.id
+
+
+@pytest.mark.asyncio
+async def test_user_cache_redis_failure(fake_user_uow: IUserUnitOfWork, fake_password_hasher: IAsyncPasswordHasher):
+    """
+    Test that a failing Redis level is treated as a miss and does not fail writes.
+    """
+    redis = AsyncMock()
+    redis.get.side_effect = RedisConnectionError("Connection refused")
+    redis.register_script = MagicMock(return_value=AsyncMock(side_effect=RedisConnectionError("Connection refused")))
+    user_cache = UserPrincipalCache(maxsize=10, ttl=60, redis_client=redis)
+    user = await _register_user(fake_user_uow)
+
+    assert await user_cache.get(user.id) is None
+    await user_cache.set(user, await user_cache.version(user.id))
+    assert await user_cache.get(user.id) is user
+
+    update_data = UserUpdateDTO(name="new name")
+    await update_user(user_pk=user.id, user_data=update_data, pwd_hasher=fake_password_hasher, uow=fake_user_uow, user_cache=user_cache)
+    assert await user_cache.get(user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_user_cache_expiration():
+    """
+    Test that cached users expire and that the cache stays bounded.
+    """
+    user_cache = UserPrincipalCache(maxsize=2, ttl=60)
+    users = [
+        User(id=pk, name="user", email=f"user{pk}@example.com", hashed_password="pwd", is_active=True, is_superuser=False, is_verified=False)
+        for pk in range(1, 4)
+    ]
+    for user in users:
+        await user_cache.set(user, 0)
+    assert await user_cache.get(1) is None
+    assert await user_cache.get(3) is users[2]
+
+    expired_cache = UserPrincipalCache(maxsize=2, ttl=0.0001)
+    await expired_cache.set(users[0], 0)
+    time.sleep(0.001)
+    assert await expired_cache.get(users[0].id) is None
+
+
+@pytest.mark.asyncio
+async def test_pooled_password_hasher_back_pressure():
+    """
+    Test that the pooled hasher runs off the event loop and rejects
+    calls beyond its concurrency and queue limits.
+    """
+    release = threading.Event()
+    sync_hasher = MagicMock()
+    sync_hasher.hash.side_effect = lambda password: release.wait(5) and f"hashed_{password}"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        hasher = PooledPasswordHasher(sync_hasher, executor, max_concurrency=1, max_queue=1)
+        running = asyncio.ensure_future(hasher.hash("first"))
+        queued = asyncio.ensure_future(hasher.hash("second"))
+        await asyncio.sleep(0.01)
+        assert hasher.pending == 2
+
+        with pytest.raises(PasswordHasherBusy) as exc:
+            await hasher.hash("third")
+        assert exc.value.status_code == 503
+
+        release.set()
+        assert await running == "hashed_first"
+        assert await queued == "hashed_second"
+        assert hasher.pending == 0
+
+
 async def _register_user(user_uow: IUserUnitOfWork) -> User:
     """
     Helper function to register a user using a mocked password hasher.